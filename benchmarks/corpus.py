@@ -0,0 +1,190 @@
+"""Deterministic synthetic resume PDFs for benchmarking.
+
+Resumes are assembled from the skill, major and position vocabularies in
+data/ with a seeded random generator, so the same (count, seed) always
+yields the same corpus. They vary in length (one to a few pages) and
+layout (single column, or a skills/education sidebar next to the
+experience column).
+
+Usage:
+    python -m benchmarks.corpus --count 50 --seed 7 --out /tmp/resumes
+"""
+import argparse
+import csv
+import os
+import random
+import textwrap
+
+import fitz  # PyMuPDF
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SKILLS_CSV = os.path.join(REPO_DIR, 'data', 'newSkills.csv')
+MAJORS_CSV = os.path.join(REPO_DIR, 'data', 'majors.csv')
+POSITIONS_CSV = os.path.join(REPO_DIR, 'data', 'position.csv')
+
+LAYOUTS = ('single_column', 'two_column')
+# Jobs per resume; together with bullets per job this spans one to three pages
+JOBS_RANGE = (1, 10)
+BULLETS_RANGE = (2, 6)
+SKILLS_RANGE = (6, 30)
+
+PAGE_WIDTH, PAGE_HEIGHT = fitz.paper_size('letter')
+MARGIN = 50
+SIDEBAR_WIDTH = 170
+GUTTER = 20
+BODY_SIZE = 10
+HEADING_SIZE = 13
+NAME_SIZE = 22
+
+FIRST_NAMES = ('Aarav', 'Olivia', 'Liam', 'Priya', 'Mateo', 'Chen', 'Amara', 'Noah', 'Fatima', 'Lucas',
+               'Sofia', 'Ethan', 'Yuki', 'Daniel', 'Zara', 'Omar', 'Grace', 'Ivan', 'Leila', 'Samuel')
+LAST_NAMES = ('Sharma', 'Johnson', 'Garcia', 'Nguyen', 'Okafor', 'Williams', 'Kim', 'Rossi', 'Haddad',
+              'Novak', 'Patel', 'Brown', 'Silva', 'Tanaka', 'Mensah', 'Fischer', 'Lopez', 'Ahmed', 'Clarke')
+COMPANIES = ('Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Analytics',
+             'Hooli', 'Vandelay Imports', 'Cyberdyne Systems', 'Soylent Foods', 'Tyrell Robotics')
+UNIVERSITIES = ('Stanford University', 'University of Michigan', 'Indian Institute of Technology Delhi',
+                'Georgia Institute of Technology', 'University of Toronto', 'Boston College',
+                'National University of Singapore', 'University of Texas at Austin')
+CITIES = ('Austin, TX', 'Bengaluru, India', 'Toronto, Canada', 'Berlin, Germany', 'Seattle, WA',
+          'London, UK', 'Singapore, Singapore', 'Chicago, IL')
+DEGREES = ('B.S.', 'B.Tech', 'M.S.', 'MBA', 'B.A.')
+
+
+def _first_column(path):
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader, None)
+        return sorted({row[0].strip() for row in reader if row and row[0].strip()})
+
+
+def load_vocabularies():
+    """(skills, majors, {position: [keyword, ...]}) from the CSVs under data/"""
+    positions = {}
+    with open(POSITIONS_CSV, newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            positions[row['position'].strip()] = [keyword.strip() for keyword in row['keywords'].split(',')]
+    return _first_column(SKILLS_CSV), _first_column(MAJORS_CSV), positions
+
+
+def generate_resume(rng, vocabularies):
+    """One resume as a dict: name, layout, header lines and (heading, lines) sections"""
+    skills, majors, positions = vocabularies
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    position = rng.choice(sorted(positions))
+    resume_skills = rng.sample(skills, rng.randint(*SKILLS_RANGE))
+
+    experience = []
+    year = 2024
+    for _ in range(rng.randint(*JOBS_RANGE)):
+        title = rng.choice(sorted(positions))
+        start = year - rng.randint(1, 4)
+        experience.append(f"{title}, {rng.choice(COMPANIES)} {start}-{year}")
+        for _ in range(rng.randint(*BULLETS_RANGE)):
+            keyword = rng.choice(positions[title])
+            experience.append(f"- Worked to {keyword} {rng.choice(resume_skills)} solutions with "
+                              f"{rng.choice(resume_skills)}, serving {rng.randint(2, 90)} teams across "
+                              f"{rng.randint(2, 12)} regions.")
+        year = start
+
+    education = [f"{rng.choice(DEGREES)} in {rng.choice(majors).title()}",
+                 f"{rng.choice(UNIVERSITIES)}, {year - rng.randint(0, 3)}"]
+    return {
+        'name': f"{first} {last}",
+        'layout': rng.choice(LAYOUTS),
+        'header': [f"{first.lower()}.{last.lower()}{rng.randint(1, 99)}@example.com | "
+                   f"+1 {rng.randint(200, 989)} {rng.randint(200, 999)} {rng.randint(1000, 9999)} | "
+                   f"{rng.choice(CITIES)}",
+                   f"linkedin.com/in/{first.lower()}{last.lower()}"],
+        'sections': [
+            ('SUMMARY', [f"{position} with {rng.randint(1, 20)} years of experience in "
+                         f"{', '.join(resume_skills[:3])}."]),
+            ('SKILLS', [', '.join(resume_skills)]),
+            ('EXPERIENCE', experience),
+            ('EDUCATION', education),
+        ],
+    }
+
+
+class _ColumnWriter:
+    """Writes wrapped lines down one column, continuing on the next page when it is full"""
+
+    def __init__(self, doc, x0, x1, y, page_index=0):
+        self.doc = doc
+        self.x0, self.x1 = x0, x1
+        self.y = y
+        self.page_index = page_index
+
+    def write(self, text, size=BODY_SIZE, bold=False, gap=0):
+        fontname = 'hebo' if bold else 'helv'
+        # Helvetica averages about half an em per character
+        width = max(10, int((self.x1 - self.x0) / (size * 0.5)))
+        self.y += gap
+        for line in textwrap.wrap(text, width) or ['']:
+            if self.y + size > PAGE_HEIGHT - MARGIN:
+                self.page_index += 1
+                self.y = MARGIN + size
+            while self.doc.page_count <= self.page_index:
+                self.doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            self.doc[self.page_index].insert_text((self.x0, self.y), line, fontsize=size, fontname=fontname)
+            self.y += size * 1.4
+
+
+def render_pdf(resume):
+    """PDF bytes for a resume produced by generate_resume()"""
+    doc = fitz.open()
+    doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    header = _ColumnWriter(doc, MARGIN, PAGE_WIDTH - MARGIN, MARGIN + NAME_SIZE)
+    header.write(resume['name'], size=NAME_SIZE, bold=True)
+    for line in resume['header']:
+        header.write(line)
+
+    if resume['layout'] == 'two_column':
+        sidebar = _ColumnWriter(doc, MARGIN, MARGIN + SIDEBAR_WIDTH, header.y + BODY_SIZE)
+        main = _ColumnWriter(doc, MARGIN + SIDEBAR_WIDTH + GUTTER, PAGE_WIDTH - MARGIN, header.y + BODY_SIZE)
+        columns = {'SKILLS': sidebar, 'EDUCATION': sidebar}
+    else:
+        main = header
+        columns = {}
+    for heading, lines in resume['sections']:
+        writer = columns.get(heading, main)
+        writer.write(heading, size=HEADING_SIZE, bold=True, gap=BODY_SIZE)
+        for line in lines:
+            writer.write(line)
+    try:
+        # No creation date or random file id, so the bytes depend on the resume only
+        doc.set_metadata({})
+        return doc.tobytes(garbage=3, deflate=True, no_new_id=True)
+    finally:
+        doc.close()
+
+
+def generate_corpus(count, seed=0):
+    """[{'name', 'layout', 'pages', 'pdf'}, ...]; the same (count, seed) always gives the same PDFs"""
+    rng = random.Random(seed)
+    vocabularies = load_vocabularies()
+    corpus = []
+    for idx in range(count):
+        resume = generate_resume(rng, vocabularies)
+        pdf = render_pdf(resume)
+        with fitz.open(stream=pdf, filetype='pdf') as doc:
+            pages = doc.page_count
+        corpus.append({'name': f"resume_{idx:04d}.pdf", 'layout': resume['layout'], 'pages': pages, 'pdf': pdf})
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic resume corpus to a directory")
+    parser.add_argument('--count', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', required=True, help="output directory")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    for resume in generate_corpus(args.count, args.seed):
+        with open(os.path.join(args.out, resume['name']), 'wb') as pdf:
+            pdf.write(resume['pdf'])
+    print(f"Wrote {args.count} resumes to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
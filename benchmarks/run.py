@@ -0,0 +1,262 @@
+"""Parser benchmark suite.
+
+Generates a deterministic synthetic corpus (benchmarks.corpus), times each
+extractor separately over it and reports throughput, p50/p95/p99 latency
+and the peak memory one call allocates. Results can be written to a JSON baseline, and a later run
+can be compared against it: any metric worse than the baseline by more
+than the budget is flagged and the exit status is 1.
+
+Usage (from the repository root):
+    python -m benchmarks.run -o benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --budget 0.15
+    python -m benchmarks.run --only csv_skills,extract_name --count 100
+"""
+import argparse
+import io
+import json
+import platform
+import random
+import re
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+import numpy as np
+
+from benchmarks.corpus import generate_corpus, load_vocabularies
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_COUNT = 40
+DEFAULT_BUDGET = 0.15
+# Skills a recruiter asks for in the matcher benchmark
+RECRUITER_QUERY_SIZE = 10
+# (metric, True if a larger value is worse)
+COMPARED_METRICS = (('p50_ms', True), ('p95_ms', True), ('throughput_per_s', False), ('peak_alloc_mb', True))
+
+_PHRASE_SEPARATORS = re.compile(r'[,\n]')
+
+
+def peak_rss_mb():
+    """High-water mark of this process's resident memory, or None where it is not available"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def prepare_samples(corpus):
+    """Untimed per-resume inputs: PDF bytes, layout, text and candidate skill phrases"""
+    import pdf_layout
+
+    samples = []
+    for resume in corpus:
+        layout = pdf_layout.extract_layout(resume['pdf'])
+        phrases = [phrase.strip() for phrase in _PHRASE_SEPARATORS.split(layout.text) if phrase.strip()]
+        samples.append({'pdf': resume['pdf'], 'layout': layout, 'text': layout.text, 'phrases': phrases})
+    return samples
+
+
+def build_benchmarks(profiles, seed):
+    """name -> (callable(sample), variant note); every callable starts from an unparsed resume"""
+    import resume_parser
+    import skill_matcher
+
+    def fresh_analysis(sample, profile=resume_parser.DEFAULT_PARSING_PROFILE):
+        return resume_parser.analyze_resume_for(sample['text'], profile, layout=sample['layout'])
+
+    def validate_phrases(sample):
+        # Cold cache, so every phrase is validated rather than looked up
+        resume_parser._is_valid_stripped_skill.cache_clear()
+        for phrase in sample['phrases']:
+            resume_parser.is_valid_skill(phrase)
+
+    skills, _, _ = load_vocabularies()
+    required = random.Random(seed).sample(skills, RECRUITER_QUERY_SIZE)
+    nlp_model = resume_parser.get_nlp()
+    if nlp_model is not None:
+        # Recruiter docs are already tokenized when the matcher runs
+        def match_required(sample):
+            if 'tokens' not in sample:
+                sample['tokens'] = nlp_model.make_doc(sample['text'])
+            skill_matcher.extract_skills(sample['tokens'], required, nlp_model)
+        matcher_variant = 'PhraseMatcher'
+    else:
+        def match_required(sample):
+            skill_matcher.extract_skills(fresh_analysis(sample, 'fast'), required, None)
+        matcher_variant = 'gazetteer (no spaCy model)'
+
+    benchmarks = {
+        'is_valid_skill': (validate_phrases, 'all comma/line-separated phrases, cold cache'),
+        'csv_skills': (lambda sample: resume_parser.csv_skills(fresh_analysis(sample)), ''),
+        'extract_name': (lambda sample: resume_parser.extract_name(fresh_analysis(sample)), ''),
+        'recruiter_matcher': (match_required, matcher_variant),
+        'extract_skills_from_ner': (lambda sample: resume_parser.extract_skills_from_ner(fresh_analysis(sample)),
+                                    'skills model ' + ('loaded' if resume_parser.get_nlp_skills_model() else 'missing')),
+        'extract_resume_info_from_pdf': (
+            lambda sample: resume_parser.extract_resume_info_from_pdf(io.BytesIO(sample['pdf'])),
+            'spaCy model ' + ('loaded' if nlp_model is not None else 'missing')),
+    }
+    for profile in profiles:
+        benchmarks[f'parse_resume[{profile}]'] = (
+            lambda sample, profile=profile: resume_parser.parse_resume(sample['pdf'], profile=profile), '')
+    return benchmarks
+
+
+def time_benchmark(func, samples, repeat=1):
+    """Latency statistics of func over every sample; the first sample is run once untimed as a warm-up"""
+    func(samples[0])
+    durations = []
+    for _ in range(repeat):
+        for sample in samples:
+            start = time.perf_counter()
+            func(sample)
+            durations.append(time.perf_counter() - start)
+    durations = np.array(durations)
+    p50, p95, p99 = np.percentile(durations, [50, 95, 99]) * 1000
+    return {
+        'samples': len(durations),
+        'total_s': round(float(durations.sum()), 4),
+        'throughput_per_s': round(len(durations) / float(durations.sum()), 2) if durations.sum() else None,
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+    }
+
+
+def peak_allocation_mb(func, samples):
+    """Largest amount of memory one call of func allocates on top of what is already live.
+
+    Measured with tracemalloc in its own untimed pass, so the timings are not
+    slowed down and the result does not depend on which benchmarks ran
+    before (unlike the process's RSS high-water mark).
+    """
+    peak = 0
+    tracemalloc.start()
+    try:
+        for sample in samples:
+            tracemalloc.reset_peak()
+            live = tracemalloc.get_traced_memory()[0]
+            func(sample)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - live)
+    finally:
+        tracemalloc.stop()
+    return round(peak / (1024 * 1024), 3)
+
+
+def run(count=DEFAULT_COUNT, seed=0, repeat=1, profiles=None, only=None):
+    import resume_parser
+
+    profiles = list(profiles or resume_parser.PARSING_PROFILES)
+    corpus = generate_corpus(count, seed)
+    samples = prepare_samples(corpus)
+    benchmarks = build_benchmarks(profiles, seed)
+    if only:
+        unknown = set(only) - set(benchmarks)
+        if unknown:
+            raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+        benchmarks = {name: benchmark for name, benchmark in benchmarks.items() if name in only}
+
+    results = {}
+    for name, (func, variant) in benchmarks.items():
+        print(f"  {name} ...", file=sys.stderr)
+        results[name] = time_benchmark(func, samples, repeat)
+        results[name]['peak_alloc_mb'] = peak_allocation_mb(func, samples)
+        if variant:
+            results[name]['variant'] = variant
+    return {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'count': count,
+            'seed': seed,
+            'repeat': repeat,
+            'pages': sum(resume['pages'] for resume in corpus),
+            'layouts': dict(Counter(resume['layout'] for resume in corpus)),
+            'pipeline_versions': {profile: resume_parser.pipeline_version(profile) for profile in profiles},
+            # Whole-run high-water mark, for information only
+            'peak_rss_mb': round(peak_rss_mb(), 1) if resource is not None else None,
+        },
+        'benchmarks': results,
+    }
+
+
+def compare(baseline, current, budget=DEFAULT_BUDGET):
+    """(report lines, regressions) of current against baseline; a regression is worse by more than budget"""
+    lines, regressions = [], []
+    for key in ('count', 'seed', 'repeat', 'pipeline_versions'):
+        if baseline['meta'].get(key) != current['meta'].get(key):
+            lines.append(f"warning: {key} differs from the baseline "
+                         f"({baseline['meta'].get(key)!r} vs {current['meta'].get(key)!r})")
+    for name, stats in current['benchmarks'].items():
+        old_stats = baseline['benchmarks'].get(name)
+        if old_stats is None:
+            lines.append(f"{name:<30} new benchmark, not in the baseline")
+            continue
+        for metric, larger_is_worse in COMPARED_METRICS:
+            old, new = old_stats.get(metric), stats.get(metric)
+            if not old or new is None:
+                continue
+            change = new / old - 1
+            worse_by = change if larger_is_worse else (old / new - 1 if new else float('inf'))
+            flag = ''
+            if worse_by > budget:
+                flag = '  REGRESSION'
+                regressions.append((name, metric, old, new))
+            lines.append(f"{name:<30} {metric:<17} {old:>10.3f} -> {new:>10.3f} ({change:+.1%}){flag}")
+    return lines, regressions
+
+
+def format_results(results):
+    lines = [f"{'benchmark':<30} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'alloc MB':>9}"]
+    for name, stats in results['benchmarks'].items():
+        lines.append(f"{name:<30} {stats['throughput_per_s'] or 0:9.1f} {stats['p50_ms']:9.3f} "
+                     f"{stats['p95_ms']:9.3f} {stats['p99_ms']:9.3f} {stats['peak_alloc_mb']:9.3f}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume extractors on a synthetic corpus")
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help="synthetic resumes to generate")
+    parser.add_argument('--seed', type=int, default=0, help="corpus seed")
+    parser.add_argument('--repeat', type=int, default=1, help="passes over the corpus per benchmark")
+    parser.add_argument('--profiles', help="comma-separated parsing profiles for parse_resume (default: all)")
+    parser.add_argument('--only', help="comma-separated benchmark names to run")
+    parser.add_argument('-o', '--output', help="write the results (e.g. a new baseline) to this JSON file")
+    parser.add_argument('--compare', metavar='BASELINE', help="JSON baseline to compare against")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                        help="allowed slowdown before a metric counts as a regression (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.count, args.seed, args.repeat,
+                  profiles=args.profiles.split(',') if args.profiles else None,
+                  only=args.only.split(',') if args.only else None)
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(results, output, indent=2)
+            output.write('\n')
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        lines, regressions = compare(baseline, results, args.budget)
+        print(f"\nCompared with {args.compare} (budget {args.budget:.0%}):")
+        print('\n'.join(lines))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond the budget")
+            return 1
+        print("\nNo regressions beyond the budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
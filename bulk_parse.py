@@ -0,0 +1,183 @@
+"""Headless bulk resume parser.
+
+Walks directories (or a list of files) for PDFs, parses them across a
+process pool with a warm model per worker and streams one JSON record
+per resume to a JSONL file. The output file doubles as the checkpoint:
+re-running the same command skips every resume already written, so an
+interrupted run resumes where it stopped. Resumes that fail to parse are
+recorded with an "error" field and are not retried.
+
+Usage:
+    python bulk_parse.py archive/ more_resumes/ -o parsed.jsonl --workers 8
+    python bulk_parse.py --file-list paths.txt -o parsed.jsonl
+    python bulk_parse.py archive/ -o triage.jsonl --profile fast   # no models, for triage
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+
+_worker_profile = None
+
+
+def find_pdfs(inputs, file_list=None):
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                paths.extend(os.path.join(root, name) for name in files if name.lower().endswith('.pdf'))
+        elif os.path.isfile(item):
+            paths.append(item)
+        else:
+            print(f"Skipping missing path: {item}", file=sys.stderr)
+    if file_list:
+        with open(file_list, encoding='utf-8') as listing:
+            paths.extend(line.strip() for line in listing if line.strip())
+    # Absolute, de-duplicated and sorted so reruns see the same order
+    return sorted({os.path.abspath(path) for path in paths})
+
+
+def _record_path(line):
+    """Path of a complete JSONL record, or None for a torn or unreadable line"""
+    if not line.endswith(b'\n'):
+        return None
+    try:
+        return json.loads(line)['path']
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def load_checkpoint(output_path):
+    """Paths already present in the output.
+
+    Only the final line can be torn by a crash, and it is truncated. A bad
+    line anywhere else is reported and skipped (it stays in the file), so
+    that resume is parsed again instead of every later record being lost.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    bad_lines = []
+    with open(output_path, 'rb+') as output:
+        offset = 0
+        last_bad = None  # (line number, offset) of the latest unreadable line
+        for line_number, line in enumerate(output, 1):
+            if last_bad is not None:
+                # Followed by another line, so not a torn write
+                bad_lines.append(last_bad[0])
+            path = _record_path(line)
+            if path is None:
+                last_bad = (line_number, offset)
+            else:
+                done.add(path)
+                last_bad = None
+            offset += len(line)
+        if last_bad is not None:
+            output.truncate(last_bad[1])
+    if bad_lines:
+        shown = ', '.join(map(str, bad_lines[:10])) + (' ...' if len(bad_lines) > 10 else '')
+        print(f"Skipped {len(bad_lines)} unreadable line(s) in {output_path}: {shown}", file=sys.stderr)
+    return done
+
+
+def _init_worker(profile):
+    global _worker_profile
+    _worker_profile = profile
+    # Warm the profile's models once per worker instead of once per resume
+    from resume_parser import warm_models
+    warm_models(profile)
+
+
+def _parse_path(path):
+    from resume_parser import parse_resume
+
+    timings = {}
+    record = {'path': path}
+    start = time.perf_counter()
+    try:
+        read_start = time.perf_counter()
+        with open(path, 'rb') as pdf:
+            pdf_bytes = pdf.read()
+        timings['read'] = time.perf_counter() - read_start
+        record['sha256'] = hashlib.sha256(pdf_bytes).hexdigest()
+        record['result'] = parse_resume(pdf_bytes, profile=_worker_profile, timings=timings)
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+    timings['total'] = time.perf_counter() - start
+    record['timings'] = timings
+    return record
+
+
+def run(paths, output_path, workers, profile):
+    done = load_checkpoint(output_path)
+    pending = [path for path in paths if path not in done]
+    print(f"{len(paths)} PDFs found, {len(paths) - len(pending)} already parsed, {len(pending)} to go", file=sys.stderr)
+
+    stage_totals = defaultdict(float)
+    parsed = errors = 0
+    start = time.perf_counter()
+    with open(output_path, 'a', encoding='utf-8') as output, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(profile,)) as executor:
+        # Bounded number of in-flight tasks keeps memory flat on very large backfills
+        todo = iter(pending)
+        in_flight = set()
+        while True:
+            for path in todo:
+                in_flight.add(executor.submit(_parse_path, path))
+                if len(in_flight) >= workers * 4:
+                    break
+            if not in_flight:
+                break
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                record = future.result()
+                output.write(json.dumps(record) + '\n')
+                output.flush()
+                if 'error' in record:
+                    errors += 1
+                else:
+                    parsed += 1
+                for stage, seconds in record['timings'].items():
+                    stage_totals[stage] += seconds
+                if (parsed + errors) % 100 == 0:
+                    print(f"  {parsed + errors}/{len(pending)} done", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    processed = parsed + errors
+    print(f"\nParsed {parsed} resumes ({errors} errors) in {elapsed:.1f}s", file=sys.stderr)
+    if processed:
+        print(f"Throughput: {processed / elapsed:.2f} docs/sec with {workers} workers", file=sys.stderr)
+        print("Mean time per resume by stage (worker seconds):", file=sys.stderr)
+        for stage, seconds in sorted(stage_totals.items()):
+            print(f"  {stage:<10} {seconds / processed * 1000:9.1f} ms", file=sys.stderr)
+    return parsed, errors
+
+
+def main(argv=None):
+    from resume_parser import DEFAULT_PARSING_PROFILE, PARSING_PROFILES
+
+    parser = argparse.ArgumentParser(description="Parse many resume PDFs into JSONL")
+    parser.add_argument('inputs', nargs='*', help="PDF files or directories to walk")
+    parser.add_argument('--file-list', help="text file with one PDF path per line")
+    parser.add_argument('-o', '--output', required=True, help="JSONL output (also used as the checkpoint)")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument('--profile', default=DEFAULT_PARSING_PROFILE, choices=list(PARSING_PROFILES),
+                        help="parsing profile: fast (no models, bulk triage), balanced or accurate")
+    args = parser.parse_args(argv)
+
+    paths = find_pdfs(args.inputs, args.file_list)
+    if not paths:
+        parser.error("no PDF files found")
+    output_path = os.path.abspath(args.output)
+
+    _, errors = run(paths, output_path, max(1, args.workers), args.profile)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
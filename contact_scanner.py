@@ -0,0 +1,96 @@
+import re
+
+# Contact details almost always sit in the first lines of a resume
+HEADER_LINES = 15
+# Digit count of anything accepted as a phone number (national or with country code)
+PHONE_DIGITS = (10, 15)
+
+_NAME_WORDS = r"[A-Z][A-Za-z.'-]+(?: [A-Z][A-Za-z.'-]+)*"
+
+# One alternation, tried left to right at each position: emails before URLs
+# (so "jane@github.com" stays an email), URLs before phones (so digits in a
+# link are not read as a number). A phone never starts with a year-like
+# group followed by more digits, so "2015 2016 2017" is not one and
+# "since 2019 555 123 4567" yields the number without the year. Without a
+# +country code it starts with an area code of 3+ digits, so dates like
+# "06.2018 08.2020" and ids like "19 1234 5678" are not phones either.
+# Location only matches a whole header segment like "Bengaluru, India" or
+# "Location: Austin, TX".
+CONTACT_PATTERN = re.compile(
+    r"(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)"
+    r"|(?P<linkedin>(?:https?://)?(?:[\w-]+\.)?linkedin\.com/(?:in|pub)/[\w%-]+)"
+    r"|(?P<github>(?:https?://)?(?:www\.)?github\.com/[\w-]+)"
+    r"|(?P<url>(?:https?://|www\.)[^\s|•·,;()<>]+)"
+    r"|(?P<phone>(?<![\w+])(?!(?:19|20)\d\d[-. \t]\d)"
+    r"(?:\+\d{1,3}[-. \t]?(?:\(\d{1,4}\)[-. \t]?)?\d{2,12}|(?:\(\d{1,4}\)[-. \t]?)?\d{3,12})"
+    r"(?:[-. \t]\d{2,6}){0,4}(?!\w))"
+    r"|(?:^|(?<=[|•·]))[ \t]*(?P<location_label>(?:Location|Address)\s*:\s*)?"
+    rf"(?P<location>{_NAME_WORDS},[ \t]*{_NAME_WORDS})[ \t]*(?=$|[|•·])",
+    re.MULTILINE)
+
+_FIELDS = ('email', 'phone', 'linkedin', 'github', 'website')
+
+
+def _header_split(text, header_lines):
+    """Offset where the header window ends"""
+    end = -1
+    for _ in range(header_lines):
+        end = text.find('\n', end + 1)
+        if end == -1:
+            return len(text)
+    return end
+
+
+def _scan(text, contact, urls, header=None):
+    """Fill empty contact fields from text; header collects location candidates and contact lines"""
+    for match in CONTACT_PATTERN.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind)
+        line_start = text.rfind('\n', 0, match.start()) + 1
+        if kind == 'location':
+            if header is not None:
+                header['locations'].append((match.group('location_label') is not None, line_start, value.strip()))
+            continue
+        if kind == 'url':
+            value = value.rstrip('.')
+            urls.append(value)
+            kind = 'website'
+        elif kind == 'phone' and not PHONE_DIGITS[0] <= sum(c.isdigit() for c in value) <= PHONE_DIGITS[1]:
+            # Years, ids and other short digit runs
+            continue
+        if kind in ('email', 'phone') and header is not None:
+            header['contact_lines'].add(line_start)
+        if contact[kind] is None:
+            contact[kind] = value.strip()
+
+
+def _pick_location(locations, contact_lines):
+    for labelled, _, value in locations:
+        if labelled:
+            return value
+    for _, line_start, value in locations:
+        if line_start in contact_lines:
+            return value
+    return locations[0][2] if locations else None
+
+
+def scan_contacts(text, header_lines=HEADER_LINES):
+    """Email, phone, LinkedIn/GitHub/website URLs and location in one regex pass.
+
+    The first header_lines lines are scanned first; the rest of the text is
+    only scanned when the email or phone is still missing. Location is
+    taken from the header only: a labelled "Location:" segment, else one on
+    the same line as the email or phone, else the first "City, Region".
+    Missing fields are None.
+    """
+    contact = dict.fromkeys(_FIELDS)
+    urls = []
+    header = {'locations': [], 'contact_lines': set()}
+    split = _header_split(text, header_lines)
+    _scan(text[:split], contact, urls, header)
+    if split < len(text) and (contact['email'] is None or contact['phone'] is None):
+        _scan(text[split:], contact, urls)
+
+    contact['location'] = _pick_location(header['locations'], header['contact_lines'])
+    contact['urls'] = list(dict.fromkeys(urls))
+    return contact
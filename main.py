@@ -41,6 +41,9 @@ try:
     from modules.recruiters import process_recruiters_mode
     from modules.admin import process_admin_mode
     from modules.feedback import process_feedback_mode
+    from modules import storage
+    # Create or upgrade the SQLite schemas once per process, not on every page run
+    storage.run_migrations()
 except Exception as e:
     st.error(f"Error importing modules: {e}")
     st.stop()
@@ -0,0 +1,102 @@
+import os
+import sys
+import threading
+import time
+
+
+def current_rss_bytes():
+    """Resident set size of this process in bytes (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+class _ModelEntry:
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.model = None
+        self.error = None
+        self.load_seconds = None
+        self.rss_delta_bytes = None
+
+    def load(self, loader):
+        if self.loaded:
+            return self.model
+        # Concurrent first callers block here and share the single load
+        with self.lock:
+            if self.loaded:
+                return self.model
+            rss_before = current_rss_bytes()
+            start = time.perf_counter()
+            try:
+                self.model = loader()
+            except Exception as e:
+                self.model = None
+                self.error = str(e)
+            self.load_seconds = time.perf_counter() - start
+            rss_after = current_rss_bytes()
+            if rss_before is not None and rss_after is not None:
+                self.rss_delta_bytes = rss_after - rss_before
+            if self.model is None and self.error is None:
+                self.error = "loader returned no model"
+            self.loaded = True
+        return self.model
+
+
+class ModelRegistry:
+    """Process-wide, thread-safe registry of NLP pipelines.
+
+    Each model is loaded exactly once per process (single flight): the
+    first caller runs the loader while concurrent callers wait for it and
+    then share the same object. A failed load is remembered as None until
+    reset() is called, so a missing model is not re-downloaded on every
+    Streamlit rerun.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self, name, loader):
+        """Return the model registered under name, calling loader() on first use"""
+        entry = self._entries.get(name)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.setdefault(name, _ModelEntry(name))
+        return entry.load(loader)
+
+    def reset(self, name=None):
+        """Forget one (or every) model so the next get() loads it again"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self):
+        """Load time and memory footprint of every model seen so far"""
+        stats = {}
+        for name, entry in list(self._entries.items()):
+            stats[name] = {
+                'loaded': entry.loaded and entry.model is not None,
+                'load_seconds': entry.load_seconds,
+                'rss_delta_mb': None if entry.rss_delta_bytes is None else entry.rss_delta_bytes / (1024 * 1024),
+                'error': entry.error,
+            }
+        return stats
+
+
+registry = ModelRegistry()
+get_model = registry.get
+reset_model = registry.reset
+model_stats = registry.stats
@@ -1,8 +1,12 @@
-import base64
 import sqlite3
 import streamlit as st
 import pandas as pd
 
+from modules import blob_store, resume_search, skill_index, storage
+
+from model_registry import model_stats
+from parse_cache import parse_cache
+
 def process_admin_mode():
     # Modern header
     st.markdown("""
@@ -40,6 +44,11 @@ def process_admin_mode():
         
         # Display feedback data
         display_feedback_data()
+
+        st.markdown('---')
+
+        # Display load time and memory of the shared NLP models
+        display_model_stats()
         
         # Logout button
         st.markdown("---")
@@ -90,62 +99,131 @@ def display_feedback_data():
     except FileNotFoundError:
         st.warning("⚠️ No feedback data file found.")
 
-def get_uploaded_pdfs():
+def display_model_stats():
+    st.markdown("### 🧠 Loaded Models")
+    cache_stats = parse_cache.stats()
+    st.caption(f"Parse cache: {cache_stats['entries']} entries, {cache_stats['hits']} hits, "
+               f"{cache_stats['misses']} misses ({cache_stats['hit_rate'] * 100:.0f}% hit rate)")
+
+    stats = model_stats()
+    if not stats:
+        st.info("📭 No models have been loaded in this process yet.")
+        return
+
+    rows = []
+    for name, info in stats.items():
+        rows.append({
+            'Model': name,
+            'Status': '✅ Loaded' if info['loaded'] else f"❌ {info['error']}",
+            'Load Time (s)': round(info['load_seconds'], 2) if info['load_seconds'] is not None else None,
+            'Memory (MB)': round(info['rss_delta_mb'], 1) if info['rss_delta_mb'] is not None else None,
+        })
+    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+# Resumes listed per page in the admin panel
+ADMIN_PAGE_SIZE = 20
+
+def get_uploaded_pdfs(after=None, page_size=ADMIN_PAGE_SIZE):
+    """One page of uploaded PDFs ordered by (created_at, hash), starting after the given cursor"""
     try:
-        conn = sqlite3.connect('data/user_pdfs.db')
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name FROM user_uploaded_pdfs")
-        uploaded_pdfs = cursor.fetchall()
-        conn.close()
-        return uploaded_pdfs
+        with storage.connection(blob_store.DB_PATH) as conn:
+            if after is None:
+                cursor = conn.execute("SELECT hash, name, size, created_at FROM resume_files "
+                                      "ORDER BY created_at, hash LIMIT ?", (page_size,))
+            else:
+                # Keyset pagination: seek past the last row of the previous page instead of OFFSET
+                cursor = conn.execute("SELECT hash, name, size, created_at FROM resume_files "
+                                      "WHERE created_at > ? OR (created_at = ? AND hash > ?) "
+                                      "ORDER BY created_at, hash LIMIT ?", (after[0], after[0], after[1], page_size))
+            return cursor.fetchall()
 
     except sqlite3.Error as e:
         st.error(f"Error fetching uploaded PDFs: {e}")
         return []
 
-def display_uploaded_pdfs():
-    uploaded_pdfs = get_uploaded_pdfs()
+@st.cache_data(ttl=60, show_spinner=False)
+def count_uploaded_pdfs():
+    try:
+        with storage.connection(blob_store.DB_PATH) as conn:
+            return conn.execute("SELECT COUNT(*) FROM resume_files").fetchone()[0]
 
-    if uploaded_pdfs:
-        st.markdown("### 📄 Uploaded Resumes")
-        st.markdown(f"**Total Resumes:** {len(uploaded_pdfs)}")
-        
-        # Display in a modern card format
-        for pdf_id, pdf_name in uploaded_pdfs:
-            pdf_data = get_pdf_data(pdf_id)
-            if pdf_data:
-                pdf_b64 = base64.b64encode(pdf_data[1]).decode('utf-8')
-                download_link = f'<a href="data:application/pdf;base64,{pdf_b64}" download="{pdf_name}" style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: #f0f4f8; padding: 0.5rem 1rem; border-radius: 5px; text-decoration: none; font-weight: 600; box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3); transition: all 0.3s;">📥 Download</a>'
-                
-                st.markdown(f"""
-                <div class="info-card">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <div>
-                            <h4 style="margin: 0; color: #667eea;">📄 {pdf_name}</h4>
-                            <p style="color: #2d3748; margin: 0.5rem 0 0 0; font-weight: 500;">ID: {pdf_id}</p>
-                        </div>
-                        <div>{download_link}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.warning(f"⚠️ Error retrieving PDF data for ID: {pdf_id}")
+    except sqlite3.Error:
+        return 0
 
-    else:
+def display_search_index_status():
+    """Resumes uploaded before the search indexes existed can be indexed in batches"""
+    try:
+        unindexed_text = resume_search.count_unindexed()
+        unindexed_skills = skill_index.count_unindexed()
+    except sqlite3.Error as e:
+        st.warning(f"⚠️ Could not read the search indexes: {e}")
+        return
+    if not unindexed_text and not unindexed_skills:
+        return
+    col_status, col_action = st.columns([4, 1])
+    with col_status:
+        st.caption(f"🔎 Not searchable yet: {unindexed_text} resume(s) by text, "
+                   f"{unindexed_skills} by skills (skills need a full parse)")
+    with col_action:
+        if st.button("Index batch", use_container_width=True):
+            with st.spinner("Indexing stored resumes..."):
+                indexed_text = resume_search.index_missing()
+                indexed_skills = skill_index.index_missing()
+            st.success(f"✅ Indexed {indexed_text} resume(s) by text and {indexed_skills} by skills")
+
+def display_uploaded_pdfs():
+    total = count_uploaded_pdfs()
+
+    if not total:
         st.info("📭 No uploaded PDFs available yet.")
+        return
 
-def get_pdf_data(pdf_id):
-    try:
-        conn = sqlite3.connect('data/user_pdfs.db')
-        cursor = conn.cursor()
-        cursor.execute("SELECT name, data FROM user_uploaded_pdfs WHERE id=?", (pdf_id,))
-        pdf_data = cursor.fetchone()
-        conn.close()
-        return pdf_data
+    st.markdown("### 📄 Uploaded Resumes")
+    st.markdown(f"**Total Resumes:** {total}")
+    display_search_index_status()
 
-    except sqlite3.Error as e:
-        st.error(f"Error fetching PDF data: {e}")
-        return None
+    # Stack of page cursors; the last entry is where the current page starts
+    cursors = st.session_state.setdefault('admin_pdf_cursors', [None])
+    uploaded_pdfs = get_uploaded_pdfs(after=cursors[-1])
+    page_number = len(cursors)
+
+    # Display in a modern card format; bytes are only read when a download is requested
+    for pdf_id, pdf_name, pdf_size, _ in uploaded_pdfs:
+        col_info, col_action = st.columns([4, 1])
+        with col_info:
+            st.markdown(f"""
+            <div class="info-card">
+                <h4 style="margin: 0; color: #667eea;">📄 {pdf_name}</h4>
+                <p style="color: #2d3748; margin: 0.5rem 0 0 0; font-weight: 500;">ID: {pdf_id[:12]} · {pdf_size / 1024:.0f} KB</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with col_action:
+            if st.session_state.get('admin_download_hash') == pdf_id:
+                try:
+                    with blob_store.open_blob(pdf_id) as blob:
+                        st.download_button("📥 Download", data=blob, file_name=pdf_name, mime="application/pdf",
+                                           key=f"download_{pdf_id}", use_container_width=True)
+                except OSError as e:
+                    st.warning(f"⚠️ Error retrieving PDF data for ID: {pdf_id[:12]} ({e})")
+            elif st.button("📄 Prepare", key=f"prepare_{pdf_id}", use_container_width=True):
+                st.session_state['admin_download_hash'] = pdf_id
+                st.rerun()
+
+    # Pagination controls
+    total_pages = max(page_number, -(-total // ADMIN_PAGE_SIZE))
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if page_number > 1 and st.button("⬅️ Previous", use_container_width=True):
+            cursors.pop()
+            st.rerun()
+    with col_page:
+        st.markdown(f"<p style='text-align: center;'>Page {page_number} of {total_pages}</p>", unsafe_allow_html=True)
+    with col_next:
+        # A full page means there may be more rows (the cached total can lag behind new uploads)
+        if len(uploaded_pdfs) == ADMIN_PAGE_SIZE and st.button("Next ➡️", use_container_width=True):
+            last_hash, _, _, last_created_at = uploaded_pdfs[-1]
+            cursors.append((last_created_at, last_hash))
+            st.rerun()
 
 if __name__ == "__main__":
     process_admin_mode()
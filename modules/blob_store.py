@@ -0,0 +1,141 @@
+import hashlib
+import os
+import tempfile
+import time
+
+from modules import storage
+
+# Resolved against the repository, not the working directory
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+DB_PATH = os.path.join(DATA_DIR, 'user_pdfs.db')
+BLOB_ROOT = os.path.join(DATA_DIR, 'blobs')
+
+
+def blob_path(digest):
+    """Sharded location of a blob: data/blobs/ab/cd/abcd....pdf"""
+    return os.path.join(BLOB_ROOT, digest[:2], digest[2:4], f"{digest}.pdf")
+
+
+def _write_blob(digest, data):
+    path = blob_path(digest)
+    if os.path.exists(path):
+        return path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write to a temp file and rename so readers never see a partial blob
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+# Function to store an uploaded PDF; identical content is stored once
+def store_pdf(name, data):
+    digest = hashlib.sha256(data).hexdigest()
+    _write_blob(digest, data)
+
+    now = time.time()
+    with storage.connection(DB_PATH) as conn:
+        cursor = conn.execute('INSERT OR IGNORE INTO resume_files (hash, name, size, created_at, last_seen_at) VALUES (?, ?, ?, ?, ?)',
+                              (digest, name, len(data), now, now))
+        if cursor.rowcount == 0:
+            conn.execute('UPDATE resume_files SET last_seen_at = ? WHERE hash = ?', (now, digest))
+    return digest
+
+
+def get_file_info(digest):
+    with storage.connection(DB_PATH) as conn:
+        return conn.execute('SELECT hash, name, size, created_at, last_seen_at FROM resume_files WHERE hash = ?',
+                            (digest,)).fetchone()
+
+
+def get_files_info(digests):
+    """get_file_info() rows for many digests in one query, as {hash: row}; unknown digests are left out"""
+    digests = list(dict.fromkeys(digests))
+    info = {}
+    with storage.connection(DB_PATH) as conn:
+        for chunk in storage.chunked(digests):
+            placeholders = ', '.join('?' * len(chunk))
+            for row in conn.execute('SELECT hash, name, size, created_at, last_seen_at FROM resume_files '
+                                    f'WHERE hash IN ({placeholders})', chunk):
+                info[row[0]] = row
+    return info
+
+
+def count_unindexed(docs_table, hash_column):
+    """Stored resumes with no row in docs_table (an index's table of the hashes it covers)"""
+    with storage.connection(DB_PATH) as conn:
+        return conn.execute(f'SELECT COUNT(*) FROM resume_files '
+                            f'WHERE hash NOT IN (SELECT {hash_column} FROM {docs_table})').fetchone()[0]
+
+
+def unindexed_files(docs_table, hash_column, limit):
+    """(hash, name) of up to limit stored resumes with no row in docs_table, oldest first.
+
+    A backfill must record every resume it is given, even one whose blob
+    cannot be read, or that resume is returned again on every call.
+    """
+    with storage.connection(DB_PATH) as conn:
+        return conn.execute(f'SELECT hash, name FROM resume_files '
+                            f'WHERE hash NOT IN (SELECT {hash_column} FROM {docs_table}) '
+                            'ORDER BY created_at, hash LIMIT ?', (limit,)).fetchall()
+
+
+def open_blob(digest):
+    """Binary file object for a stored PDF (a real file descriptor, so it can be streamed or sendfile'd)"""
+    return open(blob_path(digest), 'rb')
+
+
+def read_blob(digest):
+    with open_blob(digest) as blob:
+        return blob.read()
+
+
+def migrate_legacy_pdfs(conn):
+    """Move PDFs stored as BLOBs in user_uploaded_pdfs into the blob store"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'user_uploaded_pdfs'")
+    if cursor.fetchone() is None:
+        return 0
+
+    migrated = 0
+    while True:
+        # Small batches keep memory bounded for large legacy tables
+        cursor.execute('SELECT id, name, data FROM user_uploaded_pdfs ORDER BY id LIMIT 50')
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        for row_id, name, data in rows:
+            digest = hashlib.sha256(data).hexdigest()
+            _write_blob(digest, data)
+            now = time.time()
+            cursor.execute('INSERT OR IGNORE INTO resume_files (hash, name, size, created_at, last_seen_at) VALUES (?, ?, ?, ?, ?)',
+                           (digest, name, len(data), now, now))
+            cursor.execute('DELETE FROM user_uploaded_pdfs WHERE id = ?', (row_id,))
+            migrated += 1
+        conn.commit()
+
+    cursor.execute('DROP TABLE user_uploaded_pdfs')
+    conn.commit()
+    if migrated:
+        # Give the space held by the old BLOB pages back to the filesystem
+        conn.execute('VACUUM')
+    return migrated
+
+
+storage.register_migration(DB_PATH, 'create_resume_files', '''
+    CREATE TABLE IF NOT EXISTS resume_files (
+        hash TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        last_seen_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_resume_files_created ON resume_files (created_at, hash);
+''')
+storage.register_migration(DB_PATH, 'move_pdf_blobs_to_blob_store', migrate_legacy_pdfs)
@@ -0,0 +1,103 @@
+import numpy as np
+
+from modules import blob_store, storage
+from modules.skill_index import normalize_skill
+
+# Score contributed by each matched skill
+REQUIRED_WEIGHT = 2.0
+OPTIONAL_WEIGHT = 1.0
+SHORTLIST_SIZE = 20
+
+
+class SkillMatrix:
+    """Candidate x skill presence matrix stored as packed bits.
+
+    Row i belongs to keys[i]; skill s lives in bit (7 - col % 8) of byte
+    col // 8 of each row, where col = columns[s]. 100k candidates over a
+    few thousand skills take a few tens of MB, and scoring only touches
+    the bytes of the queried skills.
+    """
+
+    def __init__(self, keys, columns, packed):
+        self.keys = keys
+        self.columns = columns
+        self.packed = packed
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_pairs(cls, keys, columns, rows, cols):
+        """Build from parallel arrays of unique (row, column) pairs"""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        row_bytes = max(1, -(-len(columns) // 8))
+        # Pairs are unique, so the bits of one byte can be summed instead of OR-ed
+        flat = np.bincount(rows * row_bytes + (cols >> 3), weights=(128 >> (cols & 7)),
+                           minlength=len(keys) * row_bytes)
+        return cls(keys, columns, flat.astype(np.uint8).reshape(len(keys), row_bytes))
+
+    @classmethod
+    def from_skill_sets(cls, keys, skill_sets):
+        """Build from one iterable of skills per key (e.g. the resumes uploaded in this session)"""
+        columns = {}
+        rows, cols = [], []
+        for row, skills in enumerate(skill_sets):
+            for name in {normalize_skill(skill) for skill in skills} - {''}:
+                rows.append(row)
+                cols.append(columns.setdefault(name, len(columns)))
+        return cls.from_pairs(list(keys), columns, rows, cols)
+
+    @classmethod
+    def from_skill_index(cls, db_path=None):
+        """Build from the persistent skill postings of every indexed resume"""
+        db_path = db_path or blob_store.DB_PATH
+        with storage.connection(db_path) as conn:
+            # One read transaction, so a concurrent index_skills() cannot add postings for
+            # skills or resumes that the earlier SELECTs did not see
+            conn.execute('BEGIN')
+            skill_rows = conn.execute('SELECT id, name FROM skills ORDER BY id').fetchall()
+            keys = [row[0] for row in conn.execute('SELECT resume_hash FROM skill_index_docs ORDER BY resume_hash')]
+            postings = conn.execute('SELECT resume_hash, skill_id FROM skill_postings').fetchall()
+        columns = {name: col for col, (_, name) in enumerate(skill_rows)}
+        column_of_id = {skill_id: col for col, (skill_id, _) in enumerate(skill_rows)}
+        row_of_key = {key: row for row, key in enumerate(keys)}
+        rows = np.fromiter((row_of_key[key] for key, _ in postings), dtype=np.int64, count=len(postings))
+        cols = np.fromiter((column_of_id[skill_id] for _, skill_id in postings), dtype=np.int64, count=len(postings))
+        return cls.from_pairs(keys, columns, rows, cols)
+
+    def rank(self, required, optional=(), k=SHORTLIST_SIZE, required_weight=REQUIRED_WEIGHT,
+             optional_weight=OPTIONAL_WEIGHT, require_all=False):
+        """Top-k candidates as (key, score, matched_skills), best first.
+
+        Every candidate is scored in one pass: the bytes holding the queried
+        skills are gathered, shifted down to 0/1 bits and multiplied by the
+        weight vector. Only the k best are sorted (argpartition). Candidates
+        without any matched skill are left out; with require_all, so is
+        anyone missing a required skill.
+        """
+        required_names = [name for name in dict.fromkeys(map(normalize_skill, required)) if name]
+        weights = dict.fromkeys(required_names, required_weight)
+        for skill in optional:
+            weights.setdefault(normalize_skill(skill), optional_weight)
+        weights.pop('', None)
+
+        if require_all and any(name not in self.columns for name in required_names):
+            return []
+        names = [name for name in weights if name in self.columns]
+        if not names or not len(self.keys) or k <= 0:
+            return []
+
+        cols = np.array([self.columns[name] for name in names], dtype=np.int64)
+        weight_vector = np.array([weights[name] for name in names])
+        bits = (self.packed[:, cols >> 3] >> (7 - (cols & 7)).astype(np.uint8)) & 1
+        scores = bits @ weight_vector
+        if require_all and required_names:
+            is_required = np.array([name in required_names for name in names])
+            scores[bits[:, is_required].min(axis=1) == 0] = 0
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.keys[row], float(scores[row]), [name for name, bit in zip(names, bits[row]) if bit])
+                for row in top if scores[row] > 0]
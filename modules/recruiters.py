@@ -24,56 +24,32 @@ if sys.version_info >= (3, 12):
 
 import streamlit as st
 import csv
-import fitz  # PyMuPDF
+import html
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-# Lazy import spacy (not at module level)
-spacy = None
-Matcher = None
-nlp = None
+import pdf_text
+import reference_data
+from modules import blob_store, resume_search, skill_index
+from modules.candidate_ranking import SkillMatrix
+from resume_parser import (PARSING_PROFILES, ResumeAnalysis, analyze_resume_for, csv_skills, disabled_pipes_for,
+                           extract_name, get_nlp as get_shared_nlp, parsing_profile_settings)
+from skill_matcher import extract_skills
+
+# Recruiter mode reads doc.ents (candidate name) and token.pos_ (parsed skills): the 'balanced'
+# profile. 'fast' skips spaCy for large triage batches.
+RECRUITER_PARSING_PROFILE = 'balanced'
+
+# Batched inference defaults (adjustable from the page)
+RECRUITER_BATCH_SIZE = 16
+RECRUITER_N_PROCESS = 1
+# How many PDFs are extracted ahead of the resume currently being analyzed
+PDF_PREFETCH = 8
 
 def get_nlp():
-    """Lazy load spaCy model"""
-    global spacy, Matcher, nlp
-    
-    if spacy is None:
-        try:
-            import spacy
-            from spacy.matcher import Matcher
-        except ImportError:
-            st.error("Could not import spaCy. Please ensure it is installed.")
-            return None
-    
-    if nlp is None:
-        try:
-            nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            # Model not found - try to download it using spacy.cli
-            try:
-                # Method 1: Use spacy.cli.download (preferred, doesn't install as package)
-                try:
-                    from spacy.cli import download
-                    download('en_core_web_sm', direct=False)
-                    nlp = spacy.load('en_core_web_sm')
-                except Exception:
-                    # Method 2: Fallback to subprocess
-                    import subprocess
-                    import sys
-                    result = subprocess.run(
-                        [sys.executable, "-m", "spacy", "download", "en_core_web_sm"],
-                        capture_output=True,
-                        text=True,
-                        timeout=300
-                    )
-                    if result.returncode == 0:
-                        nlp = spacy.load('en_core_web_sm')
-                    else:
-                        st.warning("⚠️ Could not download spaCy model. Some features may not work.")
-                        return None
-            except Exception as e:
-                st.warning(f"⚠️ Could not load spaCy model: {e}. Some features may not work.")
-                return None
-    
-    return nlp
+    """Shared spaCy model (loaded once per process through the model registry)"""
+    return get_shared_nlp()
 
 def process_recruiters_mode():
     # Modern header
@@ -84,6 +60,17 @@ def process_recruiters_mode():
     </div>
     """, unsafe_allow_html=True)
 
+    # Full-text search over every resume uploaded so far
+    st.markdown("### 🔎 Search Stored Resumes")
+    search_query = st.text_input(
+        "Search resume text",
+        "",
+        placeholder="e.g., python django aws",
+        help="Every word must appear; the last word also matches as a prefix"
+    )
+    if search_query.strip():
+        display_search_results(search_query)
+
     # File upload section
     st.markdown("### 📄 Upload Resumes")
     uploaded_files = st.file_uploader(
@@ -101,6 +88,13 @@ def process_recruiters_mode():
         placeholder="e.g., Python, Machine Learning, React, SQL"
     )
     required_skills = [skill.strip().lower() for skill in required_skills_input.split(',') if skill.strip()]
+    optional_skills_input = st.text_input(
+        "Nice-to-have skills (comma-separated)",
+        "",
+        placeholder="e.g., Docker, AWS",
+        help="Optional skills add to a candidate's ranking score at half the weight of required ones"
+    )
+    optional_skills = [skill.strip().lower() for skill in optional_skills_input.split(',') if skill.strip()]
     
     # Save skills button
     col1, col2 = st.columns([1, 4])
@@ -112,32 +106,61 @@ def process_recruiters_mode():
             else:
                 st.warning("⚠️ Please enter skills to save")
 
+    # Stored candidates ranked from the skill index, without NLP
+    if required_skills:
+        display_stored_candidates(required_skills, optional_skills)
+
+    # Batch processing options
+    with st.expander("⚙️ Batch Processing Options"):
+        parsing_profile = st.selectbox(
+            "Parsing profile", list(PARSING_PROFILES), index=list(PARSING_PROFILES).index(RECRUITER_PARSING_PROFILE),
+            help="fast: no NLP models (for triaging large batches); "
+                 "balanced: tagger + entities; accurate: full pipeline. Latencies are in the README.")
+        opt_col1, opt_col2 = st.columns(2)
+        with opt_col1:
+            batch_size = st.number_input("Batch size", min_value=1, max_value=256, value=RECRUITER_BATCH_SIZE,
+                                         help="Resumes sent through the NLP pipeline together")
+        with opt_col2:
+            n_process = st.number_input("Worker processes", min_value=1, max_value=os.cpu_count() or 1,
+                                        value=RECRUITER_N_PROCESS,
+                                        help="Parallel NLP processes; use more for large batches on multi-core machines")
+
     # Process resumes
     all_skills_found = set()
     if uploaded_files:
         st.markdown(f"### 📊 Processing {len(uploaded_files)} Resume(s)")
         st.markdown("---")
         
-        nlp_model = get_nlp()
-        if nlp_model is None:
-            st.error("⚠️ Could not load spaCy model. Please ensure en_core_web_sm is installed.")
-            return
-        
-        for idx, file in enumerate(uploaded_files, 1):
+        pipeline_profile, _ = parsing_profile_settings(parsing_profile)
+        if pipeline_profile is None:
+            nlp_model = None
+            docs = analyze_resumes_fast(uploaded_files)
+        else:
+            nlp_model = get_nlp()
+            if nlp_model is None:
+                st.error("⚠️ Could not load spaCy model. Please ensure en_core_web_sm is installed.")
+                return
+            docs = analyze_resumes(uploaded_files, nlp_model, batch_size=int(batch_size), n_process=int(n_process),
+                                   pipeline_profile=pipeline_profile)
+        progress = st.progress(0.0)
+        batch_candidates = []
+        for idx, (doc, file) in enumerate(docs, 1):
+            progress.progress(idx / len(uploaded_files), text=f"Analyzed {idx}/{len(uploaded_files)} resumes")
             with st.expander(f"📄 Resume {idx}: {file.name}", expanded=True):
                 with st.spinner(f"Analyzing {file.name}..."):
-                    text = extract_text_from_pdf(file)
-                    doc = nlp_model(text)
                     candidate_name = extract_candidate_name(doc)
                     display_candidate_info(candidate_name, file.name)
 
                     parsed_skills = extract_all_skills(doc)
                     display_parsed_skills(parsed_skills)
 
+                    skills_found = set()
+                    if required_skills or optional_skills:
+                        skills_found = extract_skills(doc, required_skills + optional_skills, nlp_model)
                     if required_skills:
-                        skills_found = extract_skills(doc, required_skills, nlp_model)
                         display_skills_found(required_skills, skills_found)
-                        all_skills_found.update(skills_found)
+                        all_skills_found.update(skills_found & set(required_skills))
+                    batch_candidates.append((candidate_name, file.name, parsed_skills | skills_found))
         
         # Summary
         if required_skills:
@@ -145,6 +168,7 @@ def process_recruiters_mode():
             st.markdown("### 📈 Summary")
             match_percentage = (len(all_skills_found) / len(required_skills)) * 100 if required_skills else 0
             st.metric("Skills Match Rate", f"{match_percentage:.1f}%", f"{len(all_skills_found)}/{len(required_skills)} skills found")
+            display_batch_ranking(batch_candidates, required_skills, optional_skills)
 
 def save_required_skills(required_skills):
     with open('data/UpdatedSkills.csv', 'a', newline='') as file:
@@ -152,17 +176,44 @@ def save_required_skills(required_skills):
         for skill in required_skills:
             writer.writerow([skill])
 
+def iter_pdf_texts(files, prefetch=PDF_PREFETCH):
+    """Yield (index, text) in upload order while the next PDFs are extracted in the background"""
+    # A single extraction thread: fitz is not thread-safe, but one worker is enough
+    # to overlap text extraction with NLP inference on the caller's thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = deque()
+        for idx, file in enumerate(files):
+            pending.append((idx, executor.submit(extract_text_from_pdf, file)))
+            if len(pending) > prefetch:
+                next_idx, future = pending.popleft()
+                yield next_idx, future.result()
+        while pending:
+            next_idx, future = pending.popleft()
+            yield next_idx, future.result()
+
+def analyze_resumes(files, nlp_model, batch_size=RECRUITER_BATCH_SIZE, n_process=RECRUITER_N_PROCESS,
+                    pipeline_profile='entities_tags'):
+    """Run every resume through nlp.pipe in batches, yielding (doc, file) in upload order"""
+    texts = ((text, idx) for idx, text in iter_pdf_texts(files))
+    docs = nlp_model.pipe(texts, as_tuples=True, batch_size=batch_size, n_process=n_process,
+                          disable=disabled_pipes_for(nlp_model, pipeline_profile))
+    for doc, idx in docs:
+        yield doc, files[idx]
+
+def analyze_resumes_fast(files):
+    """Yield (ResumeAnalysis, file) in upload order without loading any NLP model"""
+    for idx, text in iter_pdf_texts(files):
+        yield analyze_resume_for(text, 'fast'), files[idx]
+
 # Function to extract text from PDF file
 def extract_text_from_pdf(file):
-    pdf_document = fitz.open(stream=file.read(), filetype="pdf")
-    text = ""
-    for page_num in range(len(pdf_document)):
-        page = pdf_document.load_page(page_num)
-        text += page.get_text()
-    return text
+    return pdf_text.extract_text(file)
 
 # Function to extract candidate's full name using SpaCy
 def extract_candidate_name(doc):
+    if isinstance(doc, ResumeAnalysis):
+        # Fast profile: header lines instead of entities
+        return ' '.join(extract_name(doc)).strip() or "Candidate name not found"
     for ent in doc.ents:
         if ent.label_ == 'PERSON':
             return ent.text
@@ -170,39 +221,31 @@ def extract_candidate_name(doc):
 
 # Function to extract all skills from the resume
 def extract_all_skills(doc):
+    if isinstance(doc, ResumeAnalysis):
+        # Fast profile: vocabulary skills instead of tagged nouns
+        return {skill.lower() for skill in csv_skills(doc)}
     all_skills = set()
     for token in doc:
         if token.pos_ == 'NOUN' and token.text.isalpha() and len(token.text) > 1:
             all_skills.add(token.text.lower())
     return all_skills
 
-# Function to extract skills using SpaCy Matcher
-def extract_skills(doc, required_skills, nlp_model):
-    from spacy.matcher import Matcher
-    matcher = Matcher(nlp_model.vocab)
-    skills_found = set()
-
-    for skill in required_skills:
-        pattern = [{"LOWER": skill}]
-        matcher.add(skill, [pattern])
-
-    matches = matcher(doc)
-    for match_id, start, end in matches:
-        matched_skill = doc[start:end].text.lower()
-        skills_found.add(matched_skill)
-
-    return skills_found
-
 # Function to parse all skills from UpdatedSkills.csv
-def parse_all_skills():
+def load_updated_skills(file_path):
     skills_list = set()
-    with open('data/UpdatedSkills.csv', 'r') as file:
+    with open(file_path, 'r') as file:
         reader = csv.reader(file)
         for row in reader:
             for item in row:
                 skills_list.add(str(item).lower())
     
-    return skills_list
+    return frozenset(skills_list)
+
+def parse_all_skills():
+    # Served from the shared registry; picks up skills appended by save_required_skills
+    return set(reference_data.get_table('updated_skills'))
+
+reference_data.register('updated_skills', 'data/UpdatedSkills.csv', load_updated_skills)
 
 # Function to display candidate information
 def display_candidate_info(candidate_name, file_name):
@@ -214,6 +257,65 @@ def display_candidate_info(candidate_name, file_name):
     </div>
     """, unsafe_allow_html=True)
 
+# Function to display ranked full-text search results
+def display_search_results(query):
+    try:
+        results = resume_search.search_resumes(query)
+    except Exception as e:
+        st.error(f"Search failed: {e}")
+        return
+    if not results:
+        st.info("No stored resumes match that search")
+        return
+    st.caption(f"Top {len(results)} matches")
+    for rank, (_, name, _, score, snippet) in enumerate(results, 1):
+        st.markdown(f"""
+        <div class="info-card">
+            <h4 style="color: #667eea;">{rank}. {html.escape(name)} <span style="color: #718096; font-size: 0.8rem;">score {score:.2f}</span></h4>
+            <p style="color: #333;">{snippet}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+# Skill matrix over every indexed resume; rebuilt at most once a minute as new uploads are indexed
+@st.cache_resource(ttl=60)
+def get_stored_skill_matrix():
+    return SkillMatrix.from_skill_index()
+
+# Function to display a ranked shortlist of stored resumes
+def display_stored_candidates(required_skills, optional_skills):
+    try:
+        full_matches = len(skill_index.find_candidates(required_skills))
+        shortlist = get_stored_skill_matrix().rank(required_skills, optional_skills)
+    except Exception as e:
+        st.error(f"Skill lookup failed: {e}")
+        return
+    if not shortlist:
+        st.caption("No stored resumes have any of these skills")
+        return
+    st.caption(f"{full_matches} stored resume(s) have all required skills · top {len(shortlist)} by weighted score")
+    files_info = blob_store.get_files_info(resume_hash for resume_hash, _, _ in shortlist)
+    rows = []
+    for rank, (resume_hash, score, matched) in enumerate(shortlist, 1):
+        info = files_info.get(resume_hash)
+        rows.append({'Rank': rank, 'Resume': info[1] if info else resume_hash[:12], 'Score': score,
+                     'Matched skills': ', '.join(matched)})
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+# Function to rank the resumes uploaded in this session
+def display_batch_ranking(batch_candidates, required_skills, optional_skills):
+    matrix = SkillMatrix.from_skill_sets(range(len(batch_candidates)),
+                                         [skills for _, _, skills in batch_candidates])
+    shortlist = matrix.rank(required_skills, optional_skills, k=len(batch_candidates))
+    if not shortlist:
+        return
+    st.markdown("### 🏆 Candidate Ranking")
+    rows = []
+    for rank, (idx, score, matched) in enumerate(shortlist, 1):
+        candidate_name, file_name, _ = batch_candidates[idx]
+        rows.append({'Rank': rank, 'Candidate': candidate_name, 'File': file_name, 'Score': score,
+                     'Matched skills': ', '.join(matched)})
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
 # Function to display parsed skills from the resume
 def display_parsed_skills(parsed_skills):
     if parsed_skills:
@@ -0,0 +1,102 @@
+import html
+import re
+
+import pdf_text
+from modules import blob_store, storage
+
+# Ranked results returned per query
+SEARCH_LIMIT = 20
+# bm25() column weights: a hit in the file name counts more than one in the body
+BM25_WEIGHTS = (5.0, 1.0)
+SNIPPET_TOKENS = 16
+# Stored resumes indexed per call of index_missing()
+BACKFILL_BATCH = 200
+
+# Placeholders around matched terms; swapped for <mark> after HTML-escaping the snippet
+_MATCH_START = '\x02'
+_MATCH_END = '\x03'
+_QUERY_TERM = re.compile(r'\w[\w+#.-]*', re.UNICODE)
+
+
+def is_indexed(digest):
+    with storage.connection(blob_store.DB_PATH) as conn:
+        return conn.execute('SELECT 1 FROM resume_search_docs WHERE hash = ?', (digest,)).fetchone() is not None
+
+
+def index_resume(digest, name, text):
+    """Add (or replace) a stored resume's text in the full-text index.
+
+    resume_search_docs gives each hash a stable integer id that is used as
+    the FTS rowid, so lookups and joins go through primary keys instead of
+    scanning the index.
+    """
+    with storage.connection(blob_store.DB_PATH) as conn:
+        conn.execute('INSERT OR IGNORE INTO resume_search_docs (hash) VALUES (?)', (digest,))
+        doc_id = conn.execute('SELECT id FROM resume_search_docs WHERE hash = ?', (digest,)).fetchone()[0]
+        conn.execute('DELETE FROM resume_fts WHERE rowid = ?', (doc_id,))
+        conn.execute('INSERT INTO resume_fts (rowid, name, body) VALUES (?, ?, ?)', (doc_id, name, text))
+    return True
+
+
+def index_missing(limit=BACKFILL_BATCH):
+    """Index stored resumes uploaded before the search index existed; returns how many were added"""
+    indexed = 0
+    for digest, name in blob_store.unindexed_files('resume_search_docs', 'hash', limit):
+        try:
+            text = pdf_text.extract_text(blob_store.blob_path(digest))
+        except Exception:
+            # Unreadable or missing blob: index the name only
+            text = ''
+        indexed += index_resume(digest, name, text)
+    return indexed
+
+
+def count_unindexed():
+    return blob_store.count_unindexed('resume_search_docs', 'hash')
+
+
+def build_match_query(query):
+    """Turn free text into an FTS5 query: every term must match, the last one as a prefix"""
+    terms = _QUERY_TERM.findall(query)
+    if not terms:
+        return None
+    quoted = ['"' + term.replace('"', '""') + '"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def search_resumes(query, limit=SEARCH_LIMIT):
+    """Best-matching stored resumes as (hash, name, created_at, score, snippet_html), best first"""
+    match_query = build_match_query(query)
+    if match_query is None:
+        return []
+    with storage.connection(blob_store.DB_PATH) as conn:
+        rows = conn.execute(
+            'SELECT f.hash, f.name, f.created_at, bm25(resume_fts, ?, ?) AS score, '
+            'snippet(resume_fts, 1, ?, ?, \'…\', ?) '
+            'FROM resume_fts JOIN resume_search_docs d ON d.id = resume_fts.rowid '
+            'JOIN resume_files f ON f.hash = d.hash '
+            'WHERE resume_fts MATCH ? ORDER BY score LIMIT ?',
+            (*BM25_WEIGHTS, _MATCH_START, _MATCH_END, SNIPPET_TOKENS, match_query, limit)).fetchall()
+    # bm25() is lower-is-better; flip the sign so higher means more relevant
+    return [(digest, name, created_at, -score, _snippet_html(snippet))
+            for digest, name, created_at, score, snippet in rows]
+
+
+def _snippet_html(snippet):
+    escaped = html.escape(' '.join(snippet.split()))
+    return escaped.replace(_MATCH_START, '<mark>').replace(_MATCH_END, '</mark>')
+
+
+storage.register_migration(blob_store.DB_PATH, 'create_resume_fts', '''
+    CREATE TABLE IF NOT EXISTS resume_search_docs (
+        id INTEGER PRIMARY KEY,
+        hash TEXT NOT NULL UNIQUE
+    );
+    CREATE VIRTUAL TABLE IF NOT EXISTS resume_fts USING fts5(
+        name,
+        body,
+        tokenize = 'porter unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    );
+''')
@@ -0,0 +1,125 @@
+from modules import blob_store, storage
+
+# Stored resumes parsed per call of index_missing()
+BACKFILL_BATCH = 50
+
+
+def normalize_skill(skill):
+    """Canonical form shared by ingest and queries: casefolded, single-spaced"""
+    return ' '.join(str(skill).casefold().split())
+
+
+def _skill_ids(conn, names):
+    """Ids for already-known skill names; unknown names are left out"""
+    ids = {}
+    for chunk in storage.chunked(names):
+        placeholders = ', '.join('?' * len(chunk))
+        ids.update(conn.execute(f'SELECT name, id FROM skills WHERE name IN ({placeholders})', chunk))
+    return ids
+
+
+def index_skills(resume_hash, skills, version=''):
+    """Replace a resume's postings with its parsed skills.
+
+    version identifies the parser that produced the skills; a resume already
+    indexed with the same version is skipped, so Streamlit reruns cost one
+    primary-key lookup.
+    """
+    names = {normalize_skill(skill) for skill in skills}
+    names.discard('')
+    with storage.connection(blob_store.DB_PATH) as conn:
+        row = conn.execute('SELECT version FROM skill_index_docs WHERE resume_hash = ?', (resume_hash,)).fetchone()
+        if row is not None and row[0] == version:
+            return False
+        conn.executemany('INSERT OR IGNORE INTO skills (name) VALUES (?)', ((name,) for name in names))
+        skill_ids = _skill_ids(conn, names)
+        conn.execute('DELETE FROM skill_postings WHERE resume_hash = ?', (resume_hash,))
+        conn.executemany('INSERT INTO skill_postings (skill_id, resume_hash) VALUES (?, ?)',
+                         ((skill_id, resume_hash) for skill_id in skill_ids.values()))
+        conn.execute('INSERT OR REPLACE INTO skill_index_docs (resume_hash, version) VALUES (?, ?)',
+                     (resume_hash, version))
+    return True
+
+
+def _postings(conn, skill_id):
+    return {row[0] for row in conn.execute('SELECT resume_hash FROM skill_postings WHERE skill_id = ?', (skill_id,))}
+
+
+def find_candidates(required_skills):
+    """Hashes of stored resumes that have every required skill.
+
+    Posting lists are intersected smallest first, so the intermediate set
+    never grows beyond the rarest skill's list.
+    """
+    names = {normalize_skill(skill) for skill in required_skills}
+    names.discard('')
+    if not names:
+        return set()
+    with storage.connection(blob_store.DB_PATH) as conn:
+        skill_ids = _skill_ids(conn, names)
+        if len(skill_ids) < len(names):
+            # A skill nobody has means nobody has them all
+            return set()
+        postings = sorted((_postings(conn, skill_id) for skill_id in skill_ids.values()), key=len)
+    candidates = postings[0]
+    for posting in postings[1:]:
+        if not candidates:
+            break
+        candidates &= posting
+    return candidates
+
+
+def match_candidates(skills):
+    """Map each stored resume with at least one of the skills to the normalized skills it has"""
+    names = {normalize_skill(skill) for skill in skills}
+    names.discard('')
+    matches = {}
+    if not names:
+        return matches
+    with storage.connection(blob_store.DB_PATH) as conn:
+        skill_ids = _skill_ids(conn, names)
+        for name, skill_id in skill_ids.items():
+            for resume_hash in _postings(conn, skill_id):
+                matches.setdefault(resume_hash, set()).add(name)
+    return matches
+
+
+def count_unindexed():
+    return blob_store.count_unindexed('skill_index_docs', 'resume_hash')
+
+
+def index_missing(limit=BACKFILL_BATCH):
+    """Parse stored resumes that have no postings yet (through the parse cache); returns how many were added"""
+    from parse_cache import parse_cache
+    from resume_parser import parse_resume, pipeline_version
+
+    version = pipeline_version()
+    indexed = 0
+    for resume_hash, _ in blob_store.unindexed_files('skill_index_docs', 'resume_hash', limit):
+        try:
+            pdf_data = blob_store.read_blob(resume_hash)
+            resume_info = parse_cache.get_or_parse(pdf_data, version, lambda: parse_resume(pdf_data))
+            skills = resume_info['all_skills']
+        except Exception:
+            # Unreadable or missing blob: record it with no skills
+            skills = []
+        indexed += index_skills(resume_hash, skills, version)
+    return indexed
+
+
+storage.register_migration(blob_store.DB_PATH, 'create_skill_index', '''
+    CREATE TABLE IF NOT EXISTS skills (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+    CREATE TABLE IF NOT EXISTS skill_postings (
+        skill_id INTEGER NOT NULL REFERENCES skills (id),
+        resume_hash TEXT NOT NULL,
+        PRIMARY KEY (skill_id, resume_hash)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_skill_postings_resume ON skill_postings (resume_hash);
+    CREATE TABLE IF NOT EXISTS skill_index_docs (
+        resume_hash TEXT PRIMARY KEY,
+        version TEXT NOT NULL
+    ) WITHOUT ROWID;
+''')
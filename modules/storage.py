@@ -0,0 +1,156 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# Applied to every pooled connection
+BUSY_TIMEOUT_MS = 5000
+SQLITE_PRAGMAS = (
+    ('journal_mode', 'WAL'),       # readers don't block the writer (and vice versa)
+    ('synchronous', 'NORMAL'),     # safe with WAL, far fewer fsyncs than FULL
+    ('cache_size', -16000),        # ~16 MB page cache per connection
+    ('temp_store', 'MEMORY'),
+    ('busy_timeout', BUSY_TIMEOUT_MS),
+)
+# Idle connections kept per database
+POOL_SIZE = 8
+# Prepared statements cached per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE = 256
+# Values bound per IN (...) query, under SQLite's bound-parameter limit
+MAX_PARAMETERS = 500
+
+
+class ConnectionPool:
+    """Reusable SQLite connections for one database file.
+
+    Streamlit starts a new thread for every script run, so connections are
+    borrowed and returned rather than pinned to a thread: each connection is
+    used by one thread at a time, and its prepared-statement cache survives
+    across reruns and sessions.
+    """
+
+    def __init__(self, db_path, size=POOL_SIZE):
+        self.db_path = db_path
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def _open(self):
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma, value in SQLITE_PRAGMAS:
+            conn.execute(f'PRAGMA {pragma} = {value}')
+        return conn
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._open()
+
+    def release(self, conn):
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def chunked(values, size=MAX_PARAMETERS):
+    """Consecutive lists of at most size values, e.g. to bind a long list in several IN (...) queries"""
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+# db_path -> [(name, migrate)] in registration order, and the databases already migrated
+_migrations = {}
+_migrated = set()
+_migration_lock = threading.Lock()
+
+
+def _get_pool(db_path):
+    pool = _pools.get(db_path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(db_path, ConnectionPool(db_path))
+    return pool
+
+
+def register_migration(db_path, name, migrate):
+    """Register a schema migration; migrate is SQL or a callable taking a connection.
+
+    Migrations are applied once per database, in registration order, and
+    recorded by name in its schema_migrations table.
+    """
+    with _migration_lock:
+        steps = _migrations.setdefault(db_path, [])
+        if name not in (step_name for step_name, _ in steps):
+            steps.append((name, migrate))
+            _migrated.discard(db_path)
+
+
+def run_migrations(db_path=None):
+    """Apply pending migrations for one database (or all registered ones); cheap after the first call"""
+    db_paths = [db_path] if db_path is not None else list(_migrations)
+    for path in db_paths:
+        if path in _migrated:
+            continue
+        with _migration_lock:
+            if path in _migrated:
+                continue
+            pool = _get_pool(path)
+            conn = pool.acquire()
+            try:
+                conn.execute('CREATE TABLE IF NOT EXISTS schema_migrations (name TEXT PRIMARY KEY, applied_at REAL NOT NULL)')
+                conn.commit()
+                applied = {row[0] for row in conn.execute('SELECT name FROM schema_migrations')}
+                for name, migrate in _migrations.get(path, []):
+                    if name in applied:
+                        continue
+                    if callable(migrate):
+                        migrate(conn)
+                    else:
+                        conn.executescript(migrate)
+                    conn.execute('INSERT INTO schema_migrations (name, applied_at) VALUES (?, ?)', (name, time.time()))
+                    conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                pool.release(conn)
+            _migrated.add(path)
+
+
+@contextmanager
+def connection(db_path):
+    """Borrow a pooled connection; commits on success and rolls back on error"""
+    run_migrations(db_path)
+    pool = _get_pool(db_path)
+    conn = pool.acquire()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        pool.release(conn)
+
+
+def close_all():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
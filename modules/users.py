@@ -1,39 +1,22 @@
 import streamlit as st
-import sqlite3
+
+import pdf_layout
+from modules import blob_store, resume_search, skill_index
 
 # Import with error handling
 try:
-    from resume_parser import extract_resume_info_from_pdf, extract_contact_number_from_resume, extract_education_from_resume, \
-        extract_experience, suggest_skills_for_job, show_colored_skills, calculate_resume_score, extract_resume_info
+    from resume_parser import suggest_skills_for_job, show_colored_skills, \
+        calculate_resume_score, parse_resume, pipeline_version
+    from parse_cache import parse_cache
 except Exception as e:
     st.error(f"Error importing resume_parser: {e}")
     st.stop()
 
-# Function to create a table for PDFs in SQLite database if it doesn't exist
-def create_table():
-    conn = sqlite3.connect('data/user_pdfs.db')
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS user_uploaded_pdfs (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL,
-            data BLOB NOT NULL
-        )
-    ''')
-    conn.commit()
-    conn.close()
-
-# Function to insert PDF into the SQLite database
+# Function to store an uploaded PDF (content-addressed, so reruns and re-uploads are deduplicated)
 def insert_pdf(name, data):
-    conn = sqlite3.connect('data/user_pdfs.db')
-    cursor = conn.cursor()
-    cursor.execute('INSERT INTO user_uploaded_pdfs (name, data) VALUES (?, ?)', (name, data))
-    conn.commit()
-    conn.close()
+    return blob_store.store_pdf(name, data)
 
 def process_user_mode():
-    create_table()  # Create table if it doesn't exist
-
     # Modern header with glassmorphism
     st.markdown("""
     <div style="text-align: center; padding: 3rem 2rem; background: rgba(255, 255, 255, 0.15); backdrop-filter: blur(10px); border-radius: 20px; margin-bottom: 2rem; box-shadow: 0 8px 32px rgba(31, 38, 135, 0.2);">
@@ -63,11 +46,21 @@ def process_user_mode():
         pdf_data = uploaded_file.getvalue()
 
         # Insert the uploaded PDF into the database
-        insert_pdf(pdf_name, pdf_data)
+        pdf_hash = insert_pdf(pdf_name, pdf_data)
 
         with st.spinner("🔄 Analyzing your resume... This may take a moment."):
-            pdf_text = extract_resume_info_from_pdf(uploaded_file)
-            resume_info = extract_resume_info(pdf_text)
+            # Make it searchable for recruiters (once per content); the parse below reuses the
+            # same layout, so the PDF is read only once
+            layout = None
+            if not resume_search.is_indexed(pdf_hash):
+                layout = pdf_layout.extract_layout(pdf_data)
+                resume_search.index_resume(pdf_hash, pdf_name, layout.text)
+            # One analysis pass; contact, education and experience come from the same result.
+            # Reruns and identical uploads are served from the content-hash parse cache.
+            resume_info = parse_cache.get_or_parse(pdf_data, pipeline_version(),
+                                                   lambda: parse_resume(pdf_data, layout=layout))
+            # Keep the recruiters' skill -> candidate postings up to date (no-op on reruns)
+            skill_index.index_skills(pdf_hash, resume_info['all_skills'], pipeline_version())
 
         # Personal Information Section
         st.markdown('<div class="section-header">👤 Personal Information</div>', unsafe_allow_html=True)
@@ -99,9 +92,9 @@ def process_user_mode():
             """, unsafe_allow_html=True)
         
         with col2:
-            contact_number = extract_contact_number_from_resume(pdf_text)
-            if contact_number == "Not found":
-                phone_display = "Not found"
+            contact_number = resume_info['contact_number']
+            if contact_number == "Not found" or contact_number.startswith('+'):
+                phone_display = contact_number
             else:
                 phone_display = f"+{contact_number}"
             st.markdown(f"""
@@ -127,7 +120,7 @@ def process_user_mode():
 
         # Education Section
         st.markdown('<div class="section-header">🎓 Education</div>', unsafe_allow_html=True)
-        education_info = extract_education_from_resume(pdf_text)
+        education_info = resume_info['education']
         if education_info:
             st.markdown(f"""
             <div class="info-card">
@@ -143,7 +136,7 @@ def process_user_mode():
 
         # Experience Section
         st.markdown('<div class="section-header">💼 Experience</div>', unsafe_allow_html=True)
-        experience_info = extract_experience(pdf_text)
+        experience_info = resume_info['experience']
         
         col3, col4 = st.columns(2)
         with col3:
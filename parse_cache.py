@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from modules import storage
+
+# Resolved against the repository, not the working directory
+PARSE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'parse_cache.db')
+PARSE_CACHE_MAX_ENTRIES = 5000
+
+
+def content_key(pdf_bytes, pipeline_version):
+    """Cache key: SHA-256 of the PDF bytes plus the version of everything that shapes the output"""
+    return f"{hashlib.sha256(pdf_bytes).hexdigest()}:{pipeline_version}"
+
+
+class ParseCache:
+    """Persistent cache of parsed resumes keyed by content hash.
+
+    Results are stored as JSON in SQLite, so identical uploads from any
+    session (and every Streamlit rerun) skip the extraction chain. The
+    table is bounded to max_entries with least-recently-used eviction.
+    """
+
+    def __init__(self, db_path=PARSE_CACHE_PATH, max_entries=PARSE_CACHE_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        storage.register_migration(db_path, 'create_parse_cache', '''
+            CREATE TABLE IF NOT EXISTS parse_cache (
+                key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_parse_cache_last_access ON parse_cache (last_access);
+        ''')
+
+    def get(self, key):
+        """Return the cached result for key, or None on a miss"""
+        with storage.connection(self.db_path) as conn:
+            row = conn.execute('SELECT result FROM parse_cache WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                conn.execute('UPDATE parse_cache SET last_access = ? WHERE key = ?', (time.time(), key))
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, result):
+        now = time.time()
+        with storage.connection(self.db_path) as conn:
+            conn.execute('INSERT OR REPLACE INTO parse_cache (key, result, created_at, last_access) VALUES (?, ?, ?, ?)',
+                         (key, json.dumps(result), now, now))
+            overflow = conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0] - self.max_entries
+            if overflow > 0:
+                conn.execute('DELETE FROM parse_cache WHERE key IN '
+                             '(SELECT key FROM parse_cache ORDER BY last_access ASC LIMIT ?)', (overflow,))
+                with self._lock:
+                    self.evictions += overflow
+
+    def get_or_parse(self, pdf_bytes, pipeline_version, parse):
+        """Return the cached result for these bytes, calling parse() and storing its result on a miss"""
+        key = content_key(pdf_bytes, pipeline_version)
+        result = self.get(key)
+        if result is None:
+            result = parse()
+            self.put(key, result)
+        return result
+
+    def clear(self):
+        with storage.connection(self.db_path) as conn:
+            conn.execute('DELETE FROM parse_cache')
+
+    def stats(self):
+        with storage.connection(self.db_path) as conn:
+            entries = conn.execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+parse_cache = ParseCache()
@@ -0,0 +1,217 @@
+"""Local HTTP parsing service.
+
+Exposes the resume parser as JSON endpoints so other tools can use it
+without Streamlit. An async tornado front end hands the CPU-bound work to
+a bounded process pool whose workers keep the models warm across
+requests.
+
+Endpoints:
+    GET  /health        pool status
+    POST /parse         one PDF, either raw (Content-Type: application/pdf)
+                        or JSON {"pdf_base64": "..."}
+    POST /parse/batch   JSON {"documents": [{"name": "...", "pdf_base64": "..."}, ...]}
+
+Both parse endpoints accept an optional ?profile=fast|balanced|accurate
+(see resume_parser.PARSING_PROFILES).
+Responses carry Server-Timing and X-Parse-Time-Ms headers.
+
+Usage:
+    python parse_service.py --port 8000 --workers 4
+"""
+import argparse
+import asyncio
+import base64
+import binascii
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import tornado.web
+from tornado.log import app_log
+
+
+def _warm_models():
+    # The default profile's models, once per worker; other profiles load theirs on first use
+    from resume_parser import DEFAULT_PARSING_PROFILE, warm_models
+    warm_models(DEFAULT_PARSING_PROFILE)
+
+
+def _parse_bytes(pdf_bytes, profile):
+    from resume_parser import parse_resume
+
+    timings = {}
+    result = parse_resume(pdf_bytes, profile=profile, timings=timings)
+    return result, timings
+
+
+class ParsePool:
+    """Process pool plus an admission limit, so overload is rejected instead of queued forever"""
+
+    def __init__(self, workers, max_pending):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_models)
+
+    def has_capacity(self, documents=1):
+        return self.pending + documents <= self.max_pending
+
+    async def parse(self, pdf_bytes, profile):
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, _parse_bytes, pdf_bytes, profile)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class BaseParseHandler(tornado.web.RequestHandler):
+    def initialize(self, pool):
+        self.pool = pool
+        self.request_start = time.perf_counter()
+
+    def write_json(self, payload, status=200):
+        self.set_status(status)
+        self.set_header('Content-Type', 'application/json')
+        self.write(json.dumps(payload))
+
+    def write_error(self, status_code, **kwargs):
+        if status_code == 503:
+            self.set_header('Retry-After', '1')
+        self.write_json({'error': self._reason}, status=status_code)
+
+    def get_profile(self):
+        from resume_parser import DEFAULT_PARSING_PROFILE, PARSING_PROFILES
+
+        profile = self.get_query_argument('profile', DEFAULT_PARSING_PROFILE)
+        if profile not in PARSING_PROFILES:
+            raise tornado.web.HTTPError(400, reason=f"Unknown profile {profile!r}")
+        return profile
+
+    def set_timing_headers(self, stage_timings):
+        total_ms = (time.perf_counter() - self.request_start) * 1000
+        metrics = [f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in stage_timings.items()]
+        metrics.append(f"total;dur={total_ms:.1f}")
+        self.set_header('Server-Timing', ', '.join(metrics))
+        self.set_header('X-Parse-Time-Ms', f"{total_ms:.1f}")
+
+    def check_capacity(self, documents=1):
+        if not self.pool.has_capacity(documents):
+            raise tornado.web.HTTPError(503, reason="Parser is busy, retry later")
+
+
+def _decode_pdf(encoded):
+    try:
+        return base64.b64decode(encoded, validate=True)
+    except (binascii.Error, TypeError):
+        raise tornado.web.HTTPError(400, reason="pdf_base64 is not valid base64")
+
+
+class HealthHandler(BaseParseHandler):
+    def get(self):
+        self.write_json({'status': 'ok', 'workers': self.pool.workers,
+                         'pending': self.pool.pending, 'max_pending': self.pool.max_pending})
+
+
+class ParseHandler(BaseParseHandler):
+    async def post(self):
+        profile = self.get_profile()
+        if self.request.headers.get('Content-Type', '').startswith('application/json'):
+            try:
+                payload = json.loads(self.request.body)
+            except ValueError:
+                raise tornado.web.HTTPError(400, reason="Body is not valid JSON")
+            if not isinstance(payload, dict):
+                raise tornado.web.HTTPError(400, reason='Expected JSON {"pdf_base64": "..."}')
+            pdf_bytes = _decode_pdf(payload.get('pdf_base64'))
+        else:
+            pdf_bytes = self.request.body
+        if not pdf_bytes:
+            raise tornado.web.HTTPError(400, reason="Empty request body")
+
+        self.check_capacity()
+        try:
+            result, timings = await self.pool.parse(pdf_bytes, profile)
+        except Exception:
+            # The details go to the log; the reason phrase stays fixed
+            app_log.exception("Could not parse resume")
+            raise tornado.web.HTTPError(422, reason="Could not parse resume")
+        self.set_timing_headers(timings)
+        self.write_json(result)
+
+
+class BatchParseHandler(BaseParseHandler):
+    async def post(self):
+        profile = self.get_profile()
+        try:
+            payload = json.loads(self.request.body)
+        except ValueError:
+            raise tornado.web.HTTPError(400, reason="Body is not valid JSON")
+        if not isinstance(payload, dict) or 'documents' not in payload:
+            raise tornado.web.HTTPError(400, reason='Expected JSON {"documents": [...]}')
+        documents = payload['documents']
+        if not isinstance(documents, list) or not documents:
+            raise tornado.web.HTTPError(400, reason="documents must be a non-empty list")
+        if not all(isinstance(document, dict) for document in documents):
+            raise tornado.web.HTTPError(400, reason="Every document must be a JSON object")
+
+        pdfs = [_decode_pdf(document.get('pdf_base64')) for document in documents]
+        self.check_capacity(len(pdfs))
+        outcomes = await asyncio.gather(*(self.pool.parse(pdf_bytes, profile) for pdf_bytes in pdfs),
+                                        return_exceptions=True)
+
+        results = []
+        stage_totals = {}
+        for index, (document, outcome) in enumerate(zip(documents, outcomes)):
+            entry = {'name': document.get('name', str(index))}
+            if isinstance(outcome, Exception):
+                # As for /parse: the details go to the log, the response gets a fixed message
+                app_log.error("Could not parse resume %r", entry['name'], exc_info=outcome)
+                entry['error'] = "Could not parse resume"
+            else:
+                entry['result'], timings = outcome
+                for stage, seconds in timings.items():
+                    stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+            results.append(entry)
+        self.set_timing_headers(stage_totals)
+        self.write_json({'results': results})
+
+
+def make_app(pool):
+    return tornado.web.Application([
+        (r'/health', HealthHandler, {'pool': pool}),
+        (r'/parse', ParseHandler, {'pool': pool}),
+        (r'/parse/batch', BatchParseHandler, {'pool': pool}),
+    ])
+
+
+async def serve(host, port, workers, max_pending):
+    pool = ParsePool(workers, max_pending)
+    app = make_app(pool)
+    app.listen(port, address=host, max_body_size=64 * 1024 * 1024)
+    print(f"Resume parsing service on http://{host}:{port} ({workers} workers)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        pool.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the resume parser over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1, help="parser processes")
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="documents accepted at once before answering 503 (default: 4 per worker)")
+    args = parser.parse_args(argv)
+
+    workers = max(1, args.workers)
+    asyncio.run(serve(args.host, args.port, workers, args.max_pending or workers * 4))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+import bisect
+import re
+from collections import Counter, namedtuple
+
+import fitz  # PyMuPDF
+
+import section_segmenter
+from pdf_text import open_pdf
+
+# Text only: image blocks would otherwise be decoded into the page dict
+TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+# Span flag bit PyMuPDF sets for bold fonts
+BOLD_FLAG = 16
+# A page is read as two columns when a vertical gutter has at least this many lines on
+# each side, each side holds this share of the two columns' characters, and at most this
+# share of lines crosses it (full-width header and footer lines)
+MIN_COLUMN_LINES = 4
+MIN_COLUMN_SHARE = 0.2
+MAX_CROSSING_SHARE = 0.25
+# Gutters are only looked for in the middle of the page
+GUTTER_RANGE = (0.2, 0.8)
+# Styled lines longer than this are body text, not headings
+MAX_HEADING_WORDS = 5
+# Section name for headings that look like headings but are not in SECTION_HEADINGS
+OTHER_SECTION = 'other'
+
+# column: 0 for single-column flow (and full-width lines on two-column pages), 1/2 for left/right
+LayoutLine = namedtuple('LayoutLine', 'text size bold page column x0 y0 x1 y1')
+
+_DIGIT = re.compile(r'\d')
+
+
+class PdfLayout:
+    """Text lines of a PDF in reading order, with font size, bold flag, page and column.
+
+    text joins the lines with newlines; offsets[i] is where lines[i] starts
+    in it. headings are (heading_start, body_start, section_name) offsets
+    in text, in the shape section_segmenter.find_sections() takes, and name
+    is the largest line of the first page's header (None if nothing there
+    stands out from the body font).
+    """
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.offsets = []
+        offset = 0
+        for line in lines:
+            self.offsets.append(offset)
+            offset += len(line.text) + 1
+        self.text = '\n'.join(line.text for line in lines)
+        self.body_size = _body_size(lines)
+        self.headings = self._find_headings()
+        header_lines = bisect.bisect_left(self.offsets, self.headings[0][0]) if self.headings else len(lines)
+        self.name = _name_line(lines[:header_lines], self.body_size)
+
+    def _find_headings(self):
+        """Heading lines matched in the text, plus lines styled like the whole-line ones.
+
+        The font style (size, boldness, capitals) of lines that are nothing
+        but a known heading identifies the resume's other headings; they
+        become OTHER_SECTION so they still end the section above them.
+        Styles no different from the body font are ignored, so bold job
+        titles in body-size text are not mistaken for headings.
+        """
+        headings = section_segmenter.find_headings(self.text)
+        line_index = {offset: idx for idx, offset in enumerate(self.offsets)}
+        heading_rows = set()
+        styles = set()
+        for heading_start, body_start, _ in headings:
+            idx = line_index.get(heading_start)
+            if idx is None:
+                continue
+            heading_rows.add(idx)
+            line = self.lines[idx]
+            if not line.text[body_start - heading_start:].strip() and (line.size > self.body_size or line.bold):
+                styles.add(_style(line))
+        if not styles:
+            return headings
+        for idx, line in enumerate(self.lines):
+            if (idx not in heading_rows and _style(line) in styles and len(line.text.split()) <= MAX_HEADING_WORDS
+                    and not _DIGIT.search(line.text) and not line.text.endswith(('.', ','))):
+                start = self.offsets[idx]
+                headings.append((start, start + len(line.text), OTHER_SECTION))
+        return sorted(headings)
+
+
+def _span_is_bold(span):
+    return bool(span['flags'] & BOLD_FLAG) or 'bold' in span['font'].lower()
+
+
+def _page_lines(page, page_num):
+    """Visual lines of one page, as LayoutLines in PyMuPDF's block order"""
+    lines = []
+    for block in page.get_text('dict', flags=TEXT_FLAGS)['blocks']:
+        for line in block.get('lines', ()):
+            spans = [span for span in line['spans'] if span['text'].strip()]
+            if not spans:
+                continue
+            text = ' '.join(''.join(span['text'] for span in line['spans']).split())
+            x0, y0, x1, y1 = line['bbox']
+            lines.append(LayoutLine(text, round(max(span['size'] for span in spans), 1),
+                                    all(_span_is_bold(span) for span in spans), page_num, 0, x0, y0, x1, y1))
+    return lines
+
+
+def _find_gutter(lines, page_width):
+    """x of the gutter between two text columns, or None for a single-column page"""
+    best, best_support = None, 0
+    low, high = GUTTER_RANGE[0] * page_width, GUTTER_RANGE[1] * page_width
+    # The right column starts at the left edge of one of its lines
+    for x in sorted({line.x0 for line in lines if low <= line.x0 <= high}):
+        left = [line for line in lines if line.x1 <= x]
+        right = [line for line in lines if line.x0 >= x]
+        crossing = len(lines) - len(left) - len(right)
+        if min(len(left), len(right)) < MIN_COLUMN_LINES or crossing > MAX_CROSSING_SHARE * len(lines):
+            continue
+        left_chars = sum(len(line.text) for line in left)
+        right_chars = sum(len(line.text) for line in right)
+        if min(left_chars, right_chars) < MIN_COLUMN_SHARE * (left_chars + right_chars):
+            continue
+        support = min(len(left), len(right))
+        if support > best_support:
+            best, best_support = x, support
+    return best
+
+
+def _merge_rows(lines):
+    """Join fragments of one column that sit on the same text row, left to right"""
+    merged = []
+    for line in sorted(lines, key=lambda line: (line.y0, line.x0)):
+        previous = merged[-1] if merged else None
+        if (previous is not None and abs((previous.y0 + previous.y1) - (line.y0 + line.y1)) / 2 < 0.5 * min(previous.size, line.size)):
+            merged[-1] = previous._replace(text=previous.text + ' ' + line.text, size=max(previous.size, line.size),
+                                           bold=previous.bold and line.bold, x0=min(previous.x0, line.x0),
+                                           x1=max(previous.x1, line.x1), y1=max(previous.y1, line.y1))
+        else:
+            merged.append(line)
+    return merged
+
+
+def _reading_order(lines, page_width):
+    """Lines of one page top to bottom; on two-column pages, the left column is read before the
+    right one between full-width lines"""
+    gutter = _find_gutter(lines, page_width)
+    if gutter is None:
+        return _merge_rows(lines)
+    ordered, left, right = [], [], []
+    for line in sorted(lines, key=lambda line: (line.y0, line.x0)):
+        if line.x1 <= gutter:
+            left.append(line._replace(column=1))
+        elif line.x0 >= gutter:
+            right.append(line._replace(column=2))
+        else:
+            # A full-width line ends the band of columns above it
+            ordered += _merge_rows(left) + _merge_rows(right) + [line]
+            left, right = [], []
+    return ordered + _merge_rows(left) + _merge_rows(right)
+
+
+def _body_size(lines):
+    """Most common font size, counted per character"""
+    sizes = Counter()
+    for line in lines:
+        sizes[line.size] += len(line.text)
+    return sizes.most_common(1)[0][0] if sizes else 0.0
+
+
+def _style(line):
+    return line.size, line.bold, line.text.isupper()
+
+
+def _name_line(header_lines, body_size):
+    """Text of the largest line on the first page's header, if it is larger than the body font"""
+    first_page = [line for line in header_lines if line.page == 0]
+    if not first_page:
+        return None
+    largest = max(first_page, key=lambda line: line.size)
+    return largest.text if largest.size > body_size else None
+
+
+def extract_layout(source):
+    """Layout model of a PDF (path, bytes or file-like object, as for pdf_text.open_pdf)"""
+    lines = []
+    with open_pdf(source) as doc:
+        for page_num in range(doc.page_count):
+            page = doc.load_page(page_num)
+            lines += _reading_order(_page_lines(page, page_num), page.rect.width)
+    return PdfLayout(lines)
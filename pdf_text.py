@@ -0,0 +1,43 @@
+import io
+import os
+from contextlib import contextmanager
+
+import fitz  # PyMuPDF
+
+
+@contextmanager
+def open_pdf(source):
+    """Open a PDF and close it deterministically.
+
+    source may be a file path, PDF bytes or a binary file-like object such
+    as a Streamlit UploadedFile. Paths are opened by PyMuPDF directly, so
+    the file is never read into Python memory as a whole.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        doc = fitz.open(source)
+    elif isinstance(source, (bytes, bytearray)):
+        doc = fitz.open(stream=source, filetype="pdf")
+    elif isinstance(source, memoryview):
+        doc = fitz.open(stream=source.tobytes(), filetype="pdf")
+    elif isinstance(source, io.BytesIO):
+        # Independent of the current read position (Streamlit reruns reuse the object)
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(stream=source.read(), filetype="pdf")
+    try:
+        yield doc
+    finally:
+        doc.close()
+
+
+def iter_page_text(source, start=0, stop=None):
+    """Yield the text of each page in [start, stop), one page in memory at a time"""
+    with open_pdf(source) as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        for page_num in range(start, stop):
+            yield doc.load_page(page_num).get_text()
+
+
+def extract_text(source):
+    """Full document text, joined once instead of grown page by page"""
+    return ''.join(iter_page_text(source))
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import threading
+
+
+class ReferenceDataRegistry:
+    """Process-wide cache of the CSV lookup tables under data/.
+
+    Each table is parsed once into its in-memory form and served to every
+    caller; it is only re-read when the file's mtime changes, so editing a
+    CSV takes effect without a restart.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tables = {}   # name -> (file_path, loader)
+        self._loaded = {}   # name -> (mtime, value)
+        self._digests = {}  # file_path -> (mtime, sha256 of the contents)
+
+    def register(self, name, file_path, loader):
+        """Register a table; loader(file_path) returns its in-memory form"""
+        with self._lock:
+            self._tables[name] = (file_path, loader)
+            self._loaded.pop(name, None)
+
+    def get(self, name):
+        file_path, loader = self._tables[name]
+        mtime = _mtime(file_path)
+        loaded = self._loaded.get(name)
+        if loaded is not None and loaded[0] == mtime:
+            return loaded[1]
+
+        with self._lock:
+            # Another thread may have reloaded it while we waited
+            loaded = self._loaded.get(name)
+            if loaded is not None and loaded[0] == mtime:
+                return loaded[1]
+            value = loader(file_path)
+            self._loaded[name] = (mtime, value)
+            return value
+
+    def fingerprint(self, names):
+        """Short digest of the named tables' file contents, e.g. for cache keys.
+
+        Only the given tables count, so the result does not depend on which
+        other tables happen to be registered. A file is only hashed again
+        when its mtime or size changes.
+        """
+        with self._lock:
+            file_paths = sorted({self._tables[name][0] for name in names})
+        digest = hashlib.sha256()
+        for file_path in file_paths:
+            digest.update(file_path.encode('utf-8'))
+            digest.update(self._file_digest(file_path))
+        return digest.hexdigest()[:12]
+
+    def _file_digest(self, file_path):
+        mtime = _mtime(file_path)
+        cached = self._digests.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            with open(file_path, 'rb') as table_file:
+                file_digest = hashlib.sha256(table_file.read()).digest()
+        except OSError:
+            file_digest = b''
+        self._digests[file_path] = (mtime, file_digest)
+        return file_digest
+
+    def invalidate(self, name=None):
+        """Drop one (or every) loaded table so the next get() re-reads it"""
+        with self._lock:
+            if name is None:
+                self._loaded.clear()
+            else:
+                self._loaded.pop(name, None)
+
+
+def _mtime(file_path):
+    # Size is included so a rewrite within the filesystem's mtime resolution still counts
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+registry = ReferenceDataRegistry()
+register = registry.register
+get_table = registry.get
+fingerprint = registry.fingerprint
+invalidate = registry.invalidate
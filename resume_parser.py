@@ -23,10 +23,24 @@ if sys.version_info >= (3, 12):
     ForwardRef._evaluate = _patched_evaluate
 
 import re
-import fitz
 import base64
 import csv
+import json
 import os
+import time
+from functools import cached_property, lru_cache
+
+import contact_scanner
+import model_registry
+import pdf_layout
+import pdf_text
+import reference_data
+import section_segmenter
+from skill_gazetteer import SkillGazetteer
+
+# data/ and TrainedModel/ live next to this module, whatever the working directory
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(REPO_DIR, 'data')
 
 # Lazy import streamlit (only when needed, not at module level)
 try:
@@ -103,14 +117,16 @@ def _ensure_spacy_model():
                 st.error(f"Could not load spaCy model: {e}")
             return None
 
-# Lazy load models (not at import time)
+# Lazy load models (not at import time); the registry shares them process-wide
+SPACY_MODEL_NAME = 'en_core_web_sm'
+SKILLS_MODEL_PATH = os.path.join(REPO_DIR, 'TrainedModel', 'skills')
 nlp = None
 
 def get_nlp():
     """Get spaCy nlp model, loading it if necessary"""
     global nlp
     if nlp is None:
-        nlp = _ensure_spacy_model()
+        nlp = model_registry.get_model(SPACY_MODEL_NAME, _ensure_spacy_model)
         if nlp is None:
             # Don't raise error, return None and let functions handle gracefully
             # This allows the app to start even if model isn't loaded
@@ -119,6 +135,58 @@ def get_nlp():
             return None
     return nlp
 
+# Pipeline profiles: the spaCy components each call path actually reads.
+# Components outside the profile are skipped per call (nlp(text, disable=...)),
+# so one loaded model serves every profile and no shared state is mutated.
+PIPELINE_PROFILES = {
+    'full': None,                                       # every component
+    'entities_tags': ('tagger', 'attribute_ruler', 'ner'),  # doc.ents + token.pos_
+    'entities': ('ner',),                               # doc.ents only
+    'tokenizer': (),                                    # tokens and lexical attributes only
+}
+DEFAULT_PIPELINE_PROFILE = 'entities_tags'
+
+# Parsing profiles: how much model inference a parse may use, as (spaCy pipeline profile
+# or None for no spaCy at all, whether the TrainedModel/skills NER runs). Measured
+# latencies are in the README (python -m benchmarks.run).
+#   fast      layout, regex and skill gazetteer only; no model is ever loaded. For bulk triage.
+#   balanced  tagger + entity recognizer on the sections that need them, plus the
+#             skills NER model: the default, and what every parse ran before profiles
+#   accurate  full spaCy pipeline (lemmas included) plus the skills NER model
+PARSING_PROFILES = {
+    'fast': (None, False),
+    'balanced': ('entities_tags', True),
+    'accurate': ('full', True),
+}
+DEFAULT_PARSING_PROFILE = 'balanced'
+
+def parsing_profile_settings(profile):
+    """(pipeline profile, skills model enabled) for a parsing profile"""
+    if profile not in PARSING_PROFILES:
+        raise ValueError(f"Unknown parsing profile: {profile!r}")
+    return PARSING_PROFILES[profile]
+
+def disabled_pipes_for(nlp_model, profile=DEFAULT_PIPELINE_PROFILE):
+    """Names of the components to skip when running nlp_model under the given profile"""
+    if profile not in PIPELINE_PROFILES:
+        raise ValueError(f"Unknown pipeline profile: {profile!r}")
+    enabled = PIPELINE_PROFILES[profile]
+    if enabled is None:
+        return []
+    enabled = set(enabled)
+    # Keep shared embedding layers (tok2vec) that an enabled component listens to
+    for name, component in nlp_model.pipeline:
+        if enabled & set(getattr(component, 'listening_components', ())):
+            enabled.add(name)
+    return [name for name in nlp_model.pipe_names if name not in enabled]
+
+def parse_text(text, profile=DEFAULT_PIPELINE_PROFILE):
+    """Run the spaCy pipeline over text with only the profile's components enabled"""
+    nlp_model = get_nlp()
+    if nlp_model is None:
+        return None
+    return nlp_model(text, disable=disabled_pipes_for(nlp_model, profile))
+
 def load_keywords(file_path):
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
@@ -136,71 +204,200 @@ def load_keywords(file_path):
             st.warning(f"Error loading keywords from {file_path}: {e}")
         return set()
 
-# ----------------------------------Extract Name----------------------------------
-def extract_name(doc):
-    # Get text from doc object
-    nlp_model = get_nlp()
-    if nlp_model is None:
-        return "Model not available"
-    
-    if hasattr(doc, 'text'):
-        text = doc.text
-        processed_doc = doc
-    else:
-        text = str(doc)
-        processed_doc = nlp_model(text)
-    
-    # Organization/institute keywords to exclude
-    org_keywords = ['national', 'institute', 'technology', 'university', 'college', 'school', 
-                   'academy', 'center', 'centre', 'foundation', 'corporation', 'company', 'ltd',
-                   'limited', 'inc', 'llc', 'pvt', 'private']
-    
-    # Get entities
-    entities = processed_doc.ents
-    
-    # Look for PERSON entities, prioritize those at the beginning of the document
-    person_entities = []
-    for ent in entities:
-        if ent.label_ == 'PERSON':
-            names = ent.text.split()
-            ent_lower = ent.text.lower()
-            
-            # Filter out common false positives and organization names
-            invalid_names = {'machine learning', 'deep learning', 'data science', 'artificial intelligence',
-                           'software engineer', 'software developer', 'research consultant'}
-            
-            # Check if it contains organization keywords
-            is_org = any(keyword in ent_lower for keyword in org_keywords)
-            
-            if ent_lower not in invalid_names and not is_org:
-                # Check if it looks like a real name (2-4 words, all title case)
-                if 2 <= len(names) <= 4 and all(name.istitle() and name.isalpha() for name in names):
-                    person_entities.append(ent)
-    
-    # Return the first valid person entity (usually the candidate's name)
-    if person_entities:
-        names = person_entities[0].text.split()
-        if len(names) >= 2:
-                return names[0], ' '.join(names[1:])
+# ------------------------------Per-document Analysis-----------------------------
+# Name entities are looked for in the text before the first section heading, capped at this size
+HEADER_WINDOW_CHARS = 600
+# Sections each extractor reads; when none of them is found the whole document is used.
+# "Languages" often lists programming languages, so the skills extractors read it too.
+SKILL_SECTIONS = ('skills', 'projects', 'certifications', 'languages')
+EDUCATION_SECTIONS = ('education',)
+EXPERIENCE_SECTIONS = ('experience', 'projects')
+
+class ResumeAnalysis:
+    """Artifacts shared by every extractor, each computed at most once per document.
+
+    Accepts a processed spaCy doc (or any object with ``.text``) or raw text;
+    raw text is only run through the pipeline if an extractor needs entities
+    or tags. profile=None never runs spaCy and skills_model=False never runs
+    the skills NER model; extractors then fall back to text heuristics.
+    layout is the pdf_layout.PdfLayout the text came from, if any; its
+    font-based headings and name line are used instead of text heuristics.
+    """
+
+    def __init__(self, doc, profile=DEFAULT_PIPELINE_PROFILE, layout=None, skills_model=True):
+        self.profile = profile
+        self.layout = layout
+        self.skills_model = skills_model
+        if hasattr(doc, 'text'):
+            self._doc = doc
+            self.text = doc.text
         else:
-            return person_entities[0].text, ""
-    
-    # Fallback: try to extract from first few lines (prioritize first line)
-    lines = text.splitlines()[:15]  # Check first 15 lines
-    
-    # First, try the very first non-empty line (most likely to contain name)
-    for idx, line in enumerate(lines[:3]):  # Prioritize first 3 lines
+            self._doc = None
+            self.text = str(doc)
+
+    @cached_property
+    def doc(self):
+        """Processed spaCy doc (None if the model is not available)"""
+        if self._doc is not None:
+            return self._doc
+        return self._parse(self.text, self.profile)
+
+    def _parse(self, text, profile):
+        if self.profile is None:
+            return None
+        return parse_text(text, profile=profile)
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def lines(self):
+        return self.text.splitlines()
+
+    @cached_property
+    def ents(self):
+        return list(getattr(self.doc, 'ents', None) or [])
+
+    @cached_property
+    def header_end(self):
+        """Offset where the header window (name, contact block) ends"""
+        headings = self.layout.headings if self.layout is not None else None
+        return section_segmenter.header_end(self.text, HEADER_WINDOW_CHARS, headings)
+
+    @cached_property
+    def header_ents(self):
+        """Entities in the header window, sliced from the full doc if it is already parsed"""
+        if 'doc' in self.__dict__ or self._doc is not None:
+            doc = self.doc
+            if not hasattr(doc, 'char_span'):
+                return []
+            header = doc.char_span(0, self.header_end, alignment_mode='expand')
+        else:
+            header = self._parse(self.text[:self.header_end], 'entities')
+        return list(header.ents) if header is not None else []
+
+    @cached_property
+    def sections(self):
+        """Section name -> [(start, end)] body spans, found from heading lines"""
+        headings = self.layout.headings if self.layout is not None else None
+        return section_segmenter.section_spans(self.text, headings)
+
+    def _section_spans(self, names):
+        return sorted(span for name in names for span in self.sections.get(name, ()))
+
+    def section_text(self, names):
+        """Text of the named sections in document order, or None if none of them was found"""
+        spans = self._section_spans(names)
+        if not spans:
+            return None
+        return '\n'.join(self.text[start:end] for start, end in spans)
+
+    def section_docs(self, names, profile=None):
+        """Processed spaCy docs or spans covering the named sections.
+
+        Falls back to the whole document when none of the sections was
+        found. A document that has already been parsed is sliced rather
+        than re-parsed; otherwise only the section text goes through the
+        pipeline. Empty if spaCy is off or the model is not available.
+        """
+        profile = profile or self.profile
+        cache = self.__dict__.setdefault('_section_docs', {})
+        key = (tuple(names), profile)
+        if key not in cache:
+            spans = self._section_spans(names)
+            if not spans or 'doc' in self.__dict__ or self._doc is not None:
+                doc = self.doc
+                if not hasattr(doc, 'char_span'):
+                    docs = []
+                elif not spans:
+                    docs = [doc]
+                else:
+                    docs = [doc.char_span(start, end, alignment_mode='expand') for start, end in spans]
+            else:
+                docs = [self._parse(self.text[start:end], profile) for start, end in spans]
+            cache[key] = [doc for doc in docs if doc is not None]
+        return cache[key]
+
+    @cached_property
+    def contacts(self):
+        """Email, phone, links and location from one regex pass (no spaCy needed)"""
+        return contact_scanner.scan_contacts(self.text)
+
+    @cached_property
+    def skill_mentions(self):
+        """Counter of normalized vocabulary skill -> whole-word occurrences in the text"""
+        return get_skill_gazetteer().count(self.text)
+
+    @cached_property
+    def skill_entities(self):
+        """(text, label) pairs from the trained skills NER model, run over the skill sections only"""
+        if not self.skills_model:
+            return []
+        nlp_skills_model = get_nlp_skills_model()
+        if nlp_skills_model is None:
+            return []
+        text = self.section_text(SKILL_SECTIONS) or self.text
+        return [(ent.text, ent.label_) for ent in nlp_skills_model(text).ents]
+
+
+def analyze_resume(doc, profile=DEFAULT_PIPELINE_PROFILE):
+    """Wrap doc in a ResumeAnalysis (an existing analysis is returned as is)"""
+    if isinstance(doc, ResumeAnalysis):
+        return doc
+    return ResumeAnalysis(doc, profile=profile)
+
+
+def analyze_resume_for(doc, parsing_profile=DEFAULT_PARSING_PROFILE, layout=None):
+    """ResumeAnalysis set up for a parsing profile (an existing analysis is returned as is)"""
+    if isinstance(doc, ResumeAnalysis):
+        return doc
+    pipeline_profile, skills_model = parsing_profile_settings(parsing_profile)
+    return ResumeAnalysis(doc, profile=pipeline_profile, layout=layout, skills_model=skills_model)
+# --------------------------------------------------------------------------------
+
+# ----------------------------------Extract Name----------------------------------
+# Organization/institute keywords that rule a candidate name out
+NAME_ORG_KEYWORDS = ('national', 'institute', 'technology', 'university', 'college', 'school',
+                     'academy', 'center', 'centre', 'foundation', 'corporation', 'company', 'ltd',
+                     'limited', 'inc', 'llc', 'pvt', 'private')
+# Common PERSON false positives
+NON_NAME_PHRASES = frozenset({'machine learning', 'deep learning', 'data science', 'artificial intelligence',
+                              'software engineer', 'software developer', 'research consultant'})
+# Lines that are labels or links rather than a name
+NON_NAME_LINE_WORDS = ('email', 'phone', 'address', 'resume', 'cv', 'objective', 'summary',
+                       'linkedin', 'github', 'portfolio', 'website')
+
+
+def _name_from_entities(ents):
+    """First PERSON entity that looks like a real name, as (first, last), or None"""
+    for ent in ents:
+        if ent.label_ != 'PERSON':
+            continue
+        names = ent.text.split()
+        ent_lower = ent.text.lower()
+        if ent_lower in NON_NAME_PHRASES or any(keyword in ent_lower for keyword in NAME_ORG_KEYWORDS):
+            continue
+        # Looks like a real name: 2-4 words, all title case
+        if 2 <= len(names) <= 4 and all(name.istitle() and name.isalpha() for name in names):
+            return names[0], ' '.join(names[1:])
+    return None
+
+
+def _name_from_lines(lines):
+    """Name-shaped first lines of the document, as (first, last), or None"""
+    # First, try the very first non-empty lines (most likely to contain the name)
+    for line in lines[:3]:
         line = line.strip()
         if not line:
             continue
         
         # Skip lines that are clearly not names
-        if any(word in line.lower() for word in ['email', 'phone', 'address', 'resume', 'cv', 'objective', 'summary', 
-                                                 'linkedin', 'github', 'portfolio', 'website']):
+        if any(word in line.lower() for word in NON_NAME_LINE_WORDS):
             continue
         
         # Skip if it contains organization keywords
-        if any(keyword in line.lower() for keyword in org_keywords):
+        if any(keyword in line.lower() for keyword in NAME_ORG_KEYWORDS):
             continue
         
         words = line.split()
@@ -216,17 +413,17 @@ def extract_name(doc):
                 all(len(w) >= 2 and len(w) <= 20 for w in words[1:])):
                 # Additional check: not common words or organization terms
                 if (potential_first.lower() not in ['mr', 'mrs', 'ms', 'dr', 'prof', 'the', 'national', 'institute'] and
-                    not any(org in potential_last.lower() for org in org_keywords)):
+                    not any(org in potential_last.lower() for org in NAME_ORG_KEYWORDS)):
                     return potential_first, potential_last
     
-    # Last resort: check first 2-3 words of first non-empty line (with strict validation)
-    for line in lines[:5]:  # Only check first 5 lines
+    # Last resort: check first 2-3 words of the first lines (with strict validation)
+    for line in lines[:5]:
         line = line.strip()
         if not line:
             continue
         
         # Skip if contains organization keywords
-        if any(keyword in line.lower() for keyword in org_keywords):
+        if any(keyword in line.lower() for keyword in NAME_ORG_KEYWORDS):
             continue
         
         words = line.split()[:3]
@@ -240,157 +437,119 @@ def extract_name(doc):
                 all(w.isalpha() for w in words[1:]) and
                 all(len(w) >= 2 and len(w) <= 15 for w in words[1:]) and
                 first.lower() not in ['national', 'institute', 'university', 'college', 'the', 'mr', 'mrs', 'ms', 'dr'] and
-                not any(org in last.lower() for org in org_keywords)):
+                not any(org in last.lower() for org in NAME_ORG_KEYWORDS)):
                 return first, last
-    
-    return "", ""
+    return None
+
+
+def extract_name(doc):
+    """(first_name, last_name); empty strings if no name is found.
+
+    The largest header line of a PDF layout is tried first, then entity
+    recognition on the header window only and the name-shaped first lines;
+    the whole document is parsed only if none of them yields a name.
+    """
+    analysis = analyze_resume(doc, profile='entities')
+    name = None
+    if analysis.layout is not None and analysis.layout.name:
+        name = _name_from_lines([analysis.layout.name])
+    name = name or _name_from_entities(analysis.header_ents) or _name_from_lines(analysis.lines[:15])
+    if name is None and analysis.header_end < len(analysis.text):
+        name = _name_from_entities(analysis.ents)
+    return name or ("", "")
+
+
+def extract_header_fields(doc):
+    """Name and contact details, produced without full-document NLP"""
+    analysis = analyze_resume(doc, profile='entities')
+    first_name, last_name = extract_name(analysis)
+    return {'first_name': first_name, 'last_name': last_name, 'email': extract_email(analysis),
+            'contact_number': extract_contact_number_from_resume(analysis), 'contact': analysis.contacts}
 # --------------------------------------------------------------------------------
 
 # ----------------------------------Extract Email---------------------------------
 def extract_email(doc):
-    nlp_model = get_nlp()
-    if nlp_model is None:
-        # Fallback to regex if model not available
-        text = doc.text if hasattr(doc, 'text') else str(doc)
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        match = re.search(email_pattern, text)
-        return match.group() if match else ""
-    
-    matcher = spacy.matcher.Matcher(nlp_model.vocab)
-    email_pattern = [{'LIKE_EMAIL': True}]
-    matcher.add('EMAIL', [email_pattern])
-
-    matches = matcher(doc)
-    for match_id, start, end in matches:
-        if match_id == nlp_model.vocab.strings['EMAIL']:
-            return doc[start:end].text
-    return ""
+    return analyze_resume(doc).contacts['email'] or ""
 # --------------------------------------------------------------------------------
 
 # ----------------------------------Extract Ph No---------------------------------
 def extract_contact_number_from_resume(doc):
-    contact_number = None
-    # Handle both doc object and text string
-    if hasattr(doc, 'text'):
-        text = doc.text
-    else:
-        text = str(doc)
-    
-    pattern = r"\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"
-    match = re.search(pattern, text)
-    if match:
-        contact_number = match.group()
-    return contact_number if contact_number else "Not found"
+    return analyze_resume(doc).contacts['phone'] or "Not found"
 # --------------------------------------------------------------------------------
 
 # --------------------------------Extract Education-------------------------------
+# Without entities, education lines are split on these to isolate the institution
+EDUCATION_FIELD_SEPARATORS = re.compile(r'[,|•·;]| - ')
+INSTITUTION_KEYWORDS = ('university', 'college', 'institute')
+
 def extract_education_from_resume(doc):
     universities = []
 
-    # Handle both doc object and text string
-    nlp_model = get_nlp()
-    if nlp_model is None:
-        return []
-    
-    if hasattr(doc, 'ents'):
-        # Already a processed doc
-        processed_doc = doc
-    else:
-        # It's text, need to process
-        processed_doc = nlp_model(str(doc))
+    # Only the education section is needed, and raw text only goes through the entity recognizer
+    analysis = analyze_resume(doc, profile='entities')
+    section_docs = analysis.section_docs(EDUCATION_SECTIONS, profile='entities')
 
     # Iterate through entities and check for organizations (universities)
-    for entity in processed_doc.ents:
-        if entity.label_ == "ORG" and ("university" in entity.text.lower() or "college" in entity.text.lower() or "institute" in entity.text.lower()):
-            universities.append(entity.text)
+    for section_doc in section_docs:
+        for entity in section_doc.ents:
+            if entity.label_ == "ORG" and any(keyword in entity.text.lower() for keyword in INSTITUTION_KEYWORDS):
+                universities.append(entity.text)
+
+    if not section_docs:
+        # No spaCy (fast profile or model missing): institution-named parts of the education lines
+        text = analysis.section_text(EDUCATION_SECTIONS) or analysis.text
+        for line in text.splitlines():
+            for part in EDUCATION_FIELD_SEPARATORS.split(line):
+                part = part.strip()
+                if any(keyword in part.lower() for keyword in INSTITUTION_KEYWORDS):
+                    universities.append(part)
 
     return universities
 # --------------------------------------------------------------------------------
 
 # ----------------------------------Extract Skills--------------------------------
+def get_skill_gazetteer():
+    """Skill vocabulary compiled into a single multi-pattern matcher (rebuilt only when the CSV changes)"""
+    return reference_data.get_table('skill_gazetteer')
+
 def csv_skills(doc):
     try:
-        skills_keywords = load_keywords('data/newSkills.csv')
-        skills = set()
-        
-        # Get text from doc object or use as string
-        if hasattr(doc, 'text'):
-            text = doc.text.lower()
-        else:
-            text = str(doc).lower()
-
-        # Create a set of all words in the text for faster lookup
-        words_in_text = set(re.findall(r'\b\w+\b', text))
-        
-        # Also check for multi-word skills
-        text_lower = text.lower()
-
-        for keyword in skills_keywords:
-            if not keyword or not keyword.strip():
-                continue
-                
-            keyword_lower = keyword.lower().strip()
-            
-            # Skip if keyword is too short or invalid
-            if len(keyword_lower) < 2:
-                continue
-            
-            # Match whole word only (not substring)
-            # Check if keyword appears as a whole word in text
-            pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-            if re.search(pattern, text_lower):
-                # Additional validation
-                if is_valid_skill(keyword):
-                    skills.add(keyword)
-
-        return skills
+        # One linear pass over the text finds every whole-word skill, multi-word ones included
+        gazetteer = get_skill_gazetteer()
+        mentions = analyze_resume(doc).skill_mentions
+        return set(validate_skills(keyword for normalized in mentions for keyword in gazetteer.originals(normalized)))
     except Exception as e:
         if 'st' in globals():
             st.warning(f"Error loading skills from CSV: {e}")
         return set()
 
 # Load NER model with error handling (lazy loading to avoid import-time errors)
-_nlp_skills_cache = None
-_nlp_skills_load_attempted = False
+def _load_skills_model():
+    global spacy
+    if spacy is None:
+        import spacy
+    return spacy.load(SKILLS_MODEL_PATH)
 
 def get_nlp_skills_model():
     """Lazy load NER model to avoid import-time errors"""
-    global _nlp_skills_cache, _nlp_skills_load_attempted
-    
-    if _nlp_skills_load_attempted:
-        return _nlp_skills_cache if _nlp_skills_cache else None
-    
-    _nlp_skills_load_attempted = True
-    
-    try:
-        _nlp_skills_cache = spacy.load('TrainedModel/skills')
-        return _nlp_skills_cache
-    except Exception as e:
-        # Silently fail - will use CSV skills only
-        _nlp_skills_cache = None
-        # Don't show warning at import time, only when actually used
-        return None
+    # A failed load is remembered by the registry - will use CSV skills only
+    return model_registry.get_model(SKILLS_MODEL_PATH, _load_skills_model)
 
 def extract_skills_from_ner(doc):
-    nlp_skills_model = get_nlp_skills_model()
-    if nlp_skills_model is None:
+    # Skills-model entities are cached on the analysis, so the text is tokenized once
+    analysis = analyze_resume(doc)
+    if not analysis.skill_entities:
         return set()
-    
+
     non_skill_labels = {'DATE', 'TIME', 'PERCENT', 'MONEY', 'QUANTITY', 'ORDINAL', 'CARDINAL', 'EMAIL'}
     common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can'}
     
     skills = set()
     
-    # Get text from doc object
-    if hasattr(doc, 'text'):
-        text = doc.text
-    else:
-        text = str(doc)
-    
     try:
-        for ent in nlp_skills_model(text).ents:
-            if ent.label_ == 'SKILL':
-                skill_text = ent.text.strip()
+        for ent_text, ent_label in analysis.skill_entities:
+            if ent_label == 'SKILL':
+                skill_text = ent_text.strip()
                 skill_lower = skill_text.lower()
                 
                 # Filter out common words, numbers, and very short skills
@@ -408,253 +567,173 @@ def extract_skills_from_ner(doc):
     
     return skills
 
-def is_valid_skill(skill_text):
-    """Enhanced validation for skills - filters out non-skill items"""
-    if not skill_text or len(skill_text) < 2:
-        return False
-    
-    skill_text = skill_text.strip()
+# Skill validation rules, compiled once. Exact (lowercased) non-skills: filler words,
+# section labels, months, cities and employment-status words.
+NON_SKILL_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from',
+    'as', 'is', 'was', 'are', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
+    'admin', 'present', 'remote', 'built', 'conducted', 'optimized', 'resolved', 'stored', 'working',
+    'other', 'skills', 'pre', 'learning', 'certificate', 'consultant', 'inspection', 'labs',
+    'other skills', 'technical skills', 'core skills', 'key skills', 'professional skills',
+    'linkedin learning', 'online learning', 'development certificate', 'research consultant',
+    'acg inspection', 'data labs', 'l4 cloud', 'software developer', 'software engineer',
+    'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+    'jan.', 'feb.', 'mar.', 'apr.', 'may.', 'jun.', 'jul.', 'aug.', 'sep.', 'oct.', 'nov.', 'dec.',
+    'bengaluru', 'hyderabad', 'mumbai', 'delhi', 'bangalore', 'pune', 'chennai',
+    'kolkata', 'ahmedabad', 'jaipur', 'lucknow', 'kanpur', 'nagpur', 'indore',
+    'thane', 'bhopal', 'visakhapatnam', 'patna', 'vadodara', 'ghaziabad',
+    '-bengaluru', '-hyderabad', '-mumbai', '-delhi', '-bangalore', '-pune',
+    'full-time', 'part-time', 'contract', 'internship', '-present', '-remote', '-full', '-part',
+    'current', '-current',
+})
+# Short skills allowed despite the three-character minimum
+SHORT_SKILLS = frozenset({'ai', 'ui', 'ux', 'os', 'db', 'ml', 'dl', 'nlp', 'api'})
+# Anywhere in the lowercased text: section labels, email/domain fragments, 3+ digit runs
+# (phones, years), city-with-dash locations, status markers, organizations, companies and
+# non-skill job-title suffixes
+INVALID_SKILL_PATTERN = re.compile(
+    r"other skills|technical skills|core skills|key skills"
+    r"|@|\.com|\.in|\d{3}"
+    r"|-(?:bengaluru|hyderabad|mumbai|delhi|present|remote)"
+    r"|(?s:^(?=.*-).*?(?:bengaluru|hyderabad|mumbai|delhi|bangalore|pune))"
+    r"|institute|university|college"
+    r"|microsoft|google|amazon|goldman|sachs|apple|meta|facebook|netflix|uber|airbnb|tesla|nvidia|oracle|ibm|adobe"
+    r"|^nov\.|nov\.\Z"
+    r"|(?: learning| certificate| consultant| inspection| labs| developer| engineer)\Z")
+# On the original text (case-sensitive): leading bullets/symbols or contact-detail
+# fragments, dangling dashes, and no ASCII letter at all
+INVALID_SKILL_SHAPE = re.compile(r"^(?:[•:()@+-]|roushan|kumar|yadav|gmail|com)|-\Z|^[^a-zA-Z]*\Z")
+SKILL_VALIDATION_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=SKILL_VALIDATION_CACHE_SIZE)
+def _is_valid_stripped_skill(skill_text):
     skill_lower = skill_text.lower()
-    
-    # Common words to exclude
-    common_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 
-        'as', 'is', 'was', 'are', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 
-        'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 
-        'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
-        'admin', 'present', 'remote', 'built', 'conducted', 'optimized', 'resolved', 'stored', 'working',
-        'other', 'skills', 'pre', 'jul', 'nov', 'sep', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'aug', 'oct', 'dec',
-        'learning', 'certificate', 'consultant', 'inspection', 'labs'
-    }
-    
-    # Phrases that are NOT skills (section headers, labels, etc.)
-    non_skill_phrases = {
-        'other skills', 'technical skills', 'core skills', 'key skills', 'professional skills',
-        'linkedin learning', 'online learning', 'development certificate', 'research consultant',
-        'acg inspection', 'data labs', 'l4 cloud', 'software developer', 'software engineer'
-    }
-    
-    # Check if it's a non-skill phrase
-    if skill_lower in non_skill_phrases:
+    if skill_lower in NON_SKILL_WORDS:
         return False
-    
-    # Check if it contains non-skill words
-    if any(phrase in skill_lower for phrase in ['other skills', 'technical skills', 'core skills', 'key skills']):
+    if len(skill_text) < 3 and skill_lower not in SHORT_SKILLS:
         return False
-    
-    # Exclude if it ends with common non-skill suffixes
-    non_skill_suffixes = [' learning', ' certificate', ' consultant', ' inspection', ' labs', ' developer', ' engineer']
-    if any(skill_lower.endswith(suffix) for suffix in non_skill_suffixes):
+    if INVALID_SKILL_SHAPE.search(skill_text) or INVALID_SKILL_PATTERN.search(skill_lower):
         return False
-    
-    # Exclude common words
-    if skill_lower in common_words:
-        return False
-    
-    # Exclude if it starts with common prefixes that indicate it's not a skill
-    invalid_prefixes = ['•', ':', '(', ')', '@', '+', 'roushan', 'kumar', 'yadav', 'gmail', 'com']
-    if any(skill_text.startswith(prefix) for prefix in invalid_prefixes):
-        return False
-    
-    # Exclude if it starts or ends with dash (location/status indicators)
-    if skill_text.startswith('-') or skill_text.endswith('-'):
-        return False
-    
-    # Exclude if it's a location pattern (starts with dash and city name)
-    if skill_text.startswith('-') and len(skill_text) > 1:
-        return False
-    
-    # Exclude if it contains email pattern
-    if '@' in skill_text or '.com' in skill_lower or '.in' in skill_lower:
-        return False
-    
-    # Exclude phone numbers (contains digits with dashes or spaces)
-    if re.search(r'\d{3,}', skill_text):  # 3 or more consecutive digits
-        return False
-    
-    # Exclude if it's all digits
-    if skill_text.replace('-', '').replace('.', '').isdigit():
-        return False
-    
-    # Exclude dates (patterns like 2021-, 2023-, -2021, etc.)
-    if re.search(r'\d{4}[-]?', skill_text) or re.search(r'[-]?\d{4}', skill_text):
-        return False
-    
-    # Exclude month abbreviations with dots (Nov., Dec., etc.)
-    if re.search(r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\.?$', skill_lower):
-        return False
-    
-    # Exclude if it contains location patterns (city names with dashes)
-    city_patterns = ['bengaluru', 'hyderabad', 'mumbai', 'delhi', 'bangalore', 'pune']
-    if any(city in skill_lower for city in city_patterns) and ('-' in skill_text or skill_text.startswith('-')):
-        return False
-    
-    # Exclude locations (common location indicators) - including with dashes
-    location_indicators = ['bengaluru', 'hyderabad', 'mumbai', 'delhi', 'bangalore', 'pune', 'chennai', 
-                          'kolkata', 'ahmedabad', 'jaipur', 'lucknow', 'kanpur', 'nagpur', 'indore',
-                          'thane', 'bhopal', 'visakhapatnam', 'patna', 'vadodara', 'ghaziabad',
-                          '-bengaluru', '-hyderabad', '-mumbai', '-delhi', '-bangalore', '-pune']
-    if skill_lower in location_indicators or any(loc in skill_lower for loc in ['-bengaluru', '-hyderabad', '-mumbai', '-delhi']):
-        return False
-    
-    # Exclude status words
-    status_words = ['present', 'remote', 'full-time', 'part-time', 'contract', 'internship', 
-                    '-present', '-remote', '-full', '-part', 'current', '-current']
-    if skill_lower in status_words or any(sw in skill_lower for sw in ['-present', '-remote']):
-        return False
-    
-    # Exclude month abbreviations
-    month_abbrevs = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
-                     'jan.', 'feb.', 'mar.', 'apr.', 'may.', 'jun.', 'jul.', 'aug.', 'sep.', 'oct.', 'nov.', 'dec.']
-    if skill_lower in month_abbrevs or skill_lower.endswith('nov.') or skill_lower.startswith('nov.'):
-        return False
-    
-    # Exclude organization/institute names
-    org_keywords = ['national institute', 'institute of technology', 'university', 'college', 
-                   'national institute of', 'institute']
-    if any(org in skill_lower for org in org_keywords):
-        return False
-    
-    # Exclude company names (common companies)
-    company_names = ['microsoft', 'google', 'amazon', 'goldman', 'sachs', 'apple', 'meta', 'facebook',
-                    'netflix', 'uber', 'airbnb', 'tesla', 'nvidia', 'oracle', 'ibm', 'adobe']
-    if any(company in skill_lower for company in company_names):
-        return False
-    
-    # Exclude if it's mostly special characters
-    alnum_count = sum(1 for c in skill_text if c.isalnum())
-    if alnum_count < len(skill_text) * 0.6:  # At least 60% should be alphanumeric
-        return False
-    
-    # Exclude single character or very short non-meaningful words
-    if len(skill_text) < 3 and skill_lower not in ['ai', 'ui', 'ux', 'os', 'db', 'ml', 'dl', 'nlp', 'api']:
-        return False
-    
-    # Exclude if it contains only special characters and numbers
-    if not any(c.isalpha() for c in skill_text):
-        return False
-    
-    # Must contain at least one letter
-    if not re.search(r'[a-zA-Z]', skill_text):
-        return False
-    
-    return True
+    # At least 60% of the characters must be alphanumeric
+    return sum(1 for c in skill_text if c.isalnum()) >= len(skill_text) * 0.6
 
-def extract_skills(doc):
-    # Get skills from CSV (more reliable)
-    skills_csv = csv_skills(doc)
-    
-    # Get skills from NER (may have false positives)
-    skills_ner = extract_skills_from_ner(doc)
-    
-    # Filter both sets with strict validation
-    filtered_skills_csv = set()
-    for skill in skills_csv:
-        if is_valid_skill(skill):
-            # Clean the skill text
-            cleaned_skill = skill.strip()
-            # Remove leading/trailing special characters
-            cleaned_skill = re.sub(r'^[-•:()]+|[-•:()]+$', '', cleaned_skill)
-            # Remove leading dashes (location/status indicators)
-            cleaned_skill = cleaned_skill.lstrip('-')
-            if cleaned_skill and is_valid_skill(cleaned_skill):
-                filtered_skills_csv.add(cleaned_skill)
-    
-    filtered_skills_ner = set()
-    for skill in skills_ner:
-        if is_valid_skill(skill):
-            # Clean the skill text
-            cleaned_skill = skill.strip()
-            # Remove leading/trailing special characters
-            cleaned_skill = re.sub(r'^[-•:()]+|[-•:()]+$', '', cleaned_skill)
-            # Remove leading dashes
-            cleaned_skill = cleaned_skill.lstrip('-')
-            if cleaned_skill and is_valid_skill(cleaned_skill):
-                filtered_skills_ner.add(cleaned_skill)
-    
-    # Prioritize CSV skills, add NER skills that are not in CSV
-    combined_skills = filtered_skills_csv.copy()
-    
-    # Only add NER skills that are not already in CSV and are meaningful
-    for ner_skill in filtered_skills_ner:
-        skill_lower = ner_skill.lower()
-        # Check if this skill or similar is already in CSV
-        if not any(skill_lower == csv_skill.lower() for csv_skill in filtered_skills_csv):
-            # Additional validation
-            if len(ner_skill) >= 3 and is_valid_skill(ner_skill):
-                combined_skills.add(ner_skill)
-    
-    # Final cleanup - remove any remaining invalid items
-    final_skills = []
-    invalid_patterns = [
-        r'^-',  # Starts with dash
-        r'-$',  # Ends with dash
-        r'\b(nov|dec|jan|feb|mar|apr|may|jun|jul|aug|sep|oct)\.?\b',  # Month abbreviations
-        r'\b(bengaluru|hyderabad|mumbai|delhi|bangalore|pune)\b',  # City names
-        r'\b(present|remote|full-time|part-time)\b',  # Status words
-        r'\b(national institute|institute of technology|university|college)\b',  # Organizations
-    ]
-    
-    # Non-skill phrases to exclude
-    non_skill_phrases = {
-        'other skills', 'technical skills', 'core skills', 'key skills', 'professional skills',
-        'linkedin learning', 'online learning', 'development certificate', 'research consultant',
-        'acg inspection', 'data labs', 'l4 cloud', 'software developer', 'software engineer',
-        'feature engineering', 'model evaluation'
-    }
-    
-    for skill in combined_skills:
-        skill_lower = skill.lower().strip()
-        
-        # Skip if it's a known non-skill phrase
-        if skill_lower in non_skill_phrases:
-            continue
-        
-        # Skip if it contains non-skill keywords
-        if any(phrase in skill_lower for phrase in ['other skills', 'technical skills', 'learning', 'certificate', 'consultant', 'inspection', 'labs']):
-            # But allow if it's a valid technical term (like "machine learning")
-            if skill_lower not in ['machine learning', 'deep learning', 'reinforcement learning']:
-                continue
-        
-        # Check against invalid patterns
-        is_invalid = False
-        for pattern in invalid_patterns:
-            if re.search(pattern, skill_lower):
-                is_invalid = True
-                break
-        
-        if not is_invalid and is_valid_skill(skill):
-            final_skills.append(skill)
-    
-    # Sort and return as list (limit to top 30 most relevant)
-    return sorted(list(set(final_skills)), key=str.lower)[:30]
 
-# --------------------------------------------------------------------------------
+def is_valid_skill(skill_text):
+    """Enhanced validation for skills - filters out non-skill items"""
+    if not skill_text:
+        return False
+    # Memoized on the stripped text; short raw strings are rejected by the length rule there
+    return _is_valid_stripped_skill(skill_text.strip())
+
+
+def validate_skills(skills):
+    """The skills that pass is_valid_skill, in their original order"""
+    return [skill for skill in skills if is_valid_skill(skill)]
+
+# Leading/trailing bullets and punctuation left over from PDF extraction
+SKILL_EDGE_PATTERN = re.compile(r'^[-•:()]+|[-•:()]+$')
+# Final cleanup, one pattern over the lowercased skill: dangling dashes, months, cities,
+# status words, organizations and section-label or non-skill keywords
+FINAL_SKILL_EXCLUSIONS = re.compile(
+    r"^-|-$"
+    r"|\b(?:nov|dec|jan|feb|mar|apr|may|jun|jul|aug|sep|oct)\.?\b"
+    r"|\b(?:bengaluru|hyderabad|mumbai|delhi|bangalore|pune)\b"
+    r"|\b(?:present|remote|full-time|part-time)\b"
+    r"|\b(?:national institute|institute of technology|university|college)\b"
+    r"|other skills|technical skills|learning|certificate|consultant|inspection|labs")
+NON_SKILL_TOPICS = frozenset({'feature engineering', 'model evaluation'})
+# Ranking: how much each source vouches for a skill (a skill found by both adds up)
+SKILL_SOURCE_CONFIDENCE = {'csv': 1.0, 'ner': 0.6}
+SKILLS_TOP_N = 30
+
+
+def _clean_skill(skill):
+    """Strip edge punctuation; None if the skill is invalid before or after cleaning"""
+    if not is_valid_skill(skill):
+        return None
+    cleaned = SKILL_EDGE_PATTERN.sub('', skill.strip()).lstrip('-')
+    return cleaned if cleaned and is_valid_skill(cleaned) else None
+
+
+def extract_skills(doc, top_n=SKILLS_TOP_N):
+    """Validated skills ranked by confidence (vocabulary > NER, both > either) then frequency.
+
+    top_n=None returns every skill. Spellings that differ only in case are
+    merged into one entry, preferring the vocabulary spelling.
+    """
+    analysis = analyze_resume(doc)
+    ner_counts = {}
+    for ent_text, ent_label in analysis.skill_entities:
+        if ent_label == 'SKILL':
+            key = ent_text.strip().casefold()
+            ner_counts[key] = ner_counts.get(key, 0) + 1
+
+    # casefold key -> [spelling, sources, frequency]; vocabulary skills come first so their spelling wins
+    merged = {}
+    for source, skills in (('csv', csv_skills(analysis)), ('ner', extract_skills_from_ner(analysis))):
+        for skill in sorted(skills):
+            cleaned = _clean_skill(skill)
+            if cleaned is None or (source == 'ner' and len(cleaned) < 3):
+                continue
+            entry = merged.setdefault(cleaned.casefold(), [cleaned, set(), 1])
+            entry[1].add(source)
+            if source == 'csv':
+                frequency = analysis.skill_mentions.get(skill.strip().lower(), 0)
+            else:
+                frequency = ner_counts.get(skill.strip().casefold(), 0)
+            entry[2] = max(entry[2], frequency)
+
+    ranked = []
+    for key, (skill, sources, frequency) in merged.items():
+        if key in NON_SKILL_TOPICS or FINAL_SKILL_EXCLUSIONS.search(key):
+            continue
+        confidence = sum(SKILL_SOURCE_CONFIDENCE[source] for source in sources)
+        ranked.append((-confidence, -frequency, key, skill))
+    ranked.sort()
+    if top_n is not None:
+        ranked = ranked[:top_n]
+    return [skill for _, _, _, skill in ranked]
 
 # ----------------------------------Extract Major---------------------------------
 def extract_major(doc):
-    major_keywords = load_keywords('data/majors.csv')
+    text_lower = analyze_resume(doc).lower
 
-    for keyword in major_keywords:
-        if keyword.lower() in doc.text.lower():
+    for keyword, keyword_lower in reference_data.get_table('majors'):
+        if keyword_lower in text_lower:
             return keyword
 
     return ""
 # --------------------------------------------------------------------------------
 
 # --------------------------------Extract Experience-------------------------------
+# Without a tagger, the words of the experience sections stand in for verbs
+WORD_PATTERN = re.compile(r"[A-Za-z]+")
+
 def extract_experience(doc):
-    verbs = [token.text for token in doc if token.pos_ == 'VERB']
+    analysis = analyze_resume(doc)
+    # Verbs from the experience and project sections only (not the objective or hobbies)
+    section_docs = analysis.section_docs(EXPERIENCE_SECTIONS)
+    if section_docs:
+        verbs = [token.text for section_doc in section_docs for token in section_doc if token.pos_ == 'VERB']
+    else:
+        # No spaCy (fast profile or model missing)
+        verbs = WORD_PATTERN.findall(analysis.section_text(EXPERIENCE_SECTIONS) or analysis.text)
+    # Surface forms only, as written: lemmas depend on whether the profile runs the
+    # lemmatizer, and the level must not change with the profile
+    verb_forms = set(verbs)
 
     senior_keywords = ['lead', 'manage', 'direct', 'oversee', 'supervise', 'orchestrate', 'govern']
     mid_senior_keywords = ['develop', 'design', 'analyze', 'implement', 'coordinate', 'execute', 'strategize']
     mid_junior_keywords = ['assist', 'support', 'collaborate', 'participate', 'aid', 'facilitate', 'contribute']
     
-    if any(keyword in verbs for keyword in senior_keywords):
+    if any(keyword in verb_forms for keyword in senior_keywords):
         level_of_experience = "Senior"
-    elif any(keyword in verbs for keyword in mid_senior_keywords):
+    elif any(keyword in verb_forms for keyword in mid_senior_keywords):
         level_of_experience = "Mid-Senior"
-    elif any(keyword in verbs for keyword in mid_junior_keywords):
+    elif any(keyword in verb_forms for keyword in mid_junior_keywords):
         level_of_experience = "Mid-Junior"
     else:
         level_of_experience = "Entry Level"
@@ -676,37 +755,42 @@ def load_positions_keywords(file_path):
         reader = csv.DictReader(file)
         for row in reader:
             position = row['position']
-            keywords = [keyword.lower()
+            keywords = [keyword.strip().lower()
                         for keyword in row['keywords'].split(',')]
             positions_keywords[position] = keywords
     return positions_keywords
 
 
 def suggest_position(verbs):
-    positions_keywords = load_positions_keywords('data/position.csv')
-    verbs = [verb.lower() for verb in verbs]
+    positions_keywords = reference_data.get_table('positions')
+    verbs = {verb.lower() for verb in verbs}
     for position, keywords in positions_keywords.items():
-        if any(keyword in verbs for keyword in keywords):
+        if not keywords.isdisjoint(verbs):
             return position
 
     return "Position Not Identified"
 
 
-def extract_resume_info_from_pdf(uploaded_file):
-    doc = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-    text = ""
-    for page_num in range(doc.page_count):
-        page = doc[page_num]
-        text += page.get_text()
-    nlp_model = get_nlp()
-    if nlp_model is None:
-        # Return a mock doc-like object if model not available
-        class MockDoc:
-            def __init__(self, text):
-                self.text = text
-                self.ents = []
-        return MockDoc(text)
-    return nlp_model(text)
+def extract_text_from_pdf(uploaded_file):
+    # Pages are joined once and the fitz document is closed as soon as we're done
+    return pdf_text.extract_text(uploaded_file)
+
+
+def extract_resume_info_from_pdf(uploaded_file, profile=DEFAULT_PARSING_PROFILE):
+    return process_resume_text(extract_text_from_pdf(uploaded_file), profile=profile)
+
+
+def process_resume_text(text, profile=DEFAULT_PARSING_PROFILE):
+    """Run text through a parsing profile's spaCy pipeline, wrapped in a ResumeAnalysis for that profile.
+
+    Under 'fast' (or without the model) nothing is parsed and every
+    extractor falls back to text heuristics.
+    """
+    pipeline_profile, _ = parsing_profile_settings(profile)
+    nlp_model = get_nlp() if pipeline_profile is not None else None
+    if nlp_model is not None:
+        text = nlp_model(text, disable=disabled_pipes_for(nlp_model, pipeline_profile))
+    return analyze_resume_for(text, profile)
 
 
 def show_colored_skills(skills):
@@ -715,7 +799,7 @@ def show_colored_skills(skills):
         return
     
     # Filter out any remaining invalid skills
-    valid_skills = [skill for skill in skills if is_valid_skill(skill)]
+    valid_skills = validate_skills(skills)
     
     if not valid_skills:
         st.info("📭 No valid skills found after filtering. Please check your resume format.")
@@ -744,33 +828,119 @@ def calculate_resume_score(resume_info):
     return score
 
 
-def extract_resume_info(doc):
-    first_lines = '\n'.join(doc.text.splitlines()[:10])
-    first_name, last_name = extract_name(doc)
-    email = extract_email(doc)
-    skills = extract_skills(doc)
-    degree_major = extract_major(doc)
-    experience = extract_experience(doc)
+def extract_resume_info(doc, profile=DEFAULT_PARSING_PROFILE):
+    """Every field of a resume under a parsing profile (ignored if doc is already a ResumeAnalysis)"""
+    # Every extractor reads the same per-document analysis
+    analysis = analyze_resume_for(doc, profile)
+    header = extract_header_fields(analysis)
+    # Every skill is kept for the recruiters' skill index; the page shows the top SKILLS_TOP_N
+    all_skills = extract_skills(analysis, top_n=None)
+    degree_major = extract_major(analysis)
+    experience = extract_experience(analysis)
+    education = extract_education_from_resume(analysis)
 
-    return {'first_name': first_name, 'last_name': last_name, 'email': email, 'degree_major': degree_major, 'skills': skills, 'experience': experience}
+    return {'first_name': header['first_name'], 'last_name': header['last_name'], 'email': header['email'], 'degree_major': degree_major, 'skills': all_skills[:SKILLS_TOP_N], 'all_skills': all_skills, 'experience': experience,
+            'contact_number': header['contact_number'], 'education': education, 'contact': header['contact']}
 
 
-def suggest_skills_for_job(desired_job):
+# Bump whenever extractor logic changes so cached parse results are not reused
+PARSER_VERSION = '12'
+# Reference tables whose contents shape parse output (part of the pipeline version)
+EXTRACTION_TABLES = ('skill_gazetteer', 'majors', 'positions')
+
+@lru_cache(maxsize=None)
+def _model_version(model_name):
+    try:
+        if os.path.isdir(model_name):
+            with open(os.path.join(model_name, 'meta.json'), encoding='utf-8') as meta:
+                return json.load(meta).get('version', 'unknown')
+        from importlib.metadata import version
+        return version(model_name)
+    except Exception:
+        return 'missing'
+
+def pipeline_version(profile=DEFAULT_PARSING_PROFILE):
+    """Identifies everything that shapes parse output; used as part of the parse-cache key"""
+    pipeline_profile, skills_model = parsing_profile_settings(profile)
+    # Vocabulary CSV edits change what the extractors find
+    parts = [PARSER_VERSION, profile, f"data={reference_data.fingerprint(EXTRACTION_TABLES)}"]
+    # Models a profile never loads do not invalidate its cached results
+    if pipeline_profile is not None:
+        parts.append(f"{SPACY_MODEL_NAME}={_model_version(SPACY_MODEL_NAME)}")
+    if skills_model:
+        parts.append(f"skills={_model_version(SKILLS_MODEL_PATH)}")
+    return '|'.join(parts)
+
+def warm_models(profile=DEFAULT_PARSING_PROFILE):
+    """Load the models a parsing profile uses (e.g. once per worker process)"""
+    pipeline_profile, skills_model = parsing_profile_settings(profile)
+    if pipeline_profile is not None:
+        get_nlp()
+    if skills_model:
+        get_nlp_skills_model()
+
+def parse_resume(pdf_bytes, profile=DEFAULT_PARSING_PROFILE, timings=None, layout=None):
+    """Parse a PDF into the JSON-serializable result shared by the UI and the parse cache.
+
+    profile is a PARSING_PROFILES name: 'fast' for bulk triage without any
+    model, 'accurate' for the best result.
+
+    If a timings dict is given, per-stage wall time in seconds is recorded
+    under 'pdf_text', 'segment' and 'extract'. The text is read with its
+    layout (font sizes, columns), so headings and the name line come from
+    the PDF itself. It is not run through spaCy up front: extractors parse
+    only the sections they need, so model time is part of 'extract'. A
+    caller that already read the layout of pdf_bytes can pass it in.
+    """
+    if timings is None:
+        timings = {}
+    start = time.perf_counter()
+    if layout is None:
+        layout = pdf_layout.extract_layout(pdf_bytes)
+    timings['pdf_text'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analysis = analyze_resume_for(layout.text, profile, layout=layout)
+    analysis.sections
+    timings['segment'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resume_info = extract_resume_info(analysis)
+    timings['extract'] = time.perf_counter() - start
+    return resume_info
+
+
+def _normalize_job_title(job_title):
+    return ' '.join(job_title.lower().split())
+
+
+def load_suggested_skills(file_path):
     job_skills_mapping = {}
-    
-    with open('data/sugestedSkills.csv', newline='') as csvfile:
+    with open(file_path, newline='') as csvfile:
         reader = csv.reader(csvfile)
         for row in reader:
-            job_title = row[0].lower()
+            if not row:
+                continue
+            job_title = _normalize_job_title(row[0])
             skills = row[1:]
             job_skills_mapping[job_title] = skills
-    
-    desired_job_lower = desired_job.lower()
-    if desired_job_lower in job_skills_mapping:
-        suggested_skills = job_skills_mapping[desired_job_lower]
-        return suggested_skills
-    else:
-        return []
+    return job_skills_mapping
+
+
+def suggest_skills_for_job(desired_job):
+    job_skills_mapping = reference_data.get_table('suggested_skills')
+    return list(job_skills_mapping.get(_normalize_job_title(desired_job), []))
+
+
+# Reference tables are parsed once per process and reloaded when their CSV changes
+reference_data.register('skill_gazetteer', os.path.join(DATA_DIR, 'newSkills.csv'),
+                        lambda path: SkillGazetteer(load_keywords(path)))
+reference_data.register('majors', os.path.join(DATA_DIR, 'majors.csv'),
+                        lambda path: tuple(sorted((keyword, keyword.lower()) for keyword in load_keywords(path))))
+reference_data.register('positions', os.path.join(DATA_DIR, 'position.csv'),
+                        lambda path: {position: frozenset(keywords)
+                                      for position, keywords in load_positions_keywords(path).items()})
+reference_data.register('suggested_skills', os.path.join(DATA_DIR, 'sugestedSkills.csv'), load_suggested_skills)
 
 
 '''
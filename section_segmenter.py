@@ -0,0 +1,79 @@
+import re
+
+# Canonical section -> headings that introduce it (matched case-insensitively as a whole line,
+# or as a "Heading:" prefix with content on the same line)
+SECTION_HEADINGS = {
+    'summary': ('summary', 'professional summary', 'profile', 'professional profile', 'about me',
+                'objective', 'career objective'),
+    'skills': ('skills', 'technical skills', 'key skills', 'core skills', 'skills and tools',
+               'skill set', 'skillset', 'core competencies', 'competencies', 'technologies',
+               'tools and technologies', 'technical expertise'),
+    'experience': ('experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'internships', 'internship', 'internship experience'),
+    'education': ('education', 'academic background', 'academics', 'academic qualifications',
+                  'educational qualifications', 'qualifications', 'education and training'),
+    'projects': ('projects', 'academic projects', 'personal projects', 'key projects', 'project experience'),
+    'certifications': ('certifications', 'certification', 'certificates', 'licenses and certifications',
+                       'courses', 'training'),
+    'achievements': ('achievements', 'awards', 'honors', 'honours', 'awards and achievements'),
+    'hobbies': ('hobbies', 'interests', 'hobbies and interests', 'extracurricular activities'),
+    'languages': ('languages',),
+}
+
+_HEADING_TO_SECTION = {heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings}
+_HEADING_ALTERNATION = '|'.join(
+    # Longest first so "work experience" wins over "experience"; "and" also accepts "&"
+    re.sub(r'\band\b', '(?:and|&)', re.escape(heading).replace(r'\ ', r'[ \t]+'))
+    for heading in sorted(_HEADING_TO_SECTION, key=len, reverse=True))
+# A heading line: optional bullet/decoration, the heading, then end of line or a colon
+HEADING_PATTERN = re.compile(
+    rf"^[ \t]*[^\w\s]{{0,3}}[ \t]*(?P<heading>{_HEADING_ALTERNATION})[ \t]*(?::|[ \t]*$)",
+    re.IGNORECASE | re.MULTILINE)
+
+
+def _canonical(heading):
+    return _HEADING_TO_SECTION[' '.join(heading.lower().replace('&', 'and').split())]
+
+
+def find_headings(text):
+    """Heading lines as (heading_start, body_start, name) in document order"""
+    return [(match.start(), match.end(), _canonical(match.group('heading')))
+            for match in HEADING_PATTERN.finditer(text)]
+
+
+def find_sections(text, headings=None):
+    """Section spans as (name, heading_start, start, end) in document order.
+
+    start/end delimit the section body (after the heading, up to the next
+    heading or the end of the text). Text before the first heading is the
+    header (name, contact details) and is not a section. headings defaults
+    to find_headings(text); callers that know more about the document
+    (e.g. PDF font styles) can pass their own.
+    """
+    if headings is None:
+        headings = find_headings(text)
+    sections = []
+    for idx, (heading_start, body_start, name) in enumerate(headings):
+        end = headings[idx + 1][0] if idx + 1 < len(headings) else len(text)
+        sections.append((name, heading_start, body_start, end))
+    return sections
+
+
+def section_spans(text, headings=None):
+    """Map each section name to its (start, end) body spans; a section can appear more than once"""
+    spans = {}
+    for name, _, start, end in find_sections(text, headings):
+        spans.setdefault(name, []).append((start, end))
+    return spans
+
+
+def header_end(text, max_chars, headings=None):
+    """End of the header block: the first section heading or max_chars (extended to the end
+    of that line), whichever comes first"""
+    limit = text.find('\n', max_chars) if len(text) > max_chars else -1
+    if limit == -1:
+        limit = len(text)
+    if headings is not None:
+        return min(headings[0][0], limit) if headings else limit
+    match = HEADING_PATTERN.search(text, 0, limit)
+    return min(match.start(), limit) if match else limit
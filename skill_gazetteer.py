@@ -0,0 +1,101 @@
+from collections import Counter, deque
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class SkillGazetteer:
+    """Aho-Corasick automaton over a keyword vocabulary.
+
+    Finds every whole-word occurrence of every keyword (multi-word ones
+    included) in a single pass over the text, instead of one regex scan
+    per keyword.
+    """
+
+    def __init__(self, keywords, min_length=2):
+        # Normalized keyword -> original spellings (the CSVs contain case variants)
+        self._originals = {}
+        for keyword in keywords:
+            if not keyword:
+                continue
+            normalized = keyword.strip().lower()
+            if len(normalized) < min_length:
+                continue
+            self._originals.setdefault(normalized, []).append(keyword.strip())
+
+        self._patterns = list(self._originals)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._build()
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def _build(self):
+        # Trie of all patterns
+        for pattern_idx, pattern in enumerate(self._patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern_idx)
+
+        # Failure links, breadth first
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _is_whole_word(self, text, start, end):
+        # Word-character edges of a keyword must not touch another word character.
+        # Edges like the "+" of "C++" or ")" of "Amazon Web Services (AWS)" are
+        # already delimiters and need no boundary.
+        if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def iter_matches(self, text):
+        """Yield (start, end, normalized_keyword) for every whole-word match in text."""
+        text = text.lower()
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self._patterns
+        state = 0
+        for idx, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_idx in output[state]:
+                pattern = patterns[pattern_idx]
+                start = idx - len(pattern) + 1
+                if self._is_whole_word(text, start, idx + 1):
+                    yield start, idx + 1, pattern
+
+    def find(self, text):
+        """Return the set of original keywords that occur in text as whole words."""
+        found = set()
+        for normalized in {match[2] for match in self.iter_matches(text)}:
+            found.update(self._originals[normalized])
+        return found
+
+    def count(self, text):
+        """Return a Counter of normalized keyword -> number of whole-word matches in text."""
+        return Counter(match[2] for match in self.iter_matches(text))
+
+    def originals(self, normalized):
+        """Original spellings of a normalized keyword."""
+        return list(self._originals.get(normalized, ()))
@@ -0,0 +1,55 @@
+from functools import lru_cache
+
+from skill_gazetteer import SkillGazetteer
+
+# Distinct required-skill sets whose compiled matchers are kept
+SKILL_MATCHER_CACHE_SIZE = 32
+
+
+def _normalize_skill(skill):
+    return ' '.join(skill.lower().split())
+
+
+# Compiled once per (model, distinct skill set) and reused across resumes, batches and reruns
+@lru_cache(maxsize=SKILL_MATCHER_CACHE_SIZE)
+def get_skill_matcher(nlp_model, skills):
+    """PhraseMatcher on LOWER for a frozenset of normalized skills; match ids map back to the skill"""
+    from spacy.matcher import PhraseMatcher
+    matcher = PhraseMatcher(nlp_model.vocab, attr="LOWER")
+    for skill in skills:
+        # Tokenize like the resumes, so "machine learning", "node.js" and "c++" match token for token
+        matcher.add(skill, [nlp_model.make_doc(skill)])
+    return matcher
+
+
+@lru_cache(maxsize=SKILL_MATCHER_CACHE_SIZE)
+def get_skill_gazetteer(skills):
+    """Whole-word matcher for a frozenset of normalized skills, for resumes that were not tokenized"""
+    return SkillGazetteer(skills, min_length=1)
+
+
+def extract_skills(doc, required_skills, nlp_model):
+    """The required skills (single- or multi-word, as spelled by the caller) found in doc.
+
+    Uses a cached PhraseMatcher over a tokenized doc, or, with no model
+    (the fast profile), a cached gazetteer over the raw text.
+    """
+    originals = {}
+    for skill in required_skills:
+        normalized = _normalize_skill(skill)
+        if normalized:
+            originals.setdefault(normalized, set()).add(skill)
+    if not originals:
+        return set()
+
+    if nlp_model is None:
+        skills_found = set()
+        for normalized in get_skill_gazetteer(frozenset(originals)).count(doc.text):
+            skills_found.update(originals[normalized])
+        return skills_found
+
+    matcher = get_skill_matcher(nlp_model, frozenset(originals))
+    skills_found = set()
+    for match_id, _, _ in matcher(doc):
+        skills_found.update(originals[nlp_model.vocab.strings[match_id]])
+    return skills_found
@@ -0,0 +1,23 @@
+import pytest
+
+import parse_cache
+from modules import blob_store, storage
+
+
+@pytest.fixture
+def isolated_storage(tmp_path, monkeypatch):
+    """Point the stores at tmp_path/data with fresh connection pools, so the .db files are created there"""
+    data_dir = tmp_path / 'data'
+    moved = {blob_store.DB_PATH: str(data_dir / 'user_pdfs.db'),
+             parse_cache.PARSE_CACHE_PATH: str(data_dir / 'parse_cache.db')}
+    storage.close_all()
+    monkeypatch.setattr(blob_store, 'DB_PATH', moved[blob_store.DB_PATH])
+    monkeypatch.setattr(blob_store, 'BLOB_ROOT', str(data_dir / 'blobs'))
+    monkeypatch.setattr(parse_cache, 'PARSE_CACHE_PATH', moved[parse_cache.PARSE_CACHE_PATH])
+    # Migrations registered at import time are keyed by the real paths
+    monkeypatch.setattr(storage, '_migrations', {moved.get(path, path): steps
+                                                 for path, steps in storage._migrations.items()})
+    monkeypatch.setattr(storage, '_pools', {})
+    monkeypatch.setattr(storage, '_migrated', set())
+    yield tmp_path
+    storage.close_all()
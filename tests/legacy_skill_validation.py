@@ -0,0 +1,135 @@
+"""is_valid_skill as it was before the rules were compiled; the reference for the equivalence test"""
+import re
+
+
+def is_valid_skill(skill_text):
+    """Enhanced validation for skills - filters out non-skill items"""
+    if not skill_text or len(skill_text) < 2:
+        return False
+    
+    skill_text = skill_text.strip()
+    skill_lower = skill_text.lower()
+    
+    # Common words to exclude
+    common_words = {
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 
+        'as', 'is', 'was', 'are', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 
+        'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 
+        'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them',
+        'admin', 'present', 'remote', 'built', 'conducted', 'optimized', 'resolved', 'stored', 'working',
+        'other', 'skills', 'pre', 'jul', 'nov', 'sep', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'aug', 'oct', 'dec',
+        'learning', 'certificate', 'consultant', 'inspection', 'labs'
+    }
+    
+    # Phrases that are NOT skills (section headers, labels, etc.)
+    non_skill_phrases = {
+        'other skills', 'technical skills', 'core skills', 'key skills', 'professional skills',
+        'linkedin learning', 'online learning', 'development certificate', 'research consultant',
+        'acg inspection', 'data labs', 'l4 cloud', 'software developer', 'software engineer'
+    }
+    
+    # Check if it's a non-skill phrase
+    if skill_lower in non_skill_phrases:
+        return False
+    
+    # Check if it contains non-skill words
+    if any(phrase in skill_lower for phrase in ['other skills', 'technical skills', 'core skills', 'key skills']):
+        return False
+    
+    # Exclude if it ends with common non-skill suffixes
+    non_skill_suffixes = [' learning', ' certificate', ' consultant', ' inspection', ' labs', ' developer', ' engineer']
+    if any(skill_lower.endswith(suffix) for suffix in non_skill_suffixes):
+        return False
+    
+    # Exclude common words
+    if skill_lower in common_words:
+        return False
+    
+    # Exclude if it starts with common prefixes that indicate it's not a skill
+    invalid_prefixes = ['•', ':', '(', ')', '@', '+', 'roushan', 'kumar', 'yadav', 'gmail', 'com']
+    if any(skill_text.startswith(prefix) for prefix in invalid_prefixes):
+        return False
+    
+    # Exclude if it starts or ends with dash (location/status indicators)
+    if skill_text.startswith('-') or skill_text.endswith('-'):
+        return False
+    
+    # Exclude if it's a location pattern (starts with dash and city name)
+    if skill_text.startswith('-') and len(skill_text) > 1:
+        return False
+    
+    # Exclude if it contains email pattern
+    if '@' in skill_text or '.com' in skill_lower or '.in' in skill_lower:
+        return False
+    
+    # Exclude phone numbers (contains digits with dashes or spaces)
+    if re.search(r'\d{3,}', skill_text):  # 3 or more consecutive digits
+        return False
+    
+    # Exclude if it's all digits
+    if skill_text.replace('-', '').replace('.', '').isdigit():
+        return False
+    
+    # Exclude dates (patterns like 2021-, 2023-, -2021, etc.)
+    if re.search(r'\d{4}[-]?', skill_text) or re.search(r'[-]?\d{4}', skill_text):
+        return False
+    
+    # Exclude month abbreviations with dots (Nov., Dec., etc.)
+    if re.search(r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\.?$', skill_lower):
+        return False
+    
+    # Exclude if it contains location patterns (city names with dashes)
+    city_patterns = ['bengaluru', 'hyderabad', 'mumbai', 'delhi', 'bangalore', 'pune']
+    if any(city in skill_lower for city in city_patterns) and ('-' in skill_text or skill_text.startswith('-')):
+        return False
+    
+    # Exclude locations (common location indicators) - including with dashes
+    location_indicators = ['bengaluru', 'hyderabad', 'mumbai', 'delhi', 'bangalore', 'pune', 'chennai', 
+                          'kolkata', 'ahmedabad', 'jaipur', 'lucknow', 'kanpur', 'nagpur', 'indore',
+                          'thane', 'bhopal', 'visakhapatnam', 'patna', 'vadodara', 'ghaziabad',
+                          '-bengaluru', '-hyderabad', '-mumbai', '-delhi', '-bangalore', '-pune']
+    if skill_lower in location_indicators or any(loc in skill_lower for loc in ['-bengaluru', '-hyderabad', '-mumbai', '-delhi']):
+        return False
+    
+    # Exclude status words
+    status_words = ['present', 'remote', 'full-time', 'part-time', 'contract', 'internship', 
+                    '-present', '-remote', '-full', '-part', 'current', '-current']
+    if skill_lower in status_words or any(sw in skill_lower for sw in ['-present', '-remote']):
+        return False
+    
+    # Exclude month abbreviations
+    month_abbrevs = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+                     'jan.', 'feb.', 'mar.', 'apr.', 'may.', 'jun.', 'jul.', 'aug.', 'sep.', 'oct.', 'nov.', 'dec.']
+    if skill_lower in month_abbrevs or skill_lower.endswith('nov.') or skill_lower.startswith('nov.'):
+        return False
+    
+    # Exclude organization/institute names
+    org_keywords = ['national institute', 'institute of technology', 'university', 'college', 
+                   'national institute of', 'institute']
+    if any(org in skill_lower for org in org_keywords):
+        return False
+    
+    # Exclude company names (common companies)
+    company_names = ['microsoft', 'google', 'amazon', 'goldman', 'sachs', 'apple', 'meta', 'facebook',
+                    'netflix', 'uber', 'airbnb', 'tesla', 'nvidia', 'oracle', 'ibm', 'adobe']
+    if any(company in skill_lower for company in company_names):
+        return False
+    
+    # Exclude if it's mostly special characters
+    alnum_count = sum(1 for c in skill_text if c.isalnum())
+    if alnum_count < len(skill_text) * 0.6:  # At least 60% should be alphanumeric
+        return False
+    
+    # Exclude single character or very short non-meaningful words
+    if len(skill_text) < 3 and skill_lower not in ['ai', 'ui', 'ux', 'os', 'db', 'ml', 'dl', 'nlp', 'api']:
+        return False
+    
+    # Exclude if it contains only special characters and numbers
+    if not any(c.isalpha() for c in skill_text):
+        return False
+    
+    # Must contain at least one letter
+    if not re.search(r'[a-zA-Z]', skill_text):
+        return False
+    
+    return True
@@ -0,0 +1,31 @@
+from benchmarks import run
+
+
+def _allocate(size):
+    return lambda sample: bytearray(size)
+
+
+def test_peak_allocation_is_per_call_and_independent_of_earlier_runs():
+    retained = []
+    run.peak_allocation_mb(lambda sample: retained.append(bytearray(8 * 1024 * 1024)), [None, None])
+    assert 0.9 < run.peak_allocation_mb(_allocate(1024 * 1024), [None] * 3) < 1.5
+    assert run.peak_allocation_mb(_allocate(10), [None]) < 0.1
+
+
+def _results(**stats):
+    return {'meta': {'count': 10, 'seed': 0, 'repeat': 1, 'pipeline_versions': {}},
+            'benchmarks': {'parse': dict({'p50_ms': 10.0, 'p95_ms': 20.0, 'throughput_per_s': 100.0,
+                                          'peak_alloc_mb': 1.0}, **stats)}}
+
+
+def test_compare_flags_metrics_beyond_the_budget():
+    _, regressions = run.compare(_results(), _results(p50_ms=11.0, throughput_per_s=80.0), budget=0.15)
+    assert [(name, metric) for name, metric, _, _ in regressions] == [('parse', 'throughput_per_s')]
+
+
+def test_compare_skips_metrics_missing_from_an_older_baseline():
+    baseline = _results()
+    del baseline['benchmarks']['parse']['peak_alloc_mb']
+    lines, regressions = run.compare(baseline, _results(peak_alloc_mb=50.0))
+    assert regressions == []
+    assert not any('peak_alloc_mb' in line for line in lines)
@@ -0,0 +1,31 @@
+from modules import blob_store, storage
+
+
+def test_store_is_content_addressed(isolated_storage):
+    digest = blob_store.store_pdf('a.pdf', b'%PDF-1.4 a')
+    assert blob_store.store_pdf('copy.pdf', b'%PDF-1.4 a') == digest
+    assert blob_store.read_blob(digest) == b'%PDF-1.4 a'
+    assert blob_store.get_file_info(digest)[:3] == (digest, 'a.pdf', len(b'%PDF-1.4 a'))
+
+
+def test_get_files_info_matches_get_file_info(isolated_storage):
+    digests = [blob_store.store_pdf(f'{idx}.pdf', f'%PDF-1.4 {idx}'.encode()) for idx in range(3)]
+    info = blob_store.get_files_info(digests + ['0' * 64, digests[0]])
+    assert info == {digest: blob_store.get_file_info(digest) for digest in digests}
+
+
+def test_get_files_info_batches_long_lists(isolated_storage):
+    digest = blob_store.store_pdf('a.pdf', b'%PDF-1.4 a')
+    unknown = [f'{idx:064x}' for idx in range(1200)]
+    assert list(blob_store.get_files_info(unknown + [digest])) == [digest]
+    assert blob_store.get_files_info([]) == {}
+
+
+def test_unindexed_files_skip_indexed_resumes(isolated_storage):
+    digests = [blob_store.store_pdf(f'{idx}.pdf', f'%PDF-1.4 {idx}'.encode()) for idx in range(3)]
+    with storage.connection(blob_store.DB_PATH) as conn:
+        conn.execute('CREATE TABLE test_docs (resume_hash TEXT PRIMARY KEY)')
+        conn.execute('INSERT INTO test_docs VALUES (?)', (digests[0],))
+    assert blob_store.count_unindexed('test_docs', 'resume_hash') == 2
+    assert set(blob_store.unindexed_files('test_docs', 'resume_hash', 5)) == {(digests[1], '1.pdf'), (digests[2], '2.pdf')}
+    assert len(blob_store.unindexed_files('test_docs', 'resume_hash', 1)) == 1
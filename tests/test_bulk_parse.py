@@ -0,0 +1,35 @@
+import json
+
+import bulk_parse
+
+
+def _record(path):
+    return json.dumps({'path': path, 'result': {}}) + '\n'
+
+
+def test_missing_checkpoint_is_empty(tmp_path):
+    assert bulk_parse.load_checkpoint(str(tmp_path / 'out.jsonl')) == set()
+
+
+def test_torn_final_line_is_truncated(tmp_path):
+    output = tmp_path / 'out.jsonl'
+    output.write_text(_record('/a.pdf') + _record('/b.pdf') + '{"path": "/c.p')
+    assert bulk_parse.load_checkpoint(str(output)) == {'/a.pdf', '/b.pdf'}
+    assert output.read_text() == _record('/a.pdf') + _record('/b.pdf')
+
+
+def test_bad_middle_line_is_skipped_not_truncated(tmp_path, capsys):
+    output = tmp_path / 'out.jsonl'
+    content = _record('/a.pdf') + 'garbage\n' + '[1, 2]\n' + _record('/b.pdf') + _record('/c.pdf')
+    output.write_text(content)
+    assert bulk_parse.load_checkpoint(str(output)) == {'/a.pdf', '/b.pdf', '/c.pdf'}
+    assert output.read_text() == content
+    assert 'Skipped 2 unreadable line(s)' in capsys.readouterr().err
+
+
+def test_bad_middle_and_torn_final_line(tmp_path, capsys):
+    output = tmp_path / 'out.jsonl'
+    output.write_text(_record('/a.pdf') + 'garbage\n' + _record('/b.pdf') + '{"pa')
+    assert bulk_parse.load_checkpoint(str(output)) == {'/a.pdf', '/b.pdf'}
+    assert output.read_text() == _record('/a.pdf') + 'garbage\n' + _record('/b.pdf')
+    assert ': 2' in capsys.readouterr().err
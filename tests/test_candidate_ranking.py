@@ -0,0 +1,114 @@
+import contextlib
+import random
+import types
+
+import pytest
+
+from modules import candidate_ranking, skill_index, storage
+from modules.candidate_ranking import SkillMatrix
+
+VOCABULARY = [f'skill{n}' for n in range(37)]  # not a multiple of 8, so the last byte is partial
+
+
+def brute_force_rank(skill_sets, required, optional, k, require_all, required_weight=2.0, optional_weight=1.0):
+    required = list(dict.fromkeys(skill_index.normalize_skill(skill) for skill in required))
+    optional = [skill for skill in dict.fromkeys(map(skill_index.normalize_skill, optional)) if skill not in required]
+    scored = []
+    for key, skills in skill_sets.items():
+        skills = {skill_index.normalize_skill(skill) for skill in skills}
+        if require_all and not set(required) <= skills:
+            continue
+        score = (required_weight * sum(skill in skills for skill in required)
+                 + optional_weight * sum(skill in skills for skill in optional))
+        if score > 0:
+            scored.append((score, key))
+    scored.sort(key=lambda item: -item[0])
+    return scored[:k]
+
+
+def random_skill_sets(rng, count):
+    return {f'cand{n}': set(rng.sample(VOCABULARY, rng.randint(0, 12))) for n in range(count)}
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_rank_matches_brute_force(seed):
+    rng = random.Random(seed)
+    skill_sets = random_skill_sets(rng, rng.randint(1, 300))
+    matrix = SkillMatrix.from_skill_sets(skill_sets, skill_sets.values())
+    required = rng.sample(VOCABULARY, rng.randint(0, 4))
+    optional = rng.sample(VOCABULARY, rng.randint(0, 4))
+    k = rng.randint(1, 40)
+    require_all = bool(required) and rng.random() < 0.5
+
+    ranked = matrix.rank(required, optional, k=k, require_all=require_all)
+    expected = brute_force_rank(skill_sets, required, optional, k, require_all)
+
+    # Ties may be broken differently; the scores, in order, must agree exactly
+    assert [score for _, score, _ in ranked] == [score for score, _ in expected]
+    expected_scores = {key: score for score, key in brute_force_rank(skill_sets, required, optional, len(skill_sets),
+                                                                      require_all)}
+    for key, score, matched in ranked:
+        assert expected_scores[key] == score
+        candidate_skills = skill_sets[key]
+        assert set(matched) == candidate_skills & (set(required) | set(optional))
+
+
+def test_required_names_come_first_and_duplicates_count_once():
+    matrix = SkillMatrix.from_skill_sets(['a', 'b'], [{'Python', 'SQL'}, {'sql'}])
+    ranked = matrix.rank(['SQL', 'sql', 'python'], ['python', 'docker'])
+    assert ranked == [('a', 4.0, ['sql', 'python']), ('b', 2.0, ['sql'])]
+
+
+def test_require_all_with_an_unknown_skill_returns_nobody():
+    matrix = SkillMatrix.from_skill_sets(['a'], [{'python'}])
+    assert matrix.rank(['python', 'cobol'], require_all=True) == []
+    assert matrix.rank(['python', 'cobol']) == [('a', 2.0, ['python'])]
+
+
+def test_nothing_to_rank():
+    matrix = SkillMatrix.from_skill_sets([], [])
+    assert matrix.rank(['python']) == []
+    matrix = SkillMatrix.from_skill_sets(['a'], [{'python'}])
+    assert matrix.rank([]) == []
+    assert matrix.rank(['python'], k=0) == []
+
+
+def test_from_skill_index_matches_from_skill_sets(isolated_storage):
+    rng = random.Random(7)
+    skill_sets = random_skill_sets(rng, 60)
+    for key, skills in skill_sets.items():
+        skill_index.index_skills(key, skills, 'v1')
+    from_index = SkillMatrix.from_skill_index()
+    from_sets = SkillMatrix.from_skill_sets(skill_sets, skill_sets.values())
+
+    query = rng.sample(VOCABULARY, 3)
+    assert ({key: score for key, score, _ in from_index.rank(query, k=100)}
+            == {key: score for key, score, _ in from_sets.rank(query, k=100)})
+
+
+def test_from_skill_index_reads_one_snapshot(isolated_storage, monkeypatch):
+    skill_index.index_skills('early', ['python'], 'v1')
+
+    class WriterAfterFirstSelect:
+        """Connection proxy that indexes another resume once the skills table has been read"""
+
+        def __init__(self, conn):
+            self.conn = conn
+
+        def execute(self, sql, *args):
+            cursor = self.conn.execute(sql, *args)
+            if sql.startswith('SELECT id, name FROM skills'):
+                skill_index.index_skills('late', ['brand new skill', 'python'], 'v1')
+            return cursor
+
+    @contextlib.contextmanager
+    def connection(db_path):
+        with storage.connection(db_path) as conn:
+            yield WriterAfterFirstSelect(conn)
+
+    monkeypatch.setattr(candidate_ranking, 'storage', types.SimpleNamespace(connection=connection))
+    matrix = SkillMatrix.from_skill_index()
+    assert matrix.keys == ['early']
+    assert [key for key, _, _ in matrix.rank(['python'])] == ['early']
+    monkeypatch.setattr(candidate_ranking, 'storage', storage)
+    assert [key for key, _, _ in SkillMatrix.from_skill_index().rank(['python'])] == ['early', 'late']
@@ -0,0 +1,83 @@
+import pytest
+
+from contact_scanner import scan_contacts
+
+
+def test_email_wins_over_url_inside_it():
+    contact = scan_contacts('Jane Doe\njane.doe@github.com')
+    assert contact['email'] == 'jane.doe@github.com'
+    assert contact['github'] is None
+
+
+def test_linkedin_github_and_website():
+    contact = scan_contacts('Jane Doe\nhttps://www.linkedin.com/in/jane-doe | github.com/janedoe | '
+                            'https://janedoe.dev.')
+    assert contact['linkedin'] == 'https://www.linkedin.com/in/jane-doe'
+    assert contact['github'] == 'github.com/janedoe'
+    # Sentence punctuation is not part of the URL
+    assert contact['website'] == 'https://janedoe.dev'
+    assert contact['urls'] == ['https://janedoe.dev']
+
+
+@pytest.mark.parametrize('phone', [
+    '(512) 555-0199',
+    '555.123.4567',
+    '+1 512 555 0199',
+    '+91 98765 43210',
+    '+44 20 7946 0958',
+    '9876543210',
+])
+def test_phone_formats(phone):
+    assert scan_contacts(f'Jane Doe\nPhone: {phone} | jane@example.com')['phone'] == phone
+
+
+@pytest.mark.parametrize('text', ['ID 12345 since 2019', 'GPA 3.9, 2016-2020', 'Order 123456789',
+                                  '06.2018 08.2020', '01.06.2019 30.06.2021', 'Roll No 19 1234 5678'])
+def test_short_digit_runs_are_not_phones(text):
+    assert scan_contacts(text)['phone'] is None
+
+
+def test_runs_of_years_are_not_phones():
+    contact = scan_contacts('Name\nSkills\nWorked 2015 2016 2017 on stuff\nContact: 555-123-4567')
+    assert contact['phone'] == '555-123-4567'
+    assert scan_contacts('Jane\n2015-2016-2017-2018 | x')['phone'] is None
+
+
+def test_year_before_a_phone_is_not_part_of_it():
+    assert scan_contacts('Jane\nAt Acme since 2019 555 123 4567')['phone'] == '555 123 4567'
+
+
+def test_digits_in_urls_are_not_phones():
+    contact = scan_contacts('Jane\nhttps://example.com/u/5551234567 | 555-123-4567')
+    assert contact['phone'] == '555-123-4567'
+
+
+def test_labelled_location_wins():
+    contact = scan_contacts('Ravi\n+91 98765 43210\nLocation: Pune, Maharashtra | Bengaluru, India')
+    assert contact['location'] == 'Pune, Maharashtra'
+
+
+def test_location_on_the_contact_line_wins_over_the_first_one():
+    contact = scan_contacts('Hyderabad, India\nfoo | a@b.co | Mumbai, India')
+    assert contact['location'] == 'Mumbai, India'
+
+
+def test_first_location_is_the_fallback():
+    assert scan_contacts('Jane\nAustin, TX\nSeattle, WA')['location'] == 'Austin, TX'
+
+
+def test_body_is_scanned_only_for_missing_email_or_phone():
+    header = '\n'.join(f'line {n}' for n in range(15))
+    contact = scan_contacts(header + '\nemail: late@example.org\nPhone 555.123.4567\nBerlin, Germany')
+    assert contact['email'] == 'late@example.org'
+    assert contact['phone'] == '555.123.4567'
+    # Locations are only taken from the header
+    assert contact['location'] is None
+
+    contact = scan_contacts('Jane\njane@example.com | 555-123-4567\n' + header + '\nother@example.com')
+    assert contact['email'] == 'jane@example.com'
+
+
+def test_missing_fields_are_none():
+    assert scan_contacts('') == {'email': None, 'phone': None, 'linkedin': None, 'github': None,
+                                 'website': None, 'location': None, 'urls': []}
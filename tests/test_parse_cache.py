@@ -0,0 +1,62 @@
+import itertools
+
+import pytest
+
+import parse_cache
+from parse_cache import ParseCache, content_key
+
+
+@pytest.fixture
+def cache(isolated_storage, monkeypatch):
+    # A strictly increasing clock, so access order is unambiguous
+    clock = itertools.count(1)
+    monkeypatch.setattr(parse_cache.time, 'time', lambda: float(next(clock)))
+    return ParseCache(db_path=str(isolated_storage / 'cache.db'), max_entries=2)
+
+
+def test_key_depends_on_content_and_pipeline_version():
+    assert content_key(b'pdf', 'v1') == content_key(b'pdf', 'v1')
+    assert content_key(b'pdf', 'v1') != content_key(b'pdf', 'v2')
+    assert content_key(b'pdf', 'v1') != content_key(b'other', 'v1')
+
+
+def test_get_or_parse_parses_once_per_key(cache):
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return {'skills': ['Python']}
+
+    assert cache.get_or_parse(b'pdf', 'v1', parse) == {'skills': ['Python']}
+    assert cache.get_or_parse(b'pdf', 'v1', parse) == {'skills': ['Python']}
+    assert len(calls) == 1
+    # A new pipeline version is a new key
+    cache.get_or_parse(b'pdf', 'v2', parse)
+    assert len(calls) == 2
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1      # 'b' is now the least recently used
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.stats()['entries'] == 2
+    assert cache.stats()['evictions'] == 1
+
+
+def test_replacing_a_key_does_not_evict(cache):
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('a', 10)
+    assert cache.get('a') == 10 and cache.get('b') == 2
+    assert cache.stats()['evictions'] == 0
+
+
+def test_clear(cache):
+    cache.put('a', 1)
+    cache.clear()
+    assert cache.get('a') is None
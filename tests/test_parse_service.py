@@ -0,0 +1,86 @@
+import asyncio
+import base64
+import json
+
+import tornado.httpclient
+import tornado.httpserver
+from tornado.testing import bind_unused_port
+
+import parse_service
+
+
+class FakePool:
+    """In-process stand-in for ParsePool; PDFs starting with b'bad' fail to parse"""
+    workers, pending, max_pending = 1, 0, 4
+
+    def has_capacity(self, documents=1):
+        return documents <= self.max_pending
+
+    async def parse(self, pdf_bytes, profile):
+        if pdf_bytes.startswith(b'bad'):
+            raise RuntimeError('secret internal detail')
+        return {'size': len(pdf_bytes), 'profile': profile}, {'extract': 0.001}
+
+
+def fetch(path, body=b'', headers=None):
+    """Response of the service (over a FakePool) to one POST"""
+    async def request():
+        sock, port = bind_unused_port()
+        server = tornado.httpserver.HTTPServer(parse_service.make_app(FakePool()))
+        server.add_sockets([sock])
+        try:
+            return await tornado.httpclient.AsyncHTTPClient().fetch(
+                f'http://127.0.0.1:{port}{path}', method='POST', body=body, headers=headers, raise_error=False)
+        finally:
+            server.stop()
+
+    return asyncio.run(request())
+
+
+def post_json(path, payload):
+    body = payload if isinstance(payload, str) else json.dumps(payload)
+    return fetch(path, body=body, headers={'Content-Type': 'application/json'})
+
+
+def _encoded(pdf_bytes):
+    return base64.b64encode(pdf_bytes).decode()
+
+
+def test_parse_raw_and_base64_bodies():
+    response = fetch('/parse?profile=fast', body=b'%PDF', headers={'Content-Type': 'application/pdf'})
+    assert response.code == 200
+    assert json.loads(response.body) == {'size': 4, 'profile': 'fast'}
+    assert 'total;dur=' in response.headers['Server-Timing']
+    assert json.loads(post_json('/parse', {'pdf_base64': _encoded(b'%PDF-1')}).body)['size'] == 6
+
+
+def test_json_that_is_not_an_object_is_a_bad_request():
+    for body in ('[1, 2]', '"text"', '3', 'null'):
+        assert post_json('/parse', body).code == 400
+        assert post_json('/parse/batch', body).code == 400
+
+
+def test_batch_documents_must_be_objects():
+    assert post_json('/parse/batch', {'documents': ['abc']}).code == 400
+    assert post_json('/parse/batch', {'documents': []}).code == 400
+    assert post_json('/parse/batch', {'docs': []}).code == 400
+
+
+def test_parse_failure_keeps_the_exception_out_of_the_response():
+    response = fetch('/parse', body=b'bad pdf', headers={'Content-Type': 'application/pdf'})
+    assert response.code == 422
+    assert json.loads(response.body) == {'error': 'Could not parse resume'}
+
+
+def test_batch_reports_each_document():
+    documents = [{'name': 'a.pdf', 'pdf_base64': _encoded(b'%PDF')}, {'pdf_base64': _encoded(b'bad')}]
+    results = json.loads(post_json('/parse/batch', {'documents': documents}).body)['results']
+    assert results[0] == {'name': 'a.pdf', 'result': {'size': 4, 'profile': 'balanced'}}
+    assert results[1] == {'name': '1', 'error': 'Could not parse resume'}
+
+
+def test_unknown_profile_and_overload():
+    assert fetch('/parse?profile=turbo', body=b'%PDF').code == 400
+    response = post_json('/parse/batch', {'documents': [{'pdf_base64': _encoded(b'%PDF')}] * 5})
+    assert response.code == 503
+    assert response.headers['Retry-After'] == '1'
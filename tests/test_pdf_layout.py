@@ -0,0 +1,119 @@
+import fitz
+
+import pdf_layout
+from pdf_layout import LayoutLine, OTHER_SECTION
+
+LEFT_LINES = ["Python, SQL, Docker", "Kubernetes, AWS", "React, Node.js", "Tableau, Excel"]
+RIGHT_LINES = ["Software Engineer, Acme Corp", "Developed REST APIs and managed", "deployments across regions.",
+               "Led the migration to Kubernetes.", "Data Analyst, Foo Inc", "Built dashboards in Tableau."]
+
+
+def _pdf(draw):
+    doc = fitz.open()
+    page = doc.new_page()  # 595 x 842
+    draw(page)
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def _two_column(page):
+    page.insert_text((50, 60), "Jane Doe", fontsize=22, fontname='hebo')
+    page.insert_text((50, 85), "jane.doe@example.com | +1 512 555 0199 | Austin, TX | linkedin.com/in/janedoe", fontsize=10)
+    # Both columns start on the same row, so their lines interleave by y
+    page.insert_text((50, 130), "SKILLS", fontsize=13, fontname='hebo')
+    page.insert_text((300, 130), "EXPERIENCE", fontsize=13, fontname='hebo')
+    for idx, text in enumerate(LEFT_LINES):
+        page.insert_text((50, 148 + 14 * idx), text, fontsize=10)
+    for idx, text in enumerate(RIGHT_LINES):
+        page.insert_text((300, 148 + 14 * idx), text, fontsize=10)
+    page.insert_text((50, 220), "VOLUNTEERING", fontsize=13, fontname='hebo')
+    page.insert_text((50, 238), "Red Cross helper", fontsize=10)
+    page.insert_text((50, 300), "References are available on request from the candidate at any time.", fontsize=10)
+
+
+def _single_column(page):
+    page.insert_text((50, 60), "John Smith", fontsize=20, fontname='hebo')
+    page.insert_text((50, 100), "EXPERIENCE", fontsize=13, fontname='hebo')
+    rows = [("Software Engineer, Acme Corp", "2019 - 2023"), ("Data Analyst, Foo Inc", "2017 - 2019"),
+            ("Intern, Bar Labs", "2016"), ("Teaching Assistant, State University", "2015")]
+    for idx, (left, date) in enumerate(rows):
+        y = 118 + 14 * idx
+        page.insert_text((50, y), left, fontsize=10)
+        # Right-aligned dates sit in the right half of the page but are not a column
+        page.insert_text((480, y), date, fontsize=10)
+    page.insert_text((50, 190), "Built dashboards and maintained reporting pipelines for the sales team.", fontsize=10)
+
+
+def test_two_column_page_reads_left_column_before_right():
+    layout = pdf_layout.extract_layout(_pdf(_two_column))
+    texts = [line.text for line in layout.lines]
+    left = ["SKILLS"] + LEFT_LINES + ["VOLUNTEERING", "Red Cross helper"]
+    right = ["EXPERIENCE"] + RIGHT_LINES
+    assert texts == ["Jane Doe", "jane.doe@example.com | +1 512 555 0199 | Austin, TX | linkedin.com/in/janedoe"] + left + right + [
+        "References are available on request from the candidate at any time."]
+    columns = {line.text: line.column for line in layout.lines}
+    # Full-width lines cross the gutter
+    assert columns["jane.doe@example.com | +1 512 555 0199 | Austin, TX | linkedin.com/in/janedoe"] == 0
+    assert columns["References are available on request from the candidate at any time."] == 0
+    assert {columns[text] for text in left} == {1}
+    assert {columns[text] for text in right} == {2}
+
+
+def test_two_column_sections_do_not_mix():
+    layout = pdf_layout.extract_layout(_pdf(_two_column))
+    names = [name for _, _, name in layout.headings]
+    assert names == ['skills', OTHER_SECTION, 'experience']
+    _, skills_body, _ = layout.headings[0]
+    assert layout.text[skills_body:layout.headings[1][0]].split('\n')[1:-1] == LEFT_LINES
+
+
+def test_name_is_the_largest_header_line():
+    assert pdf_layout.extract_layout(_pdf(_two_column)).name == "Jane Doe"
+    assert pdf_layout.extract_layout(_pdf(_single_column)).name == "John Smith"
+
+
+def test_right_aligned_dates_stay_on_their_row():
+    layout = pdf_layout.extract_layout(_pdf(_single_column))
+    texts = [line.text for line in layout.lines]
+    assert "Software Engineer, Acme Corp 2019 - 2023" in texts
+    assert "Intern, Bar Labs 2016" in texts
+    assert {line.column for line in layout.lines} == {0}
+
+
+def test_offsets_index_the_joined_text():
+    layout = pdf_layout.extract_layout(_pdf(_two_column))
+    for line, offset in zip(layout.lines, layout.offsets):
+        assert layout.text[offset:offset + len(line.text)] == line.text
+
+
+def test_body_styled_lines_are_not_headings():
+    def draw(page):
+        page.insert_text((50, 60), "Skills", fontsize=10)
+        page.insert_text((50, 80), "Python, SQL", fontsize=10)
+        page.insert_text((50, 100), "Acme Corp", fontsize=10)
+
+    layout = pdf_layout.extract_layout(_pdf(draw))
+    assert [name for _, _, name in layout.headings] == ['skills']
+    assert layout.name is None
+
+
+def _line(text, x0, x1, y0):
+    return LayoutLine(text, 10.0, False, 0, 0, x0, y0, x1, y0 + 10)
+
+
+def test_find_gutter_between_columns():
+    lines = [_line("left column text", 50, 200, 100 + 15 * idx) for idx in range(6)]
+    lines += [_line("right column text here", 300, 540, 100 + 15 * idx) for idx in range(6)]
+    lines.append(_line("a full width header line across the page", 50, 540, 60))
+    assert pdf_layout._find_gutter(lines, 595) == 300
+
+
+def test_find_gutter_rejects_single_column_and_lopsided_pages():
+    single = [_line("body text across the page", 50, 540, 100 + 15 * idx) for idx in range(10)]
+    assert pdf_layout._find_gutter(single, 595) is None
+    # Right column too thin: only dates on the right
+    dated = [_line("Software Engineer, Acme Corp, Austin TX", 50, 300, 100 + 15 * idx) for idx in range(6)]
+    dated += [_line("2019", 480, 540, 100 + 15 * idx) for idx in range(6)]
+    assert pdf_layout._find_gutter(dated, 595) is None
@@ -0,0 +1,32 @@
+import io
+
+import fitz
+import pytest
+
+import pdf_text
+
+
+@pytest.fixture
+def pdf_bytes():
+    doc = fitz.open()
+    for page_num in range(3):
+        doc.new_page().insert_text((50, 60), f"Page {page_num}")
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def test_every_source_type_gives_the_same_text(pdf_bytes, tmp_path):
+    path = tmp_path / 'resume.pdf'
+    path.write_bytes(pdf_bytes)
+    uploaded = io.BytesIO(pdf_bytes)
+    uploaded.read(10)  # Streamlit reruns leave the read position wherever it was
+    texts = [pdf_text.extract_text(source)
+             for source in (pdf_bytes, bytearray(pdf_bytes), memoryview(pdf_bytes), str(path), path, uploaded)]
+    assert texts[0] == 'Page 0\nPage 1\nPage 2\n'
+    assert all(text == texts[0] for text in texts)
+
+
+def test_iter_page_text_reads_a_page_range(pdf_bytes):
+    assert list(pdf_text.iter_page_text(pdf_bytes, 1, 10)) == ['Page 1\n', 'Page 2\n']
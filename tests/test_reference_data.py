@@ -0,0 +1,70 @@
+import os
+
+import reference_data
+import resume_parser
+from reference_data import ReferenceDataRegistry
+
+
+def _write(path, text, mtime_ns):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_table_is_reloaded_when_the_file_changes(tmp_path):
+    table = tmp_path / 'skills.csv'
+    _write(table, 'python\n', 1_000_000_000)
+    loads = []
+    registry = ReferenceDataRegistry()
+    registry.register('skills', str(table), lambda path: loads.append(path) or open(path).read().split())
+
+    assert registry.get('skills') == ['python']
+    assert registry.get('skills') == ['python']
+    _write(table, 'python\nsql\n', 2_000_000_000)
+    assert registry.get('skills') == ['python', 'sql']
+    assert len(loads) == 2
+
+
+def test_fingerprint_follows_file_contents(tmp_path):
+    skills, majors = tmp_path / 'skills.csv', tmp_path / 'majors.csv'
+    _write(skills, 'python\n', 1_000_000_000)
+    _write(majors, 'physics\n', 1_000_000_000)
+    registry = ReferenceDataRegistry()
+    registry.register('skills', str(skills), str)
+    registry.register('skill_set', str(skills), str)
+    registry.register('majors', str(majors), str)
+    names = ('skills', 'skill_set', 'majors')
+
+    before = registry.fingerprint(names)
+    assert registry.fingerprint(names) == before
+    _write(majors, 'physics\nchemistry\n', 2_000_000_000)
+    edited = registry.fingerprint(names)
+    assert edited != before
+    # Touching a file without changing it keeps the fingerprint
+    os.utime(majors, ns=(3_000_000_000, 3_000_000_000))
+    assert registry.fingerprint(names) == edited
+
+
+def test_fingerprint_ignores_tables_it_is_not_asked_about(tmp_path):
+    skills, saved = tmp_path / 'skills.csv', tmp_path / 'saved.csv'
+    _write(skills, 'python\n', 1_000_000_000)
+    _write(saved, 'go\n', 1_000_000_000)
+    registry = ReferenceDataRegistry()
+    registry.register('skills', str(skills), str)
+    before = registry.fingerprint(['skills'])
+    # Registering or editing another table (e.g. on import of a page module) changes nothing
+    registry.register('saved', str(saved), str)
+    _write(saved, 'go\nrust\n', 2_000_000_000)
+    assert registry.fingerprint(['skills']) == before
+
+
+def test_pipeline_version_includes_the_reference_data(monkeypatch):
+    monkeypatch.setattr(reference_data, 'fingerprint', lambda names: 'before')
+    before = resume_parser.pipeline_version('fast')
+    monkeypatch.setattr(reference_data, 'fingerprint', lambda names: 'after')
+    assert resume_parser.pipeline_version('fast') != before
+
+
+def test_pipeline_version_does_not_depend_on_the_recruiter_tables():
+    before = resume_parser.pipeline_version('fast')
+    import modules.recruiters  # noqa: F401  registers the saved required skills table
+    assert resume_parser.pipeline_version('fast') == before
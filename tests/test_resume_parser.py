@@ -0,0 +1,74 @@
+import fitz
+import pytest
+
+import resume_parser
+from benchmarks.corpus import load_vocabularies
+
+
+def _skills_resume(skills):
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 60), "Jane Doe", fontsize=20, fontname='hebo')
+    page.insert_text((50, 100), "SKILLS", fontsize=13, fontname='hebo')
+    for idx in range(0, len(skills), 5):
+        page.insert_text((50, 118 + 12 * idx // 5), ", ".join(skills[idx:idx + 5]), fontsize=8)
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def test_parse_keeps_every_skill_for_the_index():
+    vocabulary = [skill for skill in load_vocabularies()[0]
+                  if resume_parser.is_valid_skill(skill) and skill.replace(' ', '').isalpha()]
+    skills = vocabulary[:resume_parser.SKILLS_TOP_N + 20]
+    result = resume_parser.parse_resume(_skills_resume(skills), profile='fast')
+
+    assert len(result['skills']) == resume_parser.SKILLS_TOP_N
+    assert result['skills'] == result['all_skills'][:resume_parser.SKILLS_TOP_N]
+    assert len(result['all_skills']) > resume_parser.SKILLS_TOP_N
+
+
+def test_default_profile_costs_what_an_unprofiled_analysis_does():
+    plain = resume_parser.ResumeAnalysis("Jane Doe")
+    default = resume_parser.analyze_resume_for("Jane Doe")
+    assert (default.profile, default.skills_model) == (plain.profile, plain.skills_model)
+    assert resume_parser.parsing_profile_settings('fast') == (None, False)
+
+
+def test_process_resume_text_takes_parsing_profiles():
+    analysis = resume_parser.process_resume_text("Jane Doe\nSkills\nPython, SQL", profile='fast')
+    assert (analysis.profile, analysis.skills_model) == (None, False)
+    assert analysis.doc is None
+    assert 'Python' in resume_parser.csv_skills(analysis)
+    with pytest.raises(ValueError):
+        resume_parser.process_resume_text("Jane Doe", profile='entities_tags')
+
+
+def test_parse_reuses_a_layout_the_caller_already_read(monkeypatch):
+    pdf_bytes = _skills_resume(['Python', 'Docker', 'Kubernetes'])
+    layout = resume_parser.pdf_layout.extract_layout(pdf_bytes)
+    expected = resume_parser.parse_resume(pdf_bytes, profile='fast')
+
+    def read_again(source):
+        raise AssertionError("the PDF was read a second time")
+
+    monkeypatch.setattr(resume_parser.pdf_layout, 'extract_layout', read_again)
+    assert resume_parser.parse_resume(pdf_bytes, profile='fast', layout=layout) == expected
+
+
+def test_languages_section_is_read_by_the_skills_extractors():
+    analysis = resume_parser.analyze_resume_for("Jane Doe\nExperience\nAcme Corp\nLanguages\nPython, Go", 'fast')
+    skills_text = analysis.section_text(resume_parser.SKILL_SECTIONS)
+    assert 'Python, Go' in skills_text
+    assert 'Acme' not in skills_text
+
+
+def test_experience_level_matches_surface_forms_in_every_profile():
+    text = "Jane Doe\nExperience\nManaged a team and developed services.\nLed the migration to the cloud."
+    levels = {profile: resume_parser.extract_experience(resume_parser.analyze_resume_for(text, profile))
+              ['level_of_experience'] for profile in resume_parser.PARSING_PROFILES}
+    # "managed", "developed" and "Led" are not the keywords themselves
+    assert set(levels.values()) == {'Entry Level'}
+    lead = resume_parser.analyze_resume_for("Experience\nlead and manage projects", 'fast')
+    assert resume_parser.extract_experience(lead)['level_of_experience'] == 'Senior'
@@ -0,0 +1,89 @@
+import section_segmenter
+from section_segmenter import find_headings, find_sections, header_end, section_spans
+
+RESUME = ("Jane Doe\njane@example.com\n"
+          "WORK EXPERIENCE\nEngineer at Acme, worked on skills matching\n"
+          "Technical Skills: Python, SQL\n"
+          "  • Education\nB.S. Computer Science\n")
+
+
+def _names(text):
+    return [name for _, _, name in find_headings(text)]
+
+
+def test_whole_line_headings_in_any_case():
+    assert _names("Summary\nfoo\nEXPERIENCE\nbar\n  education  \nbaz") == ['summary', 'experience', 'education']
+
+
+def test_longest_heading_wins():
+    text = "Work Experience\nAcme"
+    ((start, body_start, name),) = find_headings(text)
+    assert (start, body_start, name) == (0, len("Work Experience"), 'experience')
+
+
+def test_ampersand_and_spacing_variants():
+    assert _names("Awards & Achievements\nx\nHobbies  and   Interests\ny\nLicenses &\tCertifications") == [
+        'achievements', 'hobbies', 'certifications']
+
+
+def test_inline_heading_with_colon():
+    text = "Skills: Python, Docker"
+    ((start, body_start, name),) = find_headings(text)
+    assert name == 'skills'
+    assert text[body_start:].strip() == 'Python, Docker'
+
+
+def test_headings_inside_sentences_are_ignored():
+    assert _names("I gained experience in Python\nMy skills include SQL\nEducation is important") == []
+
+
+def test_bullet_and_decoration_before_heading():
+    assert _names("• Projects\n-- Skills --\n## Education") == ['projects', 'education']
+
+
+def test_find_sections_spans_run_to_the_next_heading():
+    sections = find_sections(RESUME)
+    assert [name for name, _, _, _ in sections] == ['experience', 'skills', 'education']
+    bodies = {name: RESUME[start:end].strip() for name, _, start, end in sections}
+    assert bodies == {'experience': 'Engineer at Acme, worked on skills matching',
+                      'skills': 'Python, SQL',
+                      'education': 'B.S. Computer Science'}
+    assert sections[0][1] == RESUME.index('WORK EXPERIENCE')
+
+
+def test_text_before_the_first_heading_is_not_a_section():
+    assert find_sections("Jane Doe\njane@example.com") == []
+    assert all(start >= RESUME.index('WORK') for _, start, _, _ in find_sections(RESUME))
+
+
+def test_precomputed_headings_are_used_as_given():
+    text = "Header\nCustom Heading\nbody text\nSkills\nPython"
+    custom = [(7, 21, 'other')] + find_headings(text)
+    sections = find_sections(text, custom)
+    assert [name for name, _, _, _ in sections] == ['other', 'skills']
+    assert text[sections[0][2]:sections[0][3]].strip() == 'body text'
+
+
+def test_section_spans_collects_repeated_sections():
+    text = "Skills\nPython\nExperience\nAcme\nSkills\nGo"
+    spans = section_spans(text)
+    assert [text[start:end].strip() for start, end in spans['skills']] == ['Python', 'Go']
+    assert len(spans['experience']) == 1
+
+
+def test_header_end_stops_at_first_heading():
+    assert header_end(RESUME, 1000) == RESUME.index('WORK EXPERIENCE')
+    assert header_end(RESUME, 1000, find_headings(RESUME)) == RESUME.index('WORK EXPERIENCE')
+
+
+def test_header_end_limit_extends_to_end_of_line():
+    text = "Jane Doe\nSoftware engineer in Austin\nmore text without headings"
+    assert header_end(text, 12) == text.index('\nmore')
+    assert header_end(text, 12, headings=[]) == text.index('\nmore')
+    assert header_end("short", 100) == len("short")
+
+
+def test_every_configured_heading_is_recognized():
+    for section, headings in section_segmenter.SECTION_HEADINGS.items():
+        for heading in headings:
+            assert _names(heading.title()) == [section], heading
@@ -0,0 +1,48 @@
+from skill_gazetteer import SkillGazetteer
+
+
+def test_matches_whole_words_only():
+    gazetteer = SkillGazetteer(['Java', 'Python', 'SQL'])
+    text = 'JavaScript and pythonic code, MySQL, Java and Python.'
+    assert gazetteer.find(text) == {'Java', 'Python'}
+
+
+def test_symbol_edges_need_no_boundary():
+    gazetteer = SkillGazetteer(['C++', 'C#', 'Node.js', 'Amazon Web Services (AWS)'])
+    text = 'Used C++, C#/.NET, Node.js and Amazon Web Services (AWS)x daily'
+    assert gazetteer.find(text) == {'C++', 'C#', 'Node.js', 'Amazon Web Services (AWS)'}
+
+
+def test_overlapping_and_nested_keywords_all_match():
+    gazetteer = SkillGazetteer(['machine learning', 'learning', 'deep learning', 'machine'])
+    matches = sorted(gazetteer.iter_matches('Deep learning and machine learning'))
+    assert matches == [
+        (0, 13, 'deep learning'),
+        (5, 13, 'learning'),
+        (18, 25, 'machine'),
+        (18, 34, 'machine learning'),
+        (26, 34, 'learning'),
+    ]
+
+
+def test_failure_links_find_keyword_after_partial_match():
+    # "data" fails partway through "database", then "base" must still be found via the failure link
+    gazetteer = SkillGazetteer(['database admin', 'base'])
+    assert gazetteer.find('database base') == {'base'}
+
+
+def test_count_is_case_insensitive_and_counts_every_occurrence():
+    gazetteer = SkillGazetteer(['Python', 'Docker'])
+    assert gazetteer.count('python, PYTHON and Python; docker') == {'python': 3, 'docker': 1}
+
+
+def test_case_variants_share_one_normalized_keyword():
+    gazetteer = SkillGazetteer(['React', 'react', 'REACT '])
+    assert len(gazetteer) == 1
+    assert sorted(gazetteer.originals('react')) == ['REACT', 'React', 'react']
+    assert gazetteer.find('react') == {'React', 'react', 'REACT'}
+
+
+def test_min_length_drops_short_keywords():
+    assert SkillGazetteer(['C', 'R', 'Go']).find('C R Go') == {'Go'}
+    assert SkillGazetteer(['C', 'R'], min_length=1).find('C and R') == {'C', 'R'}
@@ -0,0 +1,64 @@
+import pytest
+
+from modules import blob_store, skill_index, storage
+
+
+@pytest.fixture
+def index(isolated_storage):
+    skill_index.index_skills('r1', ['Python', 'SQL', 'Docker'], 'v1')
+    skill_index.index_skills('r2', ['python', 'Machine  Learning'], 'v1')
+    skill_index.index_skills('r3', ['SQL', 'Python', 'machine learning'], 'v1')
+    return skill_index
+
+
+def _postings(resume_hash):
+    with storage.connection(blob_store.DB_PATH) as conn:
+        return {row[0] for row in conn.execute(
+            'SELECT s.name FROM skill_postings p JOIN skills s ON s.id = p.skill_id WHERE p.resume_hash = ?',
+            (resume_hash,))}
+
+
+def test_normalize_skill():
+    assert skill_index.normalize_skill('  Machine\tLearning ') == 'machine learning'
+    assert skill_index.normalize_skill('C++') == 'c++'
+
+
+def test_find_candidates_intersects_postings(index):
+    assert index.find_candidates(['python']) == {'r1', 'r2', 'r3'}
+    assert index.find_candidates(['Python', 'sql']) == {'r1', 'r3'}
+    assert index.find_candidates(['PYTHON', 'machine learning', 'SQL']) == {'r3'}
+
+
+def test_unknown_or_empty_skills_match_nobody(index):
+    assert index.find_candidates(['python', 'cobol']) == set()
+    assert index.find_candidates(['', '  ']) == set()
+
+
+def test_match_candidates_maps_resumes_to_matched_skills(index):
+    assert index.match_candidates(['Docker', 'machine learning', 'rust']) == {
+        'r1': {'docker'}, 'r2': {'machine learning'}, 'r3': {'machine learning'}}
+
+
+def test_same_version_is_skipped_and_new_version_replaces_postings(index):
+    assert index.index_skills('r1', ['Rust'], 'v1') is False
+    assert _postings('r1') == {'python', 'sql', 'docker'}
+
+    assert index.index_skills('r1', ['Rust', 'sql'], 'v2') is True
+    assert _postings('r1') == {'rust', 'sql'}
+    assert index.find_candidates(['docker']) == set()
+    assert index.find_candidates(['sql']) == {'r1', 'r3'}
+
+
+def test_long_skill_lists_stay_under_the_parameter_limit(isolated_storage):
+    skills = [f'skill {n}' for n in range(1200)]
+    skill_index.index_skills('big', skills, 'v1')
+    assert len(_postings('big')) == 1200
+    assert skill_index.find_candidates(skills) == {'big'}
+
+
+def test_count_unindexed(isolated_storage):
+    digest = blob_store.store_pdf('a.pdf', b'%PDF-1.4 a')
+    blob_store.store_pdf('b.pdf', b'%PDF-1.4 b')
+    assert skill_index.count_unindexed() == 2
+    skill_index.index_skills(digest, ['python'], 'v1')
+    assert skill_index.count_unindexed() == 1
@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+import skill_matcher
+
+
+def test_required_skills_are_found_without_a_model():
+    doc = SimpleNamespace(text="Built services in Python and C++ on Node.js; machine learning pipelines.")
+    found = skill_matcher.extract_skills(doc, ['python', 'Machine Learning', 'c++', 'node.js', 'Java', ' '], None)
+    assert found == {'python', 'Machine Learning', 'c++', 'node.js'}
+
+
+def test_spellings_of_one_skill_are_all_reported():
+    doc = SimpleNamespace(text="Python developer")
+    assert skill_matcher.extract_skills(doc, ['Python', 'python '], None) == {'Python', 'python '}
+    assert skill_matcher.extract_skills(doc, [], None) == set()
+
+
+def test_gazetteer_is_cached_per_skill_set():
+    skills = frozenset({'python', 'sql'})
+    assert skill_matcher.get_skill_gazetteer(skills) is skill_matcher.get_skill_gazetteer(frozenset({'sql', 'python'}))
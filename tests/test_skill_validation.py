@@ -0,0 +1,58 @@
+import csv
+import os
+import random
+import string
+
+import pytest
+
+import resume_parser
+from tests import legacy_skill_validation
+
+EDGE_CASES = [
+    '', ' ', 'a', 'AI', ' ai ', 'ml', 'C', 'R', 'Go', 'C++', 'C#', '.NET', 'Node.js', 'nlp', 'api', 'NLP ',
+    'the', 'Learning', 'Machine Learning', 'linkedin learning', 'other skills', 'Technical Skills:',
+    'AWS Certificate', 'research consultant', 'software engineer', 'Data Labs', '-Bengaluru', 'Pune-',
+    'Hyderabad - India', 'present', '-present', 'Full-Time', 'Nov.', 'nov. 2021', 'Jan', '2019-2021', '2021-',
+    '123', '12', 'Python3', 'Python 3.10', 'web3', 'jane@example.com', 'example.com', 'Django.in',
+    'Google Cloud', 'IBM Watson', 'National Institute of Technology', 'St. Xavier College', '• Python',
+    '(AWS)', '@handle', '+91', 'Roushan Kumar', 'gmail', '***', 'a+b', 'C/C++', 'UI/UX', '   React   ',
+    'Amazon Web Services (AWS)', 'Rest-API', 'x-ray', 'ASP.NET Core', 'T-SQL', 'scikit-learn',
+]
+
+
+def _vocabulary():
+    with open(os.path.join(resume_parser.DATA_DIR, 'newSkills.csv'), newline='', encoding='utf-8') as csvfile:
+        return [row[0] for row in csv.reader(csvfile) if row]
+
+
+def _random_strings(count, seed=0):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + ' .-+#@()/•:'
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 14))) for _ in range(count)]
+
+
+def _phrases_from_vocabulary(vocabulary):
+    words = [word for skill in vocabulary for word in skill.split()]
+    return words + [skill.lower() for skill in vocabulary] + [f' {skill}-' for skill in vocabulary[:200]]
+
+
+@pytest.mark.parametrize('group', ['edge_cases', 'vocabulary', 'phrases', 'random'])
+def test_matches_the_legacy_rules(group):
+    vocabulary = _vocabulary()
+    inputs = {
+        'edge_cases': EDGE_CASES,
+        'vocabulary': vocabulary,
+        'phrases': _phrases_from_vocabulary(vocabulary),
+        'random': _random_strings(20000),
+    }[group]
+    mismatches = [text for text in inputs
+                  if resume_parser.is_valid_skill(text) != legacy_skill_validation.is_valid_skill(text)]
+    assert mismatches == []
+
+
+def test_memoized_result_does_not_depend_on_surrounding_whitespace():
+    assert resume_parser.is_valid_skill('  Docker ') is resume_parser.is_valid_skill('Docker') is True
+
+
+def test_validate_skills_keeps_order_and_drops_invalid():
+    assert resume_parser.validate_skills(['Python', 'the', 'Docker', '2021', 'AI']) == ['Python', 'Docker', 'AI']
@@ -0,0 +1,118 @@
+import sqlite3
+
+import pytest
+
+from modules import storage
+
+
+def _tables(conn):
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+@pytest.fixture
+def db_path(isolated_storage, monkeypatch):
+    monkeypatch.setattr(storage, '_migrations', {})
+    return str(isolated_storage / 'data' / 'test.db')
+
+
+def test_migrations_run_once_in_registration_order(db_path):
+    calls = []
+    storage.register_migration(db_path, 'create_a', 'CREATE TABLE a (id INTEGER PRIMARY KEY);')
+    storage.register_migration(db_path, 'fill_a', lambda conn: (calls.append('fill_a'),
+                                                                conn.execute('INSERT INTO a (id) VALUES (1)')))
+    storage.run_migrations(db_path)
+    storage.run_migrations(db_path)
+
+    with storage.connection(db_path) as conn:
+        assert conn.execute('SELECT id FROM a').fetchall() == [(1,)]
+        applied = [row[0] for row in conn.execute('SELECT name FROM schema_migrations ORDER BY rowid')]
+    assert applied == ['create_a', 'fill_a']
+    assert calls == ['fill_a']
+
+
+def test_duplicate_registration_is_ignored(db_path):
+    storage.register_migration(db_path, 'create_a', 'CREATE TABLE a (id INTEGER);')
+    storage.register_migration(db_path, 'create_a', 'CREATE TABLE b (id INTEGER);')
+    with storage.connection(db_path) as conn:
+        assert 'a' in _tables(conn) and 'b' not in _tables(conn)
+
+
+def test_migration_registered_later_is_applied(db_path):
+    storage.register_migration(db_path, 'create_a', 'CREATE TABLE a (id INTEGER);')
+    storage.run_migrations(db_path)
+    storage.register_migration(db_path, 'create_b', 'CREATE TABLE b (id INTEGER);')
+    with storage.connection(db_path) as conn:
+        assert {'a', 'b'} <= _tables(conn)
+
+
+def test_applied_migrations_are_not_rerun_on_a_new_process(db_path, monkeypatch):
+    storage.register_migration(db_path, 'create_a', 'CREATE TABLE a (id INTEGER);')
+    storage.run_migrations(db_path)
+    # A new process: nothing in memory says the database was migrated
+    storage.close_all()
+    monkeypatch.setattr(storage, '_pools', {})
+    monkeypatch.setattr(storage, '_migrated', set())
+    storage.run_migrations(db_path)
+    with storage.connection(db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM schema_migrations').fetchone()[0] == 1
+
+
+def test_failed_callable_migration_is_not_recorded(db_path):
+    def broken(conn):
+        conn.execute('INSERT INTO a (id) VALUES (1)')
+        raise RuntimeError('boom')
+
+    storage.register_migration(db_path, 'create_a', 'CREATE TABLE a (id INTEGER);')
+    storage.register_migration(db_path, 'broken', broken)
+    with pytest.raises(RuntimeError):
+        storage.run_migrations(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert [row[0] for row in conn.execute('SELECT name FROM schema_migrations')] == ['create_a']
+        assert conn.execute('SELECT COUNT(*) FROM a').fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def test_connection_commits_on_success_and_rolls_back_on_error(db_path):
+    storage.register_migration(db_path, 'create_a', 'CREATE TABLE a (id INTEGER);')
+    with storage.connection(db_path) as conn:
+        conn.execute('INSERT INTO a (id) VALUES (1)')
+    with pytest.raises(ValueError):
+        with storage.connection(db_path) as conn:
+            conn.execute('INSERT INTO a (id) VALUES (2)')
+            raise ValueError
+    with storage.connection(db_path) as conn:
+        assert conn.execute('SELECT id FROM a').fetchall() == [(1,)]
+
+
+def test_connections_are_reused_and_configured(db_path):
+    with storage.connection(db_path) as conn:
+        first = conn
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert conn.execute('PRAGMA busy_timeout').fetchone()[0] == storage.BUSY_TIMEOUT_MS
+    with storage.connection(db_path) as conn:
+        assert conn is first
+
+
+def test_nested_borrows_get_distinct_connections(db_path):
+    with storage.connection(db_path) as outer, storage.connection(db_path) as inner:
+        assert outer is not inner
+
+
+def test_pool_closes_connections_beyond_its_size(tmp_path):
+    pool = storage.ConnectionPool(str(tmp_path / 'pool.db'), size=1)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    with pytest.raises(sqlite3.ProgrammingError):
+        second.execute('SELECT 1')
+    assert pool.acquire() is first
+    pool.close()
+
+
+def test_chunked_keeps_order_and_bounds_size():
+    assert list(storage.chunked(range(5), size=2)) == [[0, 1], [2, 3], [4]]
+    assert list(storage.chunked([])) == []
+    assert [len(chunk) for chunk in storage.chunked(range(1001))] == [500, 500, 1]